@@ -2,6 +2,16 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 from properties.settings.cache_settings import *  # Redis Configuration and Cache settings
+from properties.settings.batch_settings import *  # Batch lookup settings
+from properties.settings.executor_settings import *  # Provider executor settings
+from properties.settings.single_flight_settings import *  # Request coalescing settings
+from properties.settings.logging_settings import *  # Request logging settings
+from properties.settings.deadline_settings import *  # Request deadline settings
+from properties.settings.provider_latency_settings import *  # Adaptive timeout and hedging settings
+from properties.settings.circuit_breaker_settings import *  # Provider circuit breaker settings
+from properties.settings.rate_limit_settings import *  # Provider rate limiting settings
+from properties.settings.property_store_settings import *  # Durable property store settings
+from properties.settings.metrics_settings import *  # Prometheus metrics settings
 
 # Load environment variables from .env file
 load_dotenv()
@@ -145,7 +155,7 @@ LOGGING = {
     "loggers": {
         "": {  # Root logger
             "handlers": ["console", "file"],
-            "level": "DEBUG",
+            "level": os.getenv("LOG_LEVEL", "DEBUG"),
         },
     },
 }
@@ -0,0 +1,85 @@
+"""
+Compare the cache value codecs on representative property payloads.
+
+Reports the stored size and the encode/decode time of every codec and
+compression available in this environment, for a single provider entry, a
+combined entry that references its provider entries, and a combined entry
+that inlines them (how entries were stored before references).
+
+Usage:
+    python benchmarks/bench_codecs.py [--iterations N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from properties.services.cache_codecs import CODECS, COMPRESSORS, CacheValueCodec  # noqa: E402
+
+
+def provider_record(number):
+    return {
+        "square_footage": 2150 + number,
+        "lot_size_acres": 0.25,
+        "year_built": 1987,
+        "property_type": "Single Family Residential",
+        "bedrooms": 4,
+        "bathrooms": 2.5,
+        "room_count": 9,
+        "septic_system": "No",
+        "sale_price": 485000,
+        "sale_price_formatted": "$485,000",
+        "provider": f"Provider {number}",
+        "cached": False,
+        "stale": False,
+    }
+
+
+def payloads():
+    fresh_until = time.time() + 86400
+    records = [provider_record(1), provider_record(2)]
+    return {
+        "provider entry": {"fresh_until": fresh_until, "data": records[0]},
+        "combined (refs)": {
+            "fresh_until": fresh_until,
+            "data": [{"$ref": "provider1"}, {"$ref": "provider2"}],
+        },
+        "combined (inline)": {"fresh_until": fresh_until, "data": records},
+    }
+
+
+def timed(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'payload':<18} {'codec':<8} {'compression':<11} {'bytes':>6} {'encode us':>10} {'decode us':>10}")
+    for name, value in payloads().items():
+        for codec in CODECS:
+            for compression in COMPRESSORS:
+                # A zero threshold compresses every payload that benefits from it
+                value_codec = CacheValueCodec(codec, compression, compression_threshold=0)
+                encoded = value_codec.encode(value)
+                encode_us = timed(lambda: value_codec.encode(value), args.iterations)
+                decode_us = timed(lambda: CacheValueCodec.decode(encoded), args.iterations)
+                print(
+                    f"{name:<18} {codec:<8} {compression:<11} {len(encoded):>6} "
+                    f"{encode_us:>10.2f} {decode_us:>10.2f}"
+                )
+
+    missing = sorted({"orjson", "msgpack"} - set(CODECS)) + sorted({"zstd", "lz4"} - set(COMPRESSORS))
+    if missing:
+        print(f"\nNot installed, skipped: {', '.join(missing)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Simulate hedged provider calls against providers with a heavy latency tail.
+
+Every simulated provider answers in about 20ms, but a few percent of its
+calls stall for much longer (a GC pause, a cold cache, a slow replica).
+Lookups go through ``PropertyDetailsView._fetch_provider_data`` with the
+shared provider executor, first with hedging disabled and then enabled,
+and report the lookup latency percentiles and the extra provider calls.
+
+Usage:
+    DJANGO_SECRET_KEY=x python benchmarks/bench_hedging.py [--iterations N] [--stall-rate R]
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from properties.config.providers import PROVIDER_CONFIGS  # noqa: E402
+from properties.services.provider_clients import provider_clients  # noqa: E402
+from properties.services.provider_latency import provider_latency  # noqa: E402
+from properties.utils.deadline import Deadline  # noqa: E402
+from properties.views import PropertyDetailsView  # noqa: E402
+
+
+class SimulatedProvider:
+    """Provider answering in ~20ms, stalling on ``stall_rate`` of its calls."""
+
+    def __init__(self, provider_name, stall_rate, stall_seconds, seed):
+        self.provider_name = provider_name
+        self.stall_rate = stall_rate
+        self.stall_seconds = stall_seconds
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.calls = 0
+
+    def get_property_details(self, address, priority=None, probe=None):
+        with self.lock:
+            self.calls += 1
+            latency = self.random.lognormvariate(-3.9, 0.25)  # median ~20ms
+            if self.random.random() < self.stall_rate:
+                latency += self.stall_seconds
+        time.sleep(latency)
+        provider_latency.observe(self.provider_name, latency)
+        return {"data": {"squareFootage": 2000}}
+
+
+def percentile(samples, percent):
+    ordered = sorted(samples)
+    return ordered[min(int(percent / 100 * len(ordered)), len(ordered) - 1)]
+
+
+def run(iterations, hedging, stall_rate, stall_seconds):
+    settings.HEDGING_ENABLED = hedging
+    provider_latency.clear()
+    services = {
+        provider_name: SimulatedProvider(provider_name, stall_rate, stall_seconds, seed)
+        for seed, provider_name in enumerate(PROVIDER_CONFIGS)
+    }
+    view = PropertyDetailsView()
+
+    with mock.patch.object(provider_clients, "get_service", side_effect=services.__getitem__):
+        # Warm the latency windows so timeouts and hedge delays are adaptive
+        for _ in range(settings.PROVIDER_LATENCY_MIN_SAMPLES):
+            view._fetch_provider_data("1 Warm Up St", {}, Deadline(10))
+        for service in services.values():
+            service.calls = 0
+
+        latencies = []
+        for index in range(iterations):
+            started = time.perf_counter()
+            view._fetch_provider_data(f"{index} Main St", {}, Deadline(10))
+            latencies.append(time.perf_counter() - started)
+
+    calls = sum(service.calls for service in services.values())
+    extra = calls / (iterations * len(services)) - 1
+    return latencies, extra
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--stall-rate", type=float, default=0.03)
+    parser.add_argument("--stall-seconds", type=float, default=0.5)
+    args = parser.parse_args()
+
+    print(f"{'hedging':<8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'extra calls':>12}")
+    for hedging in (False, True):
+        latencies, extra = run(args.iterations, hedging, args.stall_rate, args.stall_seconds)
+        print(
+            f"{'on' if hedging else 'off':<8} "
+            f"{percentile(latencies, 50) * 1000:>8.1f} {percentile(latencies, 95) * 1000:>8.1f} "
+            f"{percentile(latencies, 99) * 1000:>8.1f} {max(latencies) * 1000:>8.1f} "
+            f"{extra:>11.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Measure the cost of request logging on the property details miss path.
+
+Runs the provider result processing of PropertyDetailsView with logging at
+INFO, as deployed, once with the per-provider logging the view used to emit
+(eager ``json.dumps(..., indent=2)`` inside f-strings, several INFO lines
+per provider) and once with the per-request summary. Provider payloads carry
+a sale history of ``--history`` entries, since the old overhead grew with it.
+
+Usage:
+    DJANGO_SECRET_KEY=x python benchmarks/bench_logging.py [--iterations N] [--history N ...]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import timeit
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from properties.utils import request_log  # noqa: E402
+from properties.views import PropertyDetailsView  # noqa: E402
+
+logger = logging.getLogger("properties.views")
+RESPONSE = SimpleNamespace(status_code=200)
+
+
+def provider_results(history):
+    sales = [
+        {"date": f"20{index % 25:02d}-06-01", "price": 250000 + index * 1000, "buyer": "Jane Doe"}
+        for index in range(history)
+    ]
+    return {
+        "provider1": {
+            "data": {
+                "squareFootage": 2150,
+                "lotSizeSqFt": 10890,
+                "yearBuilt": 1987,
+                "propertyType": "Single Family",
+                "bedrooms": 4,
+                "bathrooms": 2.5,
+                "features": {"roomCount": 9, "septicSystem": False},
+                "lastSalePrice": 485000,
+                "saleHistory": sales,
+            }
+        },
+        "provider2": {
+            "data": {
+                "SquareFootage": 2150,
+                "LotSizeAcres": 0.25,
+                "YearConstructed": 1987,
+                "PropertyType": "Single Family",
+                "Bedrooms": 4,
+                "Bathrooms": 2.5,
+                "RoomCount": 9,
+                "SepticSystem": "No",
+                "SalePrice": 485000,
+                "SaleHistory": sales,
+            }
+        },
+    }
+
+
+def eager_logging(view, address, results):
+    """Processing with the logging calls the view made before the summary."""
+    logger.info(f"Starting data fetch from {len(results)} providers for address: {address}")
+    for provider_name, result in results.items():
+        logger.info(f"Processing provider: {provider_name}")
+        logger.info(f"Submitting request to {provider_name}")
+        logger.info(f"Waiting for response from {provider_name} (timeout: 30s)")
+        logger.info(f"Received response from {provider_name}")
+        logger.debug(f"Raw response from {provider_name}: {json.dumps(result, indent=2)}")
+    logger.info(f"Completed data fetch from all providers for address: {address}")
+    for provider_name, result in results.items():
+        logger.debug(f"Raw result from {provider_name}: {json.dumps(result, indent=2)}")
+        logger.info(f"Processing data from provider: {provider_name}")
+
+    standardized_data, _ = view._standardize_provider_results(results)
+
+    logger.info(f"Total providers processed: {len(standardized_data)}")
+    for item in standardized_data:
+        logger.info(f"Final data from provider {item.get('provider')}: {json.dumps(item, indent=2)}")
+    return standardized_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--history", type=int, nargs="+", default=[0, 10, 100])
+    args = parser.parse_args()
+
+    # Log at INFO to a handler that formats every record, as a deployment would
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    devnull = open(os.devnull, "w")
+    root.addHandler(logging.StreamHandler(devnull))
+    root.setLevel(logging.INFO)
+
+    view = PropertyDetailsView()
+    address = "123 Main St, Springfield, IL 62704"
+
+    @request_log.logged_request("bench")
+    def summary_logging(results):
+        for provider_name in results:
+            request_log.record_provider(provider_name, "ok")
+        request_log.record(address=address, cache="miss")
+        view._standardize_provider_results(results)
+        return RESPONSE
+
+    print(f"{'history':>8} {'before us':>10} {'after us':>10} {'speedup':>8}")
+    for history in args.history:
+        results = provider_results(history)
+        before = timeit.timeit(
+            lambda: eager_logging(view, address, results), number=args.iterations
+        ) / args.iterations
+        after = timeit.timeit(
+            lambda: summary_logging(results), number=args.iterations
+        ) / args.iterations
+        print(f"{history:>8} {before * 1e6:>10.1f} {after * 1e6:>10.1f} {before / after:>7.1f}x")
+    devnull.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compare the compiled provider mapping extractors with the interpreted loop.
+
+Both paths run over the same representative raw payloads of every
+configured provider; the full ``standardize_data`` call is timed as well.
+
+Usage:
+    python benchmarks/bench_mappings.py [--iterations N]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from properties.config.providers import PROVIDER_CONFIGS  # noqa: E402
+from properties.utils.data_procesor import DataProcessor  # noqa: E402
+
+PAYLOADS = {
+    "provider1": {
+        "squareFootage": 2150,
+        "lotSizeSqFt": 10890,
+        "yearBuilt": 1987,
+        "propertyType": "Single Family",
+        "bedrooms": 4,
+        "bathrooms": 2.5,
+        "features": {"roomCount": 9, "septicSystem": False},
+        "lastSalePrice": 485000,
+    },
+    "provider2": {
+        "SquareFootage": 2150,
+        "LotSizeAcres": 0.25,
+        "YearConstructed": 1987,
+        "PropertyType": "Single Family",
+        "Bedrooms": 4,
+        "Bathrooms": 2.5,
+        "RoomCount": 9,
+        "SepticSystem": False,
+        "SalePrice": 485000,
+    },
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200000)
+    args = parser.parse_args()
+
+    DataProcessor.compile_mappings(PROVIDER_CONFIGS)
+    print(f"{'provider':<10} {'step':<20} {'interpreted us':>15} {'compiled us':>12} {'speedup':>8}")
+    for provider_name, payload in PAYLOADS.items():
+        mapping = PROVIDER_CONFIGS[provider_name]["mapping"]
+        extractor = DataProcessor.get_extractor(mapping, provider_name)
+        assert extractor(payload) == DataProcessor._extract_fields(payload, mapping, provider_name)
+
+        interpreted = timeit.timeit(
+            lambda: DataProcessor._extract_fields(payload, mapping, provider_name),
+            number=args.iterations,
+        )
+        compiled = timeit.timeit(lambda: extractor(payload), number=args.iterations)
+        print(
+            f"{provider_name:<10} {'extract fields':<20} {interpreted / args.iterations * 1e6:>15.2f} "
+            f"{compiled / args.iterations * 1e6:>12.2f} {interpreted / compiled:>7.1f}x"
+        )
+
+        raw = {"data": payload}
+        standardize = timeit.timeit(
+            lambda: DataProcessor.standardize_data(raw, mapping, provider_name),
+            number=args.iterations,
+        )
+        print(
+            f"{provider_name:<10} {'standardize_data':<20} {'':>15} "
+            f"{standardize / args.iterations * 1e6:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""
+Measure the property details request path end to end, offline.
+
+Requests go through ``PropertyDetailsView`` (without the middleware) with
+in-process stub providers of configurable latency and error rate, and an
+in-memory fake Redis (or a local Redis with ``--redis local``). Reports:
+
+- latency percentiles of fresh hits (cached response body), entry hits
+  (provider entries only, serialized per request) and misses
+- throughput and latency of a mixed workload at each ``--concurrency``
+- memory allocated per hit and per miss, traced with ``tracemalloc``
+
+Results are written as JSON with ``--output``. ``--baseline`` compares the
+run with an earlier one, and ``--max-regression`` fails the run when a
+latency, throughput or allocation metric regressed by more than that share.
+
+Usage:
+    DJANGO_SECRET_KEY=x python benchmarks/bench_request_path.py [--iterations N]
+        [--concurrency N ...] [--latency-ms MS] [--error-rate R]
+        [--output results.json] [--baseline baseline.json [--max-regression 0.1]]
+"""
+import argparse
+import contextlib
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+from benchmarks.stubs import FakeRedis, StubProvider  # noqa: E402
+from properties.config.providers import PROVIDER_CONFIGS  # noqa: E402
+from properties.services.cache_service import CacheService, get_redis_client  # noqa: E402
+from properties.services.provider_clients import provider_clients  # noqa: E402
+from properties.services.provider_latency import provider_latency  # noqa: E402
+from properties.views import PropertyDetailsView  # noqa: E402
+
+# Modules holding their own reference to ``get_redis_client``
+REDIS_CLIENT_MODULES = [
+    "properties.services.cache_service",
+    "properties.services.circuit_breaker",
+    "properties.services.rate_limiter",
+]
+
+# Metrics compared against the baseline, by name suffix: +1 if higher is better
+METRIC_DIRECTIONS = {"_ms": -1, "_kib": -1, "rps": 1}
+
+
+def percentile(samples, percent):
+    ordered = sorted(samples)
+    return ordered[min(int(percent / 100 * len(ordered)), len(ordered) - 1)]
+
+
+def latency_summary(latencies):
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p90_ms": round(percentile(latencies, 90) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+    }
+
+
+class Client:
+    """Calls ``PropertyDetailsView`` as the URL conf would, rendering the response."""
+
+    def __init__(self):
+        self.factory = APIRequestFactory()
+        self.view = PropertyDetailsView.as_view()
+
+    def get(self, address):
+        response = self.view(self.factory.get("/properties/", {"address": address}))
+        if hasattr(response, "render"):
+            response.render()
+        return response.status_code
+
+    def timed_get(self, address):
+        started = time.perf_counter()
+        status_code = self.get(address)
+        return time.perf_counter() - started, status_code
+
+
+def drop_response_bodies(addresses):
+    """Delete the cached response bodies so lookups serialize the entries."""
+    cache_service = CacheService()
+    cache_service.redis.delete(*(cache_service.get_response_key(address) for address in addresses))
+
+
+def measure_latency(client, addresses):
+    return latency_summary([client.timed_get(address)[0] for address in addresses])
+
+
+def measure_throughput(client, addresses, concurrency):
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        started = time.perf_counter()
+        samples = list(executor.map(client.timed_get, addresses))
+        elapsed = time.perf_counter() - started
+    summary = latency_summary([latency for latency, _ in samples])
+    summary["rps"] = round(len(samples) / elapsed, 1)
+    summary["errors"] = sum(1 for _, status_code in samples if status_code != 200)
+    return summary
+
+
+def measure_allocations(client, addresses):
+    """
+    Peak memory allocated while serving each request, above what was in use
+    before it, and memory still held after it.
+    """
+    peaks = []
+    retained = []
+    tracemalloc.start()
+    try:
+        for address in addresses:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            client.get(address)
+            after, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            retained.append(after - before)
+    finally:
+        tracemalloc.stop()
+    return {
+        "requests": len(addresses),
+        "peak_kib": round(sum(peaks) / len(peaks) / 1024, 1),
+        "retained_bytes": round(sum(retained) / len(retained)),
+    }
+
+
+def run(args):
+    run_id = uuid.uuid4().hex[:8]  # keeps a local Redis' earlier entries out of the way
+    rng = random.Random(args.seed)
+    client = Client()
+
+    def misses(label, count):
+        return [f"{index} {label} St {run_id}" for index in range(count)]
+
+    warm = misses("Warm", args.addresses)
+    results = {}
+
+    # Fill the latency windows and the cache the hit paths read
+    for address in misses("Warm Up", settings.PROVIDER_LATENCY_MIN_SAMPLES) + warm:
+        client.get(address)
+
+    results["hit"] = measure_latency(client, [rng.choice(warm) for _ in range(args.iterations)])
+    results["miss"] = measure_latency(client, misses("Miss", args.iterations))
+    drop_response_bodies(warm)
+    results["entry_hit"] = measure_latency(
+        client, [rng.choice(warm) for _ in range(args.iterations)]
+    )
+
+    results["throughput"] = {}
+    for concurrency in args.concurrency:
+        unique = iter(misses(f"Load {concurrency}", args.iterations))
+        workload = [
+            rng.choice(warm) if rng.random() < args.hit_ratio else next(unique)
+            for _ in range(args.iterations)
+        ]
+        results["throughput"][f"c{concurrency}"] = measure_throughput(client, workload, concurrency)
+
+    results["allocations"] = {
+        "entry_hit": measure_allocations(
+            client, [rng.choice(warm) for _ in range(args.alloc_iterations)]
+        ),
+        "miss": measure_allocations(client, misses("Traced", args.alloc_iterations)),
+    }
+    client.get(warm[0])  # caches its response body again
+    results["allocations"]["hit"] = measure_allocations(
+        client, [warm[0]] * args.alloc_iterations
+    )
+    return results
+
+
+@contextlib.contextmanager
+def environment(args):
+    """Stub providers and, unless ``--redis local``, a fake Redis."""
+    settings.RATE_LIMIT_ENABLED = False
+    settings.PROPERTY_STORE_ENABLED = False
+    provider_latency.clear()
+    services = {
+        provider_name: StubProvider(
+            provider_name,
+            latency_ms=args.latency_ms,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            seed=args.seed + index,
+        )
+        for index, provider_name in enumerate(PROVIDER_CONFIGS)
+    }
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(
+            mock.patch.object(provider_clients, "get_service", side_effect=services.__getitem__)
+        )
+        if args.redis == "fake":
+            redis_client = FakeRedis(latency_ms=args.redis_latency_ms)
+            for module in REDIS_CLIENT_MODULES:
+                stack.enter_context(
+                    mock.patch(f"{module}.get_redis_client", return_value=redis_client)
+                )
+        else:
+            get_redis_client().ping()
+        yield
+
+
+def flatten(results, prefix=""):
+    metrics = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            metrics.update(flatten(value, f"{prefix}{key}."))
+        else:
+            metrics[f"{prefix}{key}"] = value
+    return metrics
+
+
+def direction(metric):
+    for suffix, sign in METRIC_DIRECTIONS.items():
+        if metric.endswith(suffix):
+            return sign
+    return 0
+
+
+def compare(report, baseline, max_regression):
+    """
+    Print every metric next to its baseline value.
+
+    Returns:
+        list: Metrics that regressed by more than ``max_regression``
+    """
+    if baseline["config"] != report["config"]:
+        print("Warning: the baseline was run with a different configuration")
+    current = flatten(report["results"])
+    previous = flatten(baseline["results"])
+    regressions = []
+    print(f"\n{'metric':<36} {'baseline':>10} {'current':>10} {'change':>8}")
+    for metric, value in current.items():
+        old = previous.get(metric)
+        sign = direction(metric)
+        if not old or not (sign or metric.endswith("errors")):
+            continue
+        change = value / old - 1
+        flag = ""
+        if sign and max_regression is not None and -sign * change > max_regression:
+            flag = " regressed"
+            regressions.append(metric)
+        print(f"{metric:<36} {old:>10} {value:>10} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def print_results(results):
+    print(f"{'path':<16} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'mean ms':>8} {'req/s':>8} {'errors':>7}")
+    rows = [(path, results[path]) for path in ("hit", "entry_hit", "miss")]
+    rows += [(f"mixed {level}", summary) for level, summary in results["throughput"].items()]
+    for label, summary in rows:
+        print(
+            f"{label:<16} {summary['p50_ms']:>8.2f} {summary['p90_ms']:>8.2f} "
+            f"{summary['p99_ms']:>8.2f} {summary['mean_ms']:>8.2f} "
+            f"{summary.get('rps', ''):>8} {summary.get('errors', ''):>7}"
+        )
+    print(f"\n{'allocations':<16} {'peak KiB':>9} {'retained B':>11}")
+    for path, summary in results["allocations"].items():
+        print(f"{path:<16} {summary['peak_kib']:>9.1f} {summary['retained_bytes']:>11}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=500, help="Requests per measurement")
+    parser.add_argument("--alloc-iterations", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--addresses", type=int, default=100, help="Cached addresses hits draw from")
+    parser.add_argument("--hit-ratio", type=float, default=0.8, help="Hits in the mixed workload")
+    parser.add_argument("--latency-ms", type=float, default=20, help="Median provider latency")
+    parser.add_argument("--jitter", type=float, default=0.25, help="Sigma of the lognormal latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Provider calls failing")
+    parser.add_argument("--redis", choices=["fake", "local"], default="fake")
+    parser.add_argument("--redis-latency-ms", type=float, default=0, help="Fake Redis round-trip")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare with")
+    parser.add_argument("--max-regression", type=float, help="e.g. 0.1 fails on 10%% regressions")
+    args = parser.parse_args()
+
+    # Logging has its own benchmark, and must not write to the log file here
+    logging.disable(logging.CRITICAL)
+
+    with environment(args):
+        results = run(args)
+
+    config = {
+        key: value
+        for key, value in vars(args).items()
+        if key not in ("output", "baseline", "max_regression")
+    }
+    report = {
+        "benchmark": "request_path",
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": config,
+        "results": results,
+    }
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare(report, json.load(file), args.max_regression)
+        if regressions:
+            print(f"\n{len(regressions)} metrics regressed by more than {args.max_regression:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Compare the lean property details serializer with PropertyDetailsSerializer.
+
+Times validating one standardized provider record (miss path) and
+representing a two-provider cached response (hit path).
+
+Usage:
+    DJANGO_SECRET_KEY=x python benchmarks/bench_serializer.py [--iterations N]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from properties.serializers.lean_serializer import property_details_serializer  # noqa: E402
+from properties.serializers.properties_serializer import PropertyDetailsSerializer  # noqa: E402
+
+RECORD = {
+    "square_footage": 2150,
+    "lot_size_acres": 0.25,
+    "year_built": 1987,
+    "property_type": "Single Family",
+    "bedrooms": 4,
+    "bathrooms": 2.5,
+    "room_count": 9,
+    "septic_system": "No",
+    "sale_price": 485000,
+    "sale_price_formatted": "$485,000",
+    "provider": "Provider 1",
+    "cached": False,
+}
+RESPONSE = [dict(RECORD, cached=True), dict(RECORD, provider="Provider 2", cached=True)]
+
+
+def drf_validate():
+    serializer = PropertyDetailsSerializer(data=RECORD)
+    serializer.is_valid()
+    return serializer.validated_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    cases = [
+        (
+            "validate record",
+            drf_validate,
+            lambda: property_details_serializer.validate(RECORD),
+        ),
+        (
+            "represent response",
+            lambda: PropertyDetailsSerializer(RESPONSE, many=True).data,
+            lambda: property_details_serializer.to_representation_many(RESPONSE),
+        ),
+    ]
+    print(f"{'step':<20} {'DRF us':>8} {'lean us':>8} {'speedup':>8} {'lean ops/s':>11}")
+    for name, drf, lean in cases:
+        drf_time = timeit.timeit(drf, number=args.iterations) / args.iterations
+        lean_time = timeit.timeit(lean, number=args.iterations) / args.iterations
+        print(
+            f"{name:<20} {drf_time * 1e6:>8.2f} {lean_time * 1e6:>8.2f} "
+            f"{drf_time / lean_time:>7.1f}x {1 / lean_time:>11.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
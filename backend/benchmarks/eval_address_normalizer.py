@@ -0,0 +1,97 @@
+"""
+Measure how much cache duplication the address normalizer removes.
+
+Reads an address log (one address per line, as requested by clients) and
+compares the number of distinct cache entries produced by the previous
+normalization (lowercase and collapse whitespace) with the canonical form
+used by the cache keys. Without a log, a synthetic one is generated from a
+few base addresses spelled the ways clients typically spell them.
+
+Usage:
+    python benchmarks/eval_address_normalizer.py [address_log.txt]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from properties.utils.address_normalizer import normalize_address  # noqa: E402
+
+BASE_ADDRESSES = [
+    ("{n} {d} Main {s}", "Boston", "MA", "02118"),
+    ("{n} Elm {s}", "Springfield", "IL", "62704"),
+    ("{n} {d} First {s}", "Seattle", "WA", "98101"),
+    ("{n} Oak {s}", "Austin", "TX", "73301"),
+    ("{n} Washington {s}", "Denver", "CO", "80202"),
+]
+DIRECTION_SPELLINGS = [("North", "N", "N."), ("South", "S", "S."), ("West", "W", "W.")]
+SUFFIX_SPELLINGS = [("Street", "St", "St.", "Str"), ("Avenue", "Ave", "Av."), ("Boulevard", "Blvd", "Blvd.")]
+UNIT_SPELLINGS = ["", ", Apt {u}", " Apt. {u}", " #{u}", " Unit {u}", ", apartment {u}"]
+STATE_NAMES = {"MA": "Massachusetts", "IL": "Illinois", "WA": "Washington", "TX": "Texas", "CO": "Colorado"}
+
+
+def legacy_normalize(address):
+    """Normalization used by the cache keys before the normalizer existed."""
+    return " ".join(address.lower().split())
+
+
+def synthetic_log(size, seed=7):
+    rng = random.Random(seed)
+    properties = []
+    for template, city, state, zip_code in BASE_ADDRESSES:
+        for number in range(100, 140, 7):
+            properties.append((
+                template, number, rng.randrange(len(DIRECTION_SPELLINGS)),
+                rng.randrange(len(SUFFIX_SPELLINGS)), rng.choice(["", "4", "12B"]),
+                city, state, zip_code,
+            ))
+
+    log = []
+    for _ in range(size):
+        template, number, direction, suffix, unit, city, state, zip_code = rng.choice(properties)
+        street = template.format(
+            n=number,
+            d=rng.choice(DIRECTION_SPELLINGS[direction]),
+            s=rng.choice(SUFFIX_SPELLINGS[suffix]),
+        )
+        unit_part = rng.choice(UNIT_SPELLINGS[1:]).format(u=unit) if unit else ""
+        zip_part = rng.choice([zip_code, f"{zip_code}-{rng.randrange(10000):04d}"])
+        state_part = rng.choice([state, STATE_NAMES[state]])
+        address = f"{street}{unit_part}, {city}, {state_part} {zip_part}"
+        log.append(rng.choice([address, address.lower(), address.upper()]))
+    return log
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("log", nargs="?", help="File with one address per line")
+    parser.add_argument("--size", type=int, default=10000, help="Synthetic log size")
+    args = parser.parse_args()
+
+    if args.log:
+        with open(args.log, encoding="utf-8") as log_file:
+            addresses = [line.strip() for line in log_file if line.strip()]
+    else:
+        addresses = synthetic_log(args.size)
+
+    legacy_keys = {legacy_normalize(address) for address in addresses}
+
+    start = time.perf_counter()
+    canonical_keys = {normalize_address.__wrapped__(address) for address in addresses}
+    per_call_us = (time.perf_counter() - start) / len(addresses) * 1e6
+
+    removed = len(legacy_keys) - len(canonical_keys)
+    print(f"Requests:                   {len(addresses)}")
+    print(f"Cache entries (legacy):     {len(legacy_keys)}")
+    print(f"Cache entries (normalized): {len(canonical_keys)}")
+    print(f"Duplicate entries removed:  {removed} ({removed / len(legacy_keys):.1%})")
+    print(f"Best-case hit rate (legacy):     {1 - len(legacy_keys) / len(addresses):.1%}")
+    print(f"Best-case hit rate (normalized): {1 - len(canonical_keys) / len(addresses):.1%}")
+    print(f"normalize_address, uncached: {per_call_us:.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
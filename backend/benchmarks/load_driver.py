@@ -0,0 +1,222 @@
+"""
+Replay a Zipf-distributed address workload against a running deployment.
+
+A few addresses are looked up most of the time and a long tail rarely, as
+with real traffic: address ``k`` of ``--addresses`` is drawn with weight
+``1 / k ** --zipf``. ``--concurrency`` clients send requests back to back,
+or at ``--rate`` requests per second in total, to ``/properties/``.
+
+Reports latency percentiles overall and for cache hits and misses, the
+cache hit ratio, and the error rate: failed requests, and successful ones
+with a provider error. A response is a hit when its records are marked as
+cached. Use it with ``provider_simulator.py`` to size worker counts.
+
+Usage:
+    python benchmarks/load_driver.py [--url URL] [--addresses N] [--zipf S]
+        [--requests N | --duration SECONDS] [--concurrency N] [--rate RPS]
+        [--output results.json]
+"""
+import argparse
+import itertools
+import json
+import random
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+def percentile(samples, percent):
+    ordered = sorted(samples)
+    return ordered[min(int(percent / 100 * len(ordered)), len(ordered) - 1)]
+
+
+class ZipfAddresses:
+    """Addresses drawn with a Zipf distribution over their rank."""
+
+    def __init__(self, count, exponent, namespace="", seed=0):
+        self.addresses = [
+            f"{rank} Zipf St{' ' + namespace if namespace else ''}, Springfield"
+            for rank in range(1, count + 1)
+        ]
+        self.cumulative = list(
+            itertools.accumulate(1 / rank ** exponent for rank in range(1, count + 1))
+        )
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def draw(self):
+        with self.lock:
+            point = self.random.random() * self.cumulative[-1]
+        return self.addresses[min(bisect_left(self.cumulative, point), len(self.addresses) - 1)]
+
+
+def classify(response):
+    """
+    Returns:
+        tuple: Cache outcome (``hit``, ``stale``, ``miss`` or None) and whether
+            the request failed or a provider returned an error
+    """
+    if response.status_code != 200:
+        return None, True
+    try:
+        records = response.json()
+    except ValueError:
+        return None, True
+    if not isinstance(records, list) or not records:
+        return "miss", True
+    if all(record.get("cached") for record in records):
+        cache = "stale" if any(record.get("stale") for record in records) else "hit"
+    else:
+        cache = "miss"
+    return cache, any("error" in record for record in records)
+
+
+class LoadDriver:
+    def __init__(self, args):
+        self.args = args
+        self.addresses = ZipfAddresses(args.addresses, args.zipf, args.namespace, args.seed)
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.sent = 0
+        self.samples = []  # (latency, status, cache, failed)
+
+    def session(self):
+        # One keep-alive connection per client thread
+        if not hasattr(self.local, "session"):
+            self.local.session = requests.Session()
+        return self.local.session
+
+    def next_slot(self):
+        """
+        Claim the next request, waiting for its send time at ``--rate``.
+
+        Returns:
+            bool: False once the run is over
+        """
+        with self.lock:
+            index = self.sent
+            self.sent += 1
+        if self.args.requests and index >= self.args.requests:
+            return False
+        if self.args.rate:
+            delay = self.started + index / self.args.rate - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        return time.monotonic() < self.stop_at
+
+    def client(self):
+        while self.next_slot():
+            address = self.addresses.draw()
+            started = time.perf_counter()
+            try:
+                response = self.session().get(
+                    self.args.url, params={"address": address}, timeout=self.args.timeout
+                )
+                status = response.status_code
+                cache, failed = classify(response)
+            except requests.RequestException as e:
+                status, cache, failed = type(e).__name__, None, True
+            sample = (time.perf_counter() - started, status, cache, failed)
+            with self.lock:
+                self.samples.append(sample)
+
+    def run(self):
+        self.started = time.monotonic()
+        self.stop_at = self.started + (self.args.duration or float("inf"))
+        with ThreadPoolExecutor(max_workers=self.args.concurrency) as executor:
+            clients = [executor.submit(self.client) for _ in range(self.args.concurrency)]
+            for client in clients:
+                client.result()
+        return time.monotonic() - self.started
+
+
+def latency_summary(latencies):
+    if not latencies:
+        return {"requests": 0}
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p90_ms": round(percentile(latencies, 90) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "max_ms": round(max(latencies) * 1000, 1),
+    }
+
+
+def summarize(samples, elapsed):
+    caches = Counter(cache for _, _, cache, _ in samples if cache)
+    served = sum(caches.values())
+    return {
+        "requests": len(samples),
+        "duration_s": round(elapsed, 1),
+        "rps": round(len(samples) / elapsed, 1),
+        "hit_ratio": round((caches["hit"] + caches["stale"]) / served, 4) if served else 0,
+        "stale_ratio": round(caches["stale"] / served, 4) if served else 0,
+        "error_rate": round(sum(1 for *_, failed in samples if failed) / len(samples), 4),
+        "statuses": dict(Counter(str(status) for _, status, _, _ in samples)),
+        "latency": {
+            "all": latency_summary([latency for latency, *_ in samples]),
+            **{
+                cache: latency_summary(
+                    [latency for latency, _, outcome, _ in samples if outcome == cache]
+                )
+                for cache in ("hit", "stale", "miss")
+            },
+        },
+    }
+
+
+def print_summary(summary):
+    print(
+        f"{summary['requests']} requests in {summary['duration_s']}s "
+        f"({summary['rps']} req/s), hit ratio {summary['hit_ratio']:.1%} "
+        f"(stale {summary['stale_ratio']:.1%}), error rate {summary['error_rate']:.2%}"
+    )
+    print("statuses: " + ", ".join(f"{status}: {count}" for status, count in summary["statuses"].items()))
+    print(f"\n{'requests':<10} {'count':>7} {'p50 ms':>8} {'p90 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for label, latency in summary["latency"].items():
+        if not latency["requests"]:
+            continue
+        print(
+            f"{label:<10} {latency['requests']:>7} {latency['p50_ms']:>8} {latency['p90_ms']:>8} "
+            f"{latency['p95_ms']:>8} {latency['p99_ms']:>8} {latency['max_ms']:>8}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:8000/properties/")
+    parser.add_argument("--addresses", type=int, default=10000, help="Distinct addresses")
+    parser.add_argument("--zipf", type=float, default=1.1, help="Exponent of the rank weights")
+    parser.add_argument("--namespace", default="",
+                        help="Added to every address, e.g. a run id to start with a cold cache")
+    parser.add_argument("--requests", type=int, default=0, help="Stop after N requests")
+    parser.add_argument("--duration", type=float, default=0, help="Stop after N seconds")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--rate", type=float, default=0, help="Total requests per second, 0 for closed loop")
+    parser.add_argument("--timeout", type=float, default=35, help="Seconds per request")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args()
+    if not args.requests and not args.duration:
+        args.requests = 1000
+
+    driver = LoadDriver(args)
+    elapsed = driver.run()
+    if not driver.samples:
+        parser.exit(1, "No requests were sent\n")
+    summary = summarize(driver.samples, elapsed)
+    print_summary(summary)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({"config": vars(args), "results": summary}, file, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
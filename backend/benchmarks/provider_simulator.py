@@ -0,0 +1,207 @@
+"""
+Serve imitations of the Provider1 and Provider2 property APIs over HTTP.
+
+Records follow the ``PROVIDER_CONFIGS`` mappings and derive from the
+address, so repeated lookups agree. Every call waits a lognormal latency,
+a share of them stall, fail with a 500 or are throttled with a 429, and
+each provider enforces its own token bucket quota like the real APIs. Point
+a worker deployment at it with:
+
+    PROVIDER1_API_URL=http://localhost:8081/provider-1/property
+    PROVIDER2_API_URL=http://localhost:8081/provider-2/property
+
+Both providers share the options; run two simulators on different ports to
+give them different behaviour. Totals per provider and status are printed
+every ``--report-interval`` seconds and on exit.
+
+Usage:
+    python benchmarks/provider_simulator.py [--port 8081] [--latency-ms MS] [--jitter S]
+        [--error-rate R] [--stall-rate R --stall-ms MS] [--rate-limit N --burst N]
+        [--throttle-rate R]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stubs import property_payload  # noqa: E402
+
+PATHS = {
+    "/provider-1/property": "provider1",
+    "/provider-2/property": "provider2",
+}
+
+
+class TokenBucket:
+    """Quota of ``rate`` calls per second, ``burst`` of them at once."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        """
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until one is left
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+
+class Simulator:
+    """Behaviour shared by the request handlers."""
+
+    def __init__(self, args):
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.lock = threading.Lock()
+        self.counts = Counter()
+        self.buckets = {
+            provider_name: TokenBucket(args.rate_limit, args.burst or args.rate_limit)
+            for provider_name in PATHS.values()
+            if args.rate_limit
+        }
+
+    def draw(self):
+        """Latency and outcome of one call."""
+        args = self.args
+        with self.lock:
+            latency = args.latency_ms / 1000 * self.random.lognormvariate(0, args.jitter)
+            if self.random.random() < args.stall_rate:
+                latency += args.stall_ms / 1000
+            roll = self.random.random()
+        if roll < args.throttle_rate:
+            return 0, 429
+        if roll < args.throttle_rate + args.error_rate:
+            return latency, 500
+        return latency, 200
+
+    def respond(self, provider_name, address):
+        """
+        Returns:
+            tuple: HTTP status, extra headers and JSON body
+        """
+        bucket = self.buckets.get(provider_name)
+        retry_after = bucket.take() if bucket else 0
+        if retry_after:
+            return 429, {"Retry-After": str(max(1, round(retry_after)))}, {
+                "error": "Too Many Requests"
+            }
+
+        latency, status_code = self.draw()
+        if status_code == 429:
+            return 429, {"Retry-After": "1"}, {"error": "Too Many Requests"}
+        time.sleep(latency)
+        if status_code == 500:
+            return 500, {}, {"error": "Internal Server Error"}
+        return 200, {}, {"data": property_payload(provider_name, address)}
+
+    def count(self, provider_name, status_code):
+        with self.lock:
+            self.counts[provider_name, status_code] += 1
+
+    def report(self):
+        with self.lock:
+            counts = sorted(self.counts.items())
+        line = ", ".join(f"{provider} {status}: {count}" for (provider, status), count in counts)
+        print(f"[{time.strftime('%H:%M:%S')}] {line or 'no calls yet'}", flush=True)
+
+
+def handler_class(simulator):
+    class Handler(BaseHTTPRequestHandler):
+        # Keep-alive, as the pooled provider clients expect
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            provider_name = PATHS.get(url.path)
+            address = parse_qs(url.query).get("address", [""])[0].strip()
+            if provider_name is None:
+                self.send_json(404, {}, {"error": "Not Found"})
+                return
+            if simulator.args.api_key and self.headers.get("X-API-KEY") != simulator.args.api_key:
+                status_code, headers, body = 401, {}, {"error": "Invalid API key"}
+            elif not address:
+                status_code, headers, body = 400, {}, {"error": "Missing address parameter"}
+            else:
+                status_code, headers, body = simulator.respond(provider_name, address)
+            simulator.count(provider_name, status_code)
+            self.send_json(status_code, headers, body)
+
+        def send_json(self, status_code, headers, body):
+            payload = json.dumps(body).encode()
+            self.send_response(status_code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            # Totals are reported instead of one line per call
+            pass
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency-ms", type=float, default=80, help="Median latency")
+    parser.add_argument("--jitter", type=float, default=0.3, help="Sigma of the lognormal latency")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="Calls stalling")
+    parser.add_argument("--stall-ms", type=float, default=2000, help="Extra latency of a stall")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Calls answered with a 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0,
+                        help="Calls answered with a 429 regardless of the quota")
+    parser.add_argument("--rate-limit", type=float, default=0,
+                        help="Calls per second each provider accepts, 0 for no quota")
+    parser.add_argument("--burst", type=float, default=0,
+                        help="Calls accepted at once after a quiet period (default: --rate-limit)")
+    parser.add_argument("--api-key", help="Reject calls without this X-API-KEY")
+    parser.add_argument("--report-interval", type=float, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    simulator = Simulator(args)
+    server = ThreadingHTTPServer((args.host, args.port), handler_class(simulator))
+    server.daemon_threads = True
+
+    def report():
+        while True:
+            time.sleep(args.report_interval)
+            simulator.report()
+
+    threading.Thread(target=report, daemon=True).start()
+    for path in PATHS:
+        print(f"Serving http://{args.host}:{args.port}{path}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        simulator.report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+Offline stand-ins for the providers and Redis, shared by the benchmarks.
+
+``property_payload`` builds the raw record a provider returns for an
+address, with the field names of its ``PROVIDER_CONFIGS`` mapping. Values
+derive from the address, so repeated lookups of it agree.
+"""
+import hashlib
+import random
+import threading
+import time
+
+PROPERTY_TYPES = ["Single Family", "Condo", "Townhouse", "Multi Family"]
+
+
+def property_payload(provider_name, address):
+    """
+    Raw ``data`` record of a provider for an address.
+
+    Args:
+        provider_name (str): ``provider1`` or ``provider2``
+        address (str): Property address
+
+    Returns:
+        dict: Record as the provider's API returns it
+    """
+    rng = random.Random(hashlib.md5(address.encode()).hexdigest())
+    square_footage = rng.randrange(700, 5000, 10)
+    lot_size_sqft = rng.randrange(2000, 40000, 10)
+    year_built = rng.randrange(1900, 2024)
+    property_type = rng.choice(PROPERTY_TYPES)
+    bedrooms = rng.randrange(1, 7)
+    bathrooms = rng.randrange(2, 9) / 2
+    room_count = bedrooms + rng.randrange(2, 6)
+    septic_system = rng.random() < 0.2
+    sale_price = rng.randrange(90000, 1500000, 1000)
+
+    if provider_name == "provider1":
+        return {
+            "squareFootage": square_footage,
+            "lotSizeSqFt": lot_size_sqft,
+            "yearBuilt": year_built,
+            "propertyType": property_type,
+            "bedrooms": bedrooms,
+            "bathrooms": bathrooms,
+            "features": {"roomCount": room_count, "septicSystem": septic_system},
+            "lastSalePrice": sale_price,
+        }
+    return {
+        "SquareFootage": square_footage,
+        "LotSizeAcres": round(lot_size_sqft / 43560, 2),
+        "YearConstructed": year_built,
+        "PropertyType": property_type,
+        "Bedrooms": bedrooms,
+        "Bathrooms": bathrooms,
+        "RoomCount": room_count,
+        "SepticSystem": "Yes" if septic_system else "No",
+        "SalePrice": sale_price,
+    }
+
+
+class StubProvider:
+    """
+    In-process provider service answering after a lognormal latency, with
+    an error on ``error_rate`` of its calls.
+
+    Args:
+        provider_name (str): Provider name
+        latency_ms (float): Median latency
+        jitter (float): Sigma of the latency's lognormal distribution
+        error_rate (float): Share of calls answered with an error
+        seed (int): Seed of the latency and error draws
+    """
+
+    def __init__(self, provider_name, latency_ms=20, jitter=0.25, error_rate=0.0, seed=0):
+        self.provider_name = provider_name
+        self.latency = latency_ms / 1000
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.calls = 0
+
+    def get_property_details(self, address, priority=None, probe=None):
+        with self.lock:
+            self.calls += 1
+            latency = self.latency * self.random.lognormvariate(0, self.jitter) if self.latency else 0
+            failed = self.random.random() < self.error_rate
+        if latency:
+            time.sleep(latency)
+        if failed:
+            return {"error": f"500 Server Error from {self.provider_name}"}
+        return {"data": property_payload(self.provider_name, address)}
+
+
+class FakeRedis:
+    """
+    Thread-safe in-memory Redis, implementing the commands the cache,
+    fetch locks and circuit breakers use. ``latency_ms`` is added to every
+    round-trip to mimic the network.
+
+    Lua scripts are not interpreted: ``eval`` only knows the lock release
+    script, so the rate limiter, which fails open, should be disabled.
+    """
+
+    def __init__(self, latency_ms=0):
+        self.latency = latency_ms / 1000
+        self.lock = threading.Lock()
+        self.data = {}
+        self.round_trips = 0
+
+    def _round_trip(self):
+        # The network delay does not hold the lock, only command execution does
+        if self.latency:
+            time.sleep(self.latency)
+        self.round_trips += 1
+
+    @staticmethod
+    def _encode(value):
+        if isinstance(value, bytes):
+            return value
+        return str(value).encode()
+
+    def _get(self, key):
+        item = self.data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    def _set(self, key, value, ex=None, nx=False):
+        if nx and self._get(key) is not None:
+            return None
+        expires_at = time.monotonic() + ex if ex else None
+        self.data[key] = (self._encode(value), expires_at)
+        return True
+
+    def _delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def _incr(self, key):
+        value = int(self._get(key) or 0) + 1
+        expires_at = self.data[key][1] if key in self.data else None
+        self.data[key] = (self._encode(value), expires_at)
+        return value
+
+    def _expire(self, key, seconds):
+        if self._get(key) is None:
+            return False
+        self.data[key] = (self.data[key][0], time.monotonic() + seconds)
+        return True
+
+    def _ttl(self, key):
+        if self._get(key) is None:
+            return -2
+        expires_at = self.data[key][1]
+        return -1 if expires_at is None else int(expires_at - time.monotonic())
+
+    def _exists(self, *keys):
+        return sum(self._get(key) is not None for key in keys)
+
+    def _command(self, name, *args, **kwargs):
+        if name == "get":
+            return self._get(*args)
+        if name == "mget":
+            keys = args[0] if len(args) == 1 and isinstance(args[0], list) else args
+            return [self._get(key) for key in keys]
+        if name == "set":
+            return self._set(*args, **kwargs)
+        if name == "setex":
+            key, ttl, value = args
+            return self._set(key, value, ex=ttl)
+        if name == "delete":
+            return self._delete(*args)
+        if name == "exists":
+            return self._exists(*args)
+        if name == "incr":
+            return self._incr(*args)
+        if name == "expire":
+            return self._expire(*args)
+        if name == "ttl":
+            return self._ttl(*args)
+        if name == "publish":
+            return 0
+        raise NotImplementedError(f"FakeRedis does not implement {name}")
+
+    def eval(self, script, numkeys, *args):
+        if "redis.call('get', KEYS[1]) == ARGV[1]" not in script:
+            raise NotImplementedError("FakeRedis only runs the lock release script")
+        key, token = args
+        self._round_trip()
+        with self.lock:
+            if self._get(key) == self._encode(token):
+                return self._delete(key)
+            return 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            self._round_trip()
+            with self.lock:
+                return self._command(name, *args, **kwargs)
+        return command
+
+
+class FakePipeline:
+    """Commands queued on a ``FakeRedis`` and run in one round-trip."""
+
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        commands, self.commands = self.commands, []
+        self.client._round_trip()
+        with self.client.lock:
+            return [self.client._command(name, *args, **kwargs) for name, args, kwargs in commands]
@@ -1,3 +1,9 @@
 from django.contrib import admin
+from properties.models import PropertyRecord
 
-# Register your models here.
+
+@admin.register(PropertyRecord)
+class PropertyRecordAdmin(admin.ModelAdmin):
+    list_display = ("address", "provider", "fetched_at")
+    list_filter = ("provider",)
+    search_fields = ("address", "address_hash")
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class PropertiesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'properties'
+
+    def ready(self):
+        from properties.config.providers import PROVIDER_CONFIGS
+        from properties.utils.data_procesor import DataProcessor
+
+        # Compile provider mappings once, failing fast on invalid ones
+        DataProcessor.compile_mappings(PROVIDER_CONFIGS)
@@ -3,7 +3,13 @@ from properties.utils.conversion import convert_sqft_to_acres
 PROVIDER_CONFIGS = {
     'provider1': {
         'service_class': 'properties.services.provider1.Provider1Service',
-        'timeout': 30,  # seconds
+        'timeout': 30,  # seconds, upper bound of the adaptive timeout
+        'connect_timeout': 5,  # seconds
+        'read_timeout': 30,  # seconds
+        'pool_size': 20,  # keep-alive connections per worker process
+        'max_concurrency': 16,  # provider calls in flight per worker process
+        'rate_limit': 10,  # calls per second across every worker, the API key's quota
+        'rate_burst': 20,  # calls the quota allows at once after a quiet period
         'mapping': {
             'square_footage': 'squareFootage',
             'lot_size_acres': ('lotSizeSqFt', convert_sqft_to_acres),
@@ -18,7 +24,13 @@ PROVIDER_CONFIGS = {
     },
     'provider2': {
         'service_class': 'properties.services.provider2.Provider2Service',
-        'timeout': 30,  # seconds
+        'timeout': 30,  # seconds, upper bound of the adaptive timeout
+        'connect_timeout': 5,  # seconds
+        'read_timeout': 30,  # seconds
+        'pool_size': 20,  # keep-alive connections per worker process
+        'max_concurrency': 16,  # provider calls in flight per worker process
+        'rate_limit': 10,  # calls per second across every worker, the API key's quota
+        'rate_burst': 20,  # calls the quota allows at once after a quiet period
         'mapping': {
             'square_footage': 'SquareFootage',
             'lot_size_acres': 'LotSizeAcres',
@@ -0,0 +1,223 @@
+import csv
+import json
+import os
+import time
+from itertools import islice
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from properties.services.property_store import get_property_store
+from properties.services.provider_executor import ExecutorSaturatedError
+from properties.services.rate_limiter import BATCH
+from properties.utils.deadline import Deadline
+from properties.views import PropertyLookupMixin
+
+
+class Warmer(PropertyLookupMixin):
+    """Provider fan-out, standardization and caching of the property views."""
+
+
+class Command(BaseCommand):
+    help = (
+        "Prefetch the property details of the addresses listed in a CSV or NDJSON "
+        "file, skipping those already cached. Resumes from its checkpoint file."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV file with a header row, or NDJSON file")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "ndjson"],
+            help="File format, guessed from the extension when omitted",
+        )
+        parser.add_argument(
+            "--column",
+            default="address",
+            help="CSV column, or NDJSON key, holding the address (default: address)",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="Checkpoint file (default: <path>.checkpoint)",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore the checkpoint and start from the first address",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=getattr(settings, "WARM_BATCH_SIZE", 200),
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=getattr(settings, "WARM_MAX_CONCURRENCY", 8),
+            help="Provider calls in flight at once",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not os.path.exists(path):
+            raise CommandError(f"No such file: {path}")
+        if options["batch_size"] < 1 or options["concurrency"] < 1:
+            raise CommandError("--batch-size and --concurrency must be positive")
+
+        checkpoint_path = options["checkpoint"] or f"{path}.checkpoint"
+        progress = {
+            "source": os.path.abspath(path),
+            "position": 0,  # records of the file already processed
+            "warmed": 0,
+            "cached": 0,
+            "failed": 0,
+        }
+        if not options["restart"]:
+            progress.update(self._read_checkpoint(checkpoint_path, progress["source"]))
+        if progress["position"]:
+            self.stdout.write(f"Resuming after {progress['position']} addresses")
+
+        self.warmer = Warmer()
+        started = time.monotonic()
+        resumed_at = progress["position"]
+        records = islice(
+            self._read_addresses(path, options["format"], options["column"]),
+            progress["position"],
+            None,
+        )
+        while True:
+            batch = list(islice(records, options["batch_size"]))
+            if not batch:
+                break
+            addresses = [
+                address
+                for address in batch
+                if address and not self.warmer._address_error(address)
+            ]
+            warmed, cached, failed = self._warm(addresses, options["concurrency"])
+            progress["position"] += len(batch)
+            progress["warmed"] += warmed
+            progress["cached"] += cached
+            progress["failed"] += failed + len(batch) - len(addresses)
+            self._write_checkpoint(checkpoint_path, progress)
+
+            elapsed = time.monotonic() - started
+            self.stdout.write(
+                f"{progress['position']} addresses: {progress['warmed']} warmed, "
+                f"{progress['cached']} already cached, {progress['failed']} failed "
+                f"({(progress['position'] - resumed_at) / elapsed:.1f} addresses/s)"
+            )
+
+        store = get_property_store()
+        if store is not None:
+            store.flush()
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Done: {progress['warmed']} warmed, {progress['cached']} already cached, "
+                f"{progress['failed']} failed in {time.monotonic() - started:.1f}s"
+            )
+        )
+
+    def _warm(self, addresses, concurrency):
+        """
+        Fetch and cache the addresses of one batch that are not cached yet.
+        Addresses with partial results, e.g. rate limited, are retried with
+        an exponential backoff.
+
+        Returns:
+            tuple: Numbers of addresses warmed, already cached and failed
+        """
+        cache_service = self.warmer.cache_service
+
+        # Addresses sharing a cache key are only fetched once
+        unique = {}
+        lookups = []
+        for address in addresses:
+            lookups.append(unique.setdefault(cache_service.get_cache_key(address), address))
+        cached = cache_service.cached_addresses(unique.values())
+        pending = [address for address in unique.values() if address not in cached]
+
+        retries = getattr(settings, "WARM_RETRIES", 3)
+        delay = getattr(settings, "WARM_RETRY_DELAY", 2)
+        warmed = set()
+        for attempt in range(retries + 1):
+            if not pending:
+                break
+            if attempt:
+                time.sleep(delay * 2 ** (attempt - 1))
+            try:
+                # Provider entries cached on an earlier attempt are reused
+                cached_entries = cache_service.get_many_with_staleness(
+                    entry
+                    for address in pending
+                    for entry in self.warmer._cache_lookups(address)[1:]
+                )
+                _, fetched = self.warmer._fetch_and_cache_many(
+                    pending,
+                    cached_entries,
+                    Deadline(getattr(settings, "WARM_BATCH_TIMEOUT", 120)),
+                    priority=BATCH,
+                    max_concurrency=concurrency,
+                )
+            except ExecutorSaturatedError as e:
+                self.stderr.write(f"Provider executor saturated, retrying: {e}")
+                continue
+            warmed.update(
+                address for address in pending
+                if not self.warmer._is_partial(fetched[address])
+            )
+            pending = [address for address in pending if address not in warmed]
+
+        warmed_count = sum(1 for lookup in lookups if lookup in warmed)
+        cached_count = sum(1 for lookup in lookups if lookup in cached)
+        return warmed_count, cached_count, len(lookups) - warmed_count - cached_count
+
+    @staticmethod
+    def _read_addresses(path, file_format, column):
+        """
+        Stream the addresses of a file, one per record. Records without an
+        address yield None so checkpoint positions count every record.
+        """
+        if file_format is None:
+            file_format = "csv" if path.lower().endswith(".csv") else "ndjson"
+
+        with open(path, newline="", encoding="utf-8") as file:
+            if file_format == "csv":
+                reader = csv.DictReader(file)
+                if column not in (reader.fieldnames or []):
+                    raise CommandError(f"CSV file has no {column!r} column")
+                for row in reader:
+                    yield (row.get(column) or "").strip() or None
+                return
+
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    yield None
+                    continue
+                address = record.get(column) if isinstance(record, dict) else record
+                yield (address.strip() or None) if isinstance(address, str) else None
+
+    @staticmethod
+    def _read_checkpoint(path, source):
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding="utf-8") as file:
+            checkpoint = json.load(file)
+        if checkpoint.get("source") != source:
+            raise CommandError(
+                f"Checkpoint {path} belongs to {checkpoint.get('source')}, "
+                "use --checkpoint or --restart"
+            )
+        return checkpoint
+
+    @staticmethod
+    def _write_checkpoint(path, progress):
+        # Replace the file atomically so an interruption never corrupts it
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(progress, file)
+        os.replace(temporary, path)
@@ -1,3 +1,25 @@
 from django.db import models
 
-# Create your models here.
+
+class PropertyRecord(models.Model):
+    """
+    Validated data of one provider for one address, kept after the Redis
+    entries expire so it does not have to be bought from the provider again.
+    """
+
+    # MD5 of the normalized address, as in the Redis cache keys
+    address_hash = models.CharField(max_length=32)
+    provider = models.CharField(max_length=50)
+    address = models.TextField(help_text="Normalized address")
+    data = models.JSONField()
+    fetched_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["address_hash", "provider"], name="unique_property_record"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.address} ({self.provider})"
@@ -0,0 +1,297 @@
+import contextlib
+import re
+from collections.abc import Mapping
+from django.core.exceptions import ImproperlyConfigured
+from django.core.validators import ProhibitNullCharactersValidator
+from rest_framework import serializers
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.fields import empty
+from rest_framework.settings import api_settings
+from rest_framework.validators import ProhibitSurrogateCharactersValidator
+from properties.serializers.properties_serializer import PropertyDetailsSerializer
+
+_MAX_STRING_LENGTH = 1000
+_RE_DECIMAL = re.compile(r'\.0*\s*$')
+_RE_SURROGATE = re.compile('[\ud800-\udfff]')
+_SUPPORTED_FIELDS = (
+    serializers.IntegerField,
+    serializers.FloatField,
+    serializers.CharField,
+    serializers.BooleanField,
+)
+
+
+class _Invalid(Exception):
+    """A field value failed validation, with DRF's error details."""
+
+    def __init__(self, details):
+        self.details = details
+
+
+def _fail(field, key, **kwargs):
+    message = str(field.error_messages[key]).format(**kwargs)
+    return _Invalid([ErrorDetail(message, code=key)])
+
+
+def _to_integer(field, value):
+    if type(value) is int:
+        return value
+    if isinstance(value, str) and len(value) > _MAX_STRING_LENGTH:
+        raise _fail(field, 'max_string_length')
+    try:
+        return int(_RE_DECIMAL.sub('', str(value)))
+    except (ValueError, TypeError):
+        raise _fail(field, 'invalid')
+
+
+def _to_float(field, value):
+    if type(value) is float:
+        return value
+    if isinstance(value, str) and len(value) > _MAX_STRING_LENGTH:
+        raise _fail(field, 'max_string_length')
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise _fail(field, 'invalid')
+    except OverflowError:
+        raise _fail(field, 'overflow')
+
+
+def _to_boolean(field, value):
+    lowered = value.lower() if isinstance(value, str) else value
+    with contextlib.suppress(TypeError):
+        if lowered in serializers.BooleanField.TRUE_VALUES:
+            return True
+        if lowered in serializers.BooleanField.FALSE_VALUES:
+            return False
+        if lowered in serializers.BooleanField.NULL_VALUES and field.allow_null:
+            return None
+    raise _fail(field, 'invalid', input=value)
+
+
+def _to_string(field, value):
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise _fail(field, 'invalid')
+    value = str(value)
+    if field.trim_whitespace:
+        value = value.strip()
+
+    errors = []
+    if '\x00' in value:
+        errors.append(ErrorDetail(
+            str(ProhibitNullCharactersValidator.message), code=ProhibitNullCharactersValidator.code
+        ))
+    surrogate = _RE_SURROGATE.search(value)
+    if surrogate:
+        errors.append(ErrorDetail(
+            str(ProhibitSurrogateCharactersValidator.message).format(code_point=ord(surrogate.group())),
+            code=ProhibitSurrogateCharactersValidator.code,
+        ))
+    if errors:
+        raise _Invalid(errors)
+    return value
+
+
+def _integer_representation(value):
+    return int(value)
+
+
+def _float_representation(value):
+    return float(value)
+
+
+def _string_representation(value):
+    return str(value)
+
+
+def _boolean_representation(value, allow_null):
+    lowered = value.lower() if isinstance(value, str) else value
+    if lowered in serializers.BooleanField.TRUE_VALUES:
+        return True
+    if lowered in serializers.BooleanField.FALSE_VALUES:
+        return False
+    if lowered in serializers.BooleanField.NULL_VALUES and allow_null:
+        return None
+    return bool(value)
+
+
+class _FieldPlan:
+    """What validating and representing one serializer field takes."""
+
+    def __init__(self, name, field):
+        self.name = name
+        self.field = field
+        self.read_only = field.read_only
+        self.required = field.required
+        self.allow_null = field.allow_null
+        self.default = field.default
+        self.is_string = isinstance(field, serializers.CharField)
+        self.allow_blank = getattr(field, 'allow_blank', False)
+        self.trim_whitespace = getattr(field, 'trim_whitespace', False)
+
+        if isinstance(field, serializers.BooleanField):
+            self.to_internal = _to_boolean
+            allow_null = field.allow_null
+            self.to_representation = lambda value: _boolean_representation(value, allow_null)
+        elif isinstance(field, serializers.IntegerField):
+            self.to_internal = _to_integer
+            self.to_representation = _integer_representation
+        elif isinstance(field, serializers.FloatField):
+            self.to_internal = _to_float
+            self.to_representation = _float_representation
+        else:
+            self.to_internal = _to_string
+            self.to_representation = _string_representation
+
+
+class LeanSerializer:
+    """
+    Validates and represents the flat records of a DRF serializer without
+    instantiating it, producing the same data and error details.
+
+    Only plain Integer, Float, Char and Boolean fields without extra
+    validators are supported, and the serializer may not override
+    ``to_internal_value`` or ``to_representation`` except for
+    ``PropertyDetailsSerializer``'s error records, which are mirrored here;
+    anything else is refused when the serializer is compiled, so the two can
+    never silently drift apart.
+    """
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        self.fields = [
+            _FieldPlan(name, field)
+            for name, field in self._check_fields(serializer_class).items()
+        ]
+        self.writable_fields = [plan for plan in self.fields if not plan.read_only]
+        self.invalid_message = serializer_class().error_messages['invalid']
+        self.error_records = (
+            serializer_class.to_representation is PropertyDetailsSerializer.to_representation
+        )
+
+    @staticmethod
+    def _check_fields(serializer_class):
+        overrides = {
+            'validate': (serializers.Serializer.validate,),
+            'to_internal_value': (serializers.Serializer.to_internal_value,),
+            'to_representation': (
+                serializers.Serializer.to_representation,
+                PropertyDetailsSerializer.to_representation,
+            ),
+        }
+        for method, supported in overrides.items():
+            if getattr(serializer_class, method) not in supported:
+                raise ImproperlyConfigured(
+                    f"{serializer_class.__name__}.{method} is not supported by LeanSerializer"
+                )
+        fields = serializer_class().fields
+        for name, field in fields.items():
+            if type(field) not in _SUPPORTED_FIELDS:
+                raise ImproperlyConfigured(
+                    f"{serializer_class.__name__}.{name}: {type(field).__name__} "
+                    f"is not supported by LeanSerializer"
+                )
+            extra_validators = [
+                validator for validator in field.validators
+                if type(validator) not in (
+                    ProhibitNullCharactersValidator, ProhibitSurrogateCharactersValidator
+                )
+            ]
+            if extra_validators or field.source != name or getattr(serializer_class, f'validate_{name}', None):
+                raise ImproperlyConfigured(
+                    f"{serializer_class.__name__}.{name}: validators, sources and "
+                    f"validate_ methods are not supported by LeanSerializer"
+                )
+        return fields
+
+    def validate(self, data):
+        """
+        Validate a record like ``serializer_class(data=data).is_valid()``.
+
+        Args:
+            data (dict): Record to validate
+
+        Returns:
+            tuple: (validated_data, None) when valid, (None, errors) otherwise
+        """
+        if data is None:
+            return None, {
+                api_settings.NON_FIELD_ERRORS_KEY: [ErrorDetail('No data provided', code='null')]
+            }
+        if not isinstance(data, Mapping):
+            message = str(self.invalid_message).format(datatype=type(data).__name__)
+            return None, {api_settings.NON_FIELD_ERRORS_KEY: [ErrorDetail(message, code='invalid')]}
+
+        validated = {}
+        errors = {}
+        for plan in self.writable_fields:
+            value = data.get(plan.name, empty)
+            try:
+                # CharField rejects blank values before anything else
+                if plan.is_string and value is not empty and (
+                    value == '' or (plan.trim_whitespace and str(value).strip() == '')
+                ):
+                    if not plan.allow_blank:
+                        raise _fail(plan.field, 'blank')
+                    validated[plan.name] = ''
+                elif value is empty:
+                    if plan.required:
+                        raise _fail(plan.field, 'required')
+                    if plan.default is not empty:
+                        validated[plan.name] = plan.default() if callable(plan.default) else plan.default
+                elif value is None:
+                    if not plan.allow_null:
+                        raise _fail(plan.field, 'null')
+                    validated[plan.name] = None
+                else:
+                    validated[plan.name] = plan.to_internal(plan.field, value)
+            except _Invalid as e:
+                errors[plan.name] = e.details
+
+        if errors:
+            return None, errors
+        return validated, None
+
+    def to_representation(self, instance):
+        """
+        Represent a record like ``serializer_class(instance).data``.
+
+        Args:
+            instance (dict): Record to represent
+
+        Returns:
+            dict: Primitive representation
+        """
+        # Mirrors PropertyDetailsSerializer.to_representation
+        if self.error_records and isinstance(instance, dict) and 'error' in instance:
+            return {
+                'error': instance['error'],
+                'provider': instance.get('provider', 'unknown'),
+                'cached': instance.get('cached', False),
+                'stale': instance.get('stale', False)
+            }
+
+        representation = {}
+        for plan in self.fields:
+            if plan.name in instance:
+                value = instance[plan.name]
+            elif plan.default is not empty:
+                value = plan.default() if callable(plan.default) else plan.default
+            elif plan.allow_null:
+                value = None
+            elif not plan.required:
+                continue
+            else:
+                raise KeyError(
+                    f"Got KeyError when attempting to get a value for field `{plan.name}` "
+                    f"on serializer `{self.serializer_class.__name__}`."
+                )
+            representation[plan.name] = None if value is None else plan.to_representation(value)
+        return representation
+
+    def to_representation_many(self, instances):
+        """Represent records like ``serializer_class(instances, many=True).data``."""
+        return [self.to_representation(instance) for instance in instances]
+
+
+property_details_serializer = LeanSerializer(PropertyDetailsSerializer)
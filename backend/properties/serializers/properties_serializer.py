@@ -20,6 +20,7 @@ class PropertyDetailsSerializer(serializers.Serializer):
     # Metadata fields
     provider = serializers.CharField(required=True)
     cached = serializers.BooleanField(default=False)
+    stale = serializers.BooleanField(default=False)
     
     def to_representation(self, instance):
         """
@@ -30,7 +31,8 @@ class PropertyDetailsSerializer(serializers.Serializer):
             return {
                 'error': instance['error'],
                 'provider': instance.get('provider', 'unknown'),
-                'cached': instance.get('cached', False)
+                'cached': instance.get('cached', False),
+                'stale': instance.get('stale', False)
             }
             
         # Regular processing
@@ -0,0 +1,181 @@
+import os
+import time
+import httpx
+import requests
+from dotenv import load_dotenv
+from properties.services.circuit_breaker import circuit_breaker
+from properties.services.provider_clients import provider_clients, get_provider_timeouts
+from properties.services.provider_latency import provider_latency
+from properties.services.rate_limiter import INTERACTIVE, rate_limiter
+from properties.utils import metrics
+
+load_dotenv()
+
+
+class BaseProviderService:
+    """
+    Base class for property data providers exposing both a blocking and an
+    asyncio-native way of fetching property details.
+
+    HTTP calls go through the provider's pooled clients in ``provider_clients``
+    so connections are kept alive between requests. Their latency is recorded
+    in ``provider_latency``, which also sets their read timeout, and their
+    outcome in the provider's ``circuit_breaker``. Every call first takes a
+    token from the provider's ``rate_limiter`` bucket. Calls are also
+    counted, timed and tracked while in flight in ``metrics``.
+
+    The probe call of a half-open circuit is given the probe token from
+    ``circuit_breaker.admit_many``, and reports its outcome with it.
+    """
+
+    provider_name = None
+    api_key_env = None
+    api_url_env = None
+
+    def __init__(self):
+        self.api_key = os.getenv(self.api_key_env)
+        self.base_url = os.getenv(self.api_url_env)
+        self.timeout = get_provider_timeouts(self.provider_name)
+
+    def get_headers(self):
+        return {"X-API-KEY": self.api_key, "Accept": "application/json"}
+
+    def get_call_timeout(self):
+        """
+        Get the (connect, read) timeouts of the next call, the read timeout
+        following the provider's recent latency.
+
+        Returns:
+            tuple: (connect timeout, read timeout) in seconds
+        """
+        return self.timeout[0], provider_latency.timeout(self.provider_name)
+
+    @staticmethod
+    def is_outage(status_code):
+        """
+        Whether a failed call counts against the provider's circuit breaker.
+        Client errors mean the provider is up and answering, so only server
+        errors, rate limiting and calls without a response count.
+
+        Args:
+            status_code (int): HTTP status of the response, None without one
+
+        Returns:
+            bool: True if the failure suggests the provider is unavailable
+        """
+        return status_code is None or status_code >= 500 or status_code == 429
+
+    def rate_limited_result(self, error=None):
+        """
+        Result of a call shed by the rate limiter or rejected by the provider
+        for exceeding the quota. It is not cached, like a timeout.
+
+        Args:
+            error (str, optional): Error reported by the provider
+
+        Returns:
+            dict: Error result flagged as ``rate_limited``
+        """
+        return {
+            "error": error or f"Rate limit of {self.provider_name} reached",
+            "rate_limited": True,
+        }
+
+    @staticmethod
+    def _outcome(timed_out, status_code):
+        """Metrics outcome of a failed call."""
+        if timed_out:
+            return "timeout"
+        return "rate_limited" if status_code == 429 else "error"
+
+    def get_property_details(self, address, priority=INTERACTIVE, probe=None):
+        if not rate_limiter.acquire(self.provider_name, priority):
+            metrics.record_provider_outcome(self.provider_name, "rate_limited")
+            circuit_breaker.release_probe(self.provider_name, probe)
+            return self.rate_limited_result()
+
+        params = {"address": address}
+        timeout = self.get_call_timeout()
+        started = time.monotonic()
+        metrics.provider_call_started(self.provider_name)
+        outcome = "error"
+
+        try:
+            response = provider_clients.get_session(self.provider_name).get(
+                self.base_url,
+                headers=self.get_headers(),
+                params=params,
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            result = response.json()
+            outcome = "ok"
+        except requests.exceptions.RequestException as e:
+            timed_out = isinstance(e, requests.exceptions.Timeout)
+            if timed_out:
+                provider_latency.observe(self.provider_name, timeout[1])
+            response = getattr(e, "response", None)
+            status_code = response.status_code if response is not None else None
+            outcome = self._outcome(timed_out, status_code)
+            if self.is_outage(status_code):
+                circuit_breaker.record_failure(self.provider_name, probe)
+            else:
+                circuit_breaker.record_success(self.provider_name, probe)
+            if status_code == 429:
+                rate_limiter.drain(self.provider_name)
+                return self.rate_limited_result(str(e))
+            return {"error": str(e)}
+        finally:
+            metrics.provider_call_finished(
+                self.provider_name, outcome, time.monotonic() - started
+            )
+        provider_latency.observe(self.provider_name, time.monotonic() - started)
+        circuit_breaker.record_success(self.provider_name, probe)
+        return result
+
+    async def aget_property_details(self, address, priority=INTERACTIVE, probe=None):
+        if not await rate_limiter.aacquire(self.provider_name, priority):
+            metrics.record_provider_outcome(self.provider_name, "rate_limited")
+            await circuit_breaker.arelease_probe(self.provider_name, probe)
+            return self.rate_limited_result()
+
+        params = {"address": address}
+        connect_timeout, read_timeout = self.get_call_timeout()
+        started = time.monotonic()
+        metrics.provider_call_started(self.provider_name)
+        outcome = "error"
+
+        try:
+            client = provider_clients.get_async_client(self.provider_name)
+            response = await client.get(
+                self.base_url,
+                headers=self.get_headers(),
+                params=params,
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            )
+            response.raise_for_status()
+            result = response.json()
+            outcome = "ok"
+        except (httpx.HTTPError, ValueError) as e:
+            timed_out = isinstance(e, httpx.TimeoutException)
+            if timed_out:
+                provider_latency.observe(self.provider_name, read_timeout)
+            status_code = (
+                e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+            )
+            outcome = self._outcome(timed_out, status_code)
+            if self.is_outage(status_code):
+                await circuit_breaker.arecord_failure(self.provider_name, probe)
+            else:
+                await circuit_breaker.arecord_success(self.provider_name, probe)
+            if status_code == 429:
+                await rate_limiter.adrain(self.provider_name)
+                return self.rate_limited_result(str(e))
+            return {"error": str(e)}
+        finally:
+            metrics.provider_call_finished(
+                self.provider_name, outcome, time.monotonic() - started
+            )
+        provider_latency.observe(self.provider_name, time.monotonic() - started)
+        await circuit_breaker.arecord_success(self.provider_name, probe)
+        return result
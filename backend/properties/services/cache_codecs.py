@@ -0,0 +1,205 @@
+import json
+import threading
+import zlib
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import lz4.frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4 = None
+
+# Encoded values start with a NUL byte, which can never start a JSON document,
+# so values written before this module existed are still recognised.
+HEADER_MAGIC = 0x00
+FORMAT_VERSION = 1
+HEADER_SIZE = 4
+
+
+class Codec:
+    """Serializer for cache payloads, identified in the header by ``codec_id``."""
+
+    def __init__(self, name, codec_id, dumps, loads):
+        self.name = name
+        self.codec_id = codec_id
+        self.dumps = dumps
+        self.loads = loads
+
+
+class Compressor:
+    """Compression applied to serialized payloads, identified by ``compression_id``."""
+
+    def __init__(self, name, compression_id, compress, decompress):
+        self.name = name
+        self.compression_id = compression_id
+        self.compress = compress
+        self.decompress = decompress
+
+
+def _json_dumps(value):
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+def _build_codecs():
+    codecs = [Codec('json', 1, _json_dumps, json.loads)]
+    if orjson is not None:
+        codecs.append(Codec('orjson', 2, orjson.dumps, orjson.loads))
+    if msgpack is not None:
+        codecs.append(Codec(
+            'msgpack',
+            3,
+            lambda value: msgpack.packb(value, use_bin_type=True),
+            lambda raw: msgpack.unpackb(raw, raw=False),
+        ))
+    return codecs
+
+
+_zstd_local = threading.local()
+
+
+def _zstd_compress(raw):
+    # ZstdCompressor is not thread-safe, every thread keeps its own
+    compressor = getattr(_zstd_local, 'compressor', None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=3)
+    return compressor.compress(raw)
+
+
+def _build_compressors():
+    compressors = [
+        Compressor('none', 0, lambda raw: raw, lambda raw: raw),
+        Compressor('zlib', 1, lambda raw: zlib.compress(raw, 6), zlib.decompress),
+    ]
+    if zstandard is not None:
+        compressors.append(Compressor(
+            'zstd',
+            2,
+            _zstd_compress,
+            # Frames written by ZstdCompressor.compress record their size.
+            lambda raw: zstandard.ZstdDecompressor().decompress(raw),
+        ))
+    if lz4 is not None:
+        compressors.append(Compressor('lz4', 3, lz4.frame.compress, lz4.frame.decompress))
+    return compressors
+
+
+CODECS = {codec.name: codec for codec in _build_codecs()}
+COMPRESSORS = {compressor.name: compressor for compressor in _build_compressors()}
+_CODECS_BY_ID = {codec.codec_id: codec for codec in CODECS.values()}
+_COMPRESSORS_BY_ID = {compressor.compression_id: compressor for compressor in COMPRESSORS.values()}
+
+
+class CacheValueCodec:
+    """
+    Encodes cache payloads as a small versioned header followed by the
+    serialized, optionally compressed, body. Every value records how it was
+    written, so the codec settings can change without flushing the cache.
+    """
+
+    def __init__(self, codec='json', compression='none', compression_threshold=1024):
+        if codec not in CODECS:
+            raise ImproperlyConfigured(
+                f"Cache codec '{codec}' is not available, install it or use one of: "
+                f"{', '.join(sorted(CODECS))}"
+            )
+        if compression not in COMPRESSORS:
+            raise ImproperlyConfigured(
+                f"Cache compression '{compression}' is not available, install it or use one of: "
+                f"{', '.join(sorted(COMPRESSORS))}"
+            )
+        self.codec = CODECS[codec]
+        self.compressor = COMPRESSORS[compression]
+        self.compression_threshold = compression_threshold
+
+    def encode(self, value):
+        """
+        Serialize a value, compressing it when it is at least
+        ``compression_threshold`` bytes long.
+
+        Args:
+            value: JSON-compatible value
+
+        Returns:
+            bytes: Header followed by the payload
+        """
+        payload = self.codec.dumps(value)
+        compressor = COMPRESSORS['none']
+        if self.compressor.compression_id and len(payload) >= self.compression_threshold:
+            compressed = self.compressor.compress(payload)
+            if len(compressed) < len(payload):
+                compressor, payload = self.compressor, compressed
+        header = bytes((HEADER_MAGIC, FORMAT_VERSION, self.codec.codec_id, compressor.compression_id))
+        return header + payload
+
+    @staticmethod
+    def decode(raw):
+        """
+        Deserialize a value written by any codec, including plain JSON written
+        before values carried a header.
+
+        Args:
+            raw (bytes | str): Raw cached value
+
+        Returns:
+            The decoded value
+
+        Raises:
+            ValueError: If the value uses an unknown format version, or a codec
+                or compression that is not installed in this process
+        """
+        if isinstance(raw, str) or not raw or raw[0] != HEADER_MAGIC:
+            return json.loads(raw)
+
+        version, codec_id, compression_id = raw[1], raw[2], raw[3]
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported cache format version {version}")
+        codec = _CODECS_BY_ID.get(codec_id)
+        compressor = _COMPRESSORS_BY_ID.get(compression_id)
+        if codec is None or compressor is None:
+            raise ValueError(
+                f"Cache value uses codec {codec_id} / compression {compression_id}, "
+                f"which are not installed"
+            )
+        return codec.loads(compressor.decompress(raw[HEADER_SIZE:]))
+
+
+_value_codec = None
+
+
+def get_value_codec():
+    """
+    Get the process-wide codec built from the CACHE_CODEC,
+    CACHE_COMPRESSION and CACHE_COMPRESSION_THRESHOLD settings.
+
+    Returns:
+        CacheValueCodec: The shared codec
+    """
+    global _value_codec
+    if _value_codec is None:
+        _value_codec = CacheValueCodec(
+            codec=getattr(settings, 'CACHE_CODEC', 'json'),
+            compression=getattr(settings, 'CACHE_COMPRESSION', 'none'),
+            compression_threshold=getattr(settings, 'CACHE_COMPRESSION_THRESHOLD', 1024),
+        )
+    return _value_codec
+
+
+def reset_value_codec():
+    """Drop the shared codec so it is rebuilt from the current settings."""
+    global _value_codec
+    _value_codec = None
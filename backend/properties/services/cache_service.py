@@ -1,32 +1,228 @@
+import asyncio
 import json
 import logging
+import threading
+import time
+import uuid
+import weakref
 import redis
+import redis.asyncio
 from django.conf import settings
 import hashlib
+from properties.services.cache_codecs import CacheValueCodec, get_value_codec
+from properties.services.local_cache import LocalCache
+from properties.services.property_store import get_property_store
+from properties.utils import metrics
+from properties.utils.address_normalizer import normalize_address
 
 logger = logging.getLogger(__name__)
 
+_connection_pool = None
+_async_connection_pools = weakref.WeakKeyDictionary()
+_pool_lock = threading.Lock()
+_local_cache = None
+_PROCESS_ID = uuid.uuid4().hex
+
+# Delete a lock only if it still holds our token
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def _get_pool_kwargs():
+    """Connection pool options shared by the sync and asyncio pools."""
+    return {
+        'host': getattr(settings, 'REDIS_HOST', 'localhost'),
+        'port': getattr(settings, 'REDIS_PORT', 6379),
+        'db': getattr(settings, 'REDIS_DB', 0),
+        'password': getattr(settings, 'REDIS_PASSWORD', None),
+        'socket_timeout': getattr(settings, 'REDIS_TIMEOUT', 5),
+        'socket_connect_timeout': getattr(settings, 'REDIS_TIMEOUT', 5),
+        'socket_keepalive': getattr(settings, 'REDIS_SOCKET_KEEPALIVE', True),
+        'health_check_interval': getattr(settings, 'REDIS_HEALTH_CHECK_INTERVAL', 30),
+        'max_connections': getattr(settings, 'REDIS_MAX_CONNECTIONS', 50),
+    }
+
+
+def get_redis_client():
+    """
+    Get a Redis client backed by the process-wide connection pool.
+    
+    When ``REDIS_USE_DJANGO_CACHE`` is enabled the client of the ``django_redis``
+    ``default`` cache is reused instead, so both share a single pool.
+    
+    Returns:
+        redis.Redis: Redis client
+    """
+    global _connection_pool
+    if getattr(settings, 'REDIS_USE_DJANGO_CACHE', False):
+        from django_redis import get_redis_connection
+        return get_redis_connection('default')
+    
+    if _connection_pool is None:
+        with _pool_lock:
+            if _connection_pool is None:
+                _connection_pool = redis.ConnectionPool(**_get_pool_kwargs())
+    return redis.Redis(connection_pool=_connection_pool)
+
+
+def get_async_redis_client():
+    """
+    Get an asyncio Redis client backed by the pool of the running event loop.
+    
+    Returns:
+        redis.asyncio.Redis: Asyncio Redis client
+    """
+    loop = asyncio.get_running_loop()
+    with _pool_lock:
+        pool = _async_connection_pools.get(loop)
+        if pool is None:
+            pool = redis.asyncio.ConnectionPool(**_get_pool_kwargs())
+            _async_connection_pools[loop] = pool
+    return redis.asyncio.Redis(connection_pool=pool)
+
+
+def reset_connection_pools():
+    """Disconnect and forget the shared pools (used after settings changes)."""
+    global _connection_pool, _async_connection_pools
+    with _pool_lock:
+        if _connection_pool is not None:
+            _connection_pool.disconnect()
+        _connection_pool = None
+        _async_connection_pools = weakref.WeakKeyDictionary()
+
+
+async def aclose_async_pool():
+    """
+    Disconnect and forget the asyncio pool of the running loop, for loops
+    that end with the request, as under WSGI.
+    """
+    with _pool_lock:
+        pool = _async_connection_pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        try:
+            await pool.disconnect()
+        except Exception as e:
+            logger.error("Error closing async Redis pool: %s", e)
+
+
+def get_local_cache():
+    """
+    Get the process-wide L1 cache, creating it on first use.
+    
+    Returns:
+        LocalCache: In-process cache, or None when ``L1_CACHE_ENABLED`` is off
+    """
+    global _local_cache
+    if not getattr(settings, 'L1_CACHE_ENABLED', False):
+        return None
+    
+    if _local_cache is None:
+        with _pool_lock:
+            if _local_cache is None:
+                ttl = min(
+                    getattr(settings, 'L1_CACHE_TTL', 60),
+                    getattr(settings, 'PROPERTY_CACHE_TTL', 60 * 60 * 24),
+                )
+                _local_cache = LocalCache(
+                    max_entries=getattr(settings, 'L1_CACHE_MAX_ENTRIES', 1024),
+                    ttl=ttl,
+                )
+                _start_invalidation_listener(_local_cache)
+    return _local_cache
+
+
+def _start_invalidation_listener(local_cache):
+    """
+    Subscribe to the invalidation channel so writes made by other workers
+    evict the entries of this worker's L1 cache.
+    """
+    channel = getattr(settings, 'L1_CACHE_INVALIDATION_CHANNEL', 'property:invalidate')
+    
+    def handle_message(message):
+        _handle_invalidation_message(local_cache, message)
+    
+    def handle_error(error, pubsub, thread):
+        # Entries cannot be trusted while we might be missing invalidations
+        logger.error("L1 invalidation listener error: %s", error)
+        local_cache.clear()
+        time.sleep(1)
+    
+    try:
+        pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{channel: handle_message})
+        pubsub.run_in_thread(sleep_time=1, daemon=True, exception_handler=handle_error)
+    except Exception as e:
+        logger.error("Failed to start L1 invalidation listener: %s", e)
+
+
+def _handle_invalidation_message(local_cache, message):
+    """Evict the keys announced by another worker from the L1 cache."""
+    try:
+        payload = json.loads(message['data'])
+        if payload.get('origin') != _PROCESS_ID:
+            local_cache.delete(*payload.get('keys', []))
+    except Exception as e:
+        logger.error("Invalid L1 invalidation message: %s", e)
+
+
+def reset_local_cache():
+    """Forget the L1 cache (used after settings changes)."""
+    global _local_cache
+    with _pool_lock:
+        _local_cache = None
+
+
 class CacheService:
     """
     Service for caching property data using Redis.
+    
+    Provider entries are also written behind to the durable property store,
+    which is read through when Redis misses them.
     """
     
     def __init__(self):
-        """Initialize Redis connection using settings."""
-        try:
-            self.redis = redis.Redis(
-                host=getattr(settings, 'REDIS_HOST', 'localhost'),
-                port=getattr(settings, 'REDIS_PORT', 6379),
-                db=getattr(settings, 'REDIS_DB', 0),
-                password=getattr(settings, 'REDIS_PASSWORD', None),
-                socket_timeout=getattr(settings, 'REDIS_TIMEOUT', 5)
-            )
+        """Initialize Redis connection using the process-wide pool."""
+        self._async_redis = None
+        try:
+            self.redis = get_redis_client()
             self.default_ttl = getattr(settings, 'PROPERTY_CACHE_TTL', 60 * 60 * 24)  # 24 hours
+            self.stale_ttl = getattr(settings, 'PROPERTY_CACHE_STALE_TTL', 0)
             self.enabled = getattr(settings, 'CACHE_ENABLED', True)
         except Exception as e:
-            logger.error(f"Failed to initialize Redis: {str(e)}")
+            logger.error("Failed to initialize Redis: %s", e)
             self.enabled = False
     
+    @property
+    def async_redis(self):
+        """Lazily create the asyncio Redis client used by the ``a*`` methods."""
+        if self._async_redis is None:
+            self._async_redis = get_async_redis_client()
+        return self._async_redis
+    
+    @staticmethod
+    def get_address_hash(address, normalized_address=None):
+        """
+        Hash a property address, the part of its keys shared by every tier.
+        
+        Args:
+            address (str): Property address
+            normalized_address (str, optional): ``normalize_address(address)``
+                when the caller already has it
+            
+        Returns:
+            str: MD5 hex digest of the normalized address
+        """
+        # Canonicalize the address so different spellings share a cache entry
+        if normalized_address is None:
+            normalized_address = normalize_address(address)
+        
+        # Create hash of address to avoid special characters in Redis keys
+        return hashlib.md5(normalized_address.encode()).hexdigest()
+    
     def get_cache_key(self, address, provider=None):
         """
         Generate a cache key for a property address and optional provider.
@@ -38,11 +234,7 @@ class CacheService:
         Returns:
             str: Cache key
         """
-        # Normalize address by removing extra spaces and converting to lowercase
-        normalized_address = ' '.join(address.lower().split())
-        
-        # Create hash of address to avoid special characters in Redis keys
-        address_hash = hashlib.md5(normalized_address.encode()).hexdigest()
+        address_hash = self.get_address_hash(address)
         
         if provider:
             return f"property:{address_hash}:{provider}"
@@ -64,18 +256,75 @@ class CacheService:
             
         try:
             cache_key = self.get_cache_key(address, provider)
-            cached_data = self.redis.get(cache_key)
+            cached_data = self._read_many([cache_key])[0]
             
             if cached_data:
-                logger.debug(f"Cache hit for {cache_key}")
-                return json.loads(cached_data)
+                logger.debug("Cache hit for %s", cache_key)
+                return self._decode(cached_data)[0]
             
-            logger.debug(f"Cache miss for {cache_key}")
+            logger.debug("Cache miss for %s", cache_key)
             return None
         except Exception as e:
-            logger.error(f"Error retrieving from cache: {str(e)}")
+            logger.error("Error retrieving from cache: %s", e)
             return None
     
+    def get_many(self, entries):
+        """
+        Get cached property data for many entries with a single MGET.
+        
+        Entries found in the L1 cache are not requested from Redis.
+        
+        Args:
+            entries (list): ``(address, provider)`` pairs, provider may be None
+            
+        Returns:
+            dict: Cached property data keyed by ``(address, provider)``, only
+                for cache hits
+        """
+        entries = list(entries)
+        if not self.enabled or not entries:
+            return {}
+            
+        try:
+            cache_keys = [self.get_cache_key(address, provider) for address, provider in entries]
+            cached_values = self._read_many(cache_keys)
+            results = self._decode_many(entries, cached_values)
+            logger.debug("Cache hits for %s of %s keys", len(results), len(entries))
+        except Exception as e:
+            logger.error("Error retrieving many from cache: %s", e)
+            results = {}
+        return {
+            entry: data for entry, (data, _) in self._read_through(entries, results).items()
+        }
+    
+    def get_many_with_staleness(self, entries):
+        """
+        Like ``get_many``, also telling which entries are past their soft TTL.
+        
+        Entries live in Redis for ``PROPERTY_CACHE_TTL`` (soft TTL) plus
+        ``PROPERTY_CACHE_STALE_TTL`` (hard TTL). In between they are stale:
+        still served, but due for a refresh. Provider entries found in the
+        property store instead are fresh.
+        
+        Args:
+            entries (list): ``(address, provider)`` pairs, provider may be None
+            
+        Returns:
+            dict: ``(data, is_stale)`` tuples keyed by ``(address, provider)``,
+                only for cache hits
+        """
+        entries = list(entries)
+        if not self.enabled or not entries:
+            return {}
+            
+        try:
+            cache_keys = [self.get_cache_key(address, provider) for address, provider in entries]
+            results = self._decode_many(entries, self._read_many(cache_keys))
+        except Exception as e:
+            logger.error("Error retrieving many from cache: %s", e)
+            results = {}
+        return self._read_through(entries, results)
+    
     def set(self, address, data, provider=None, ttl=None):
         """
         Cache property data.
@@ -86,6 +335,50 @@ class CacheService:
             provider (str, optional): Provider name
             ttl (int, optional): Time to live in seconds
             
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.set_many({(address, provider): data}, ttl)
+    
+    def set_many(self, items, ttl=None, responses=None):
+        """
+        Cache many entries with pipelined SETEX commands in one round-trip.
+        
+        Args:
+            items (dict): Property data keyed by ``(address, provider)`` pairs,
+                provider may be None
+            ttl (int, optional): Time to live in seconds
+            responses (dict, optional): Rendered response bodies keyed by
+                address, served as-is until the entries become stale
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not self.enabled or not items:
+            return False
+            
+        self._write_behind(items)
+        try:
+            ttl = ttl or self.default_ttl
+            pipeline = self.redis.pipeline(transaction=False)
+            self._queue_writes(pipeline, items, ttl, responses)
+            started = time.perf_counter()
+            pipeline.execute()
+            metrics.observe_redis('write', time.perf_counter() - started)
+            logger.debug("Cached %s entries with TTL %ss", len(items), ttl)
+            return True
+        except Exception as e:
+            logger.error("Error caching many entries: %s", e)
+            return False
+    
+    def delete(self, address, provider=None):
+        """
+        Delete cached property data.
+        
+        Args:
+            address (str): Property address
+            provider (str, optional): Provider name
+            
         Returns:
             bool: True if successful, False otherwise
         """
@@ -94,22 +387,572 @@ class CacheService:
             
         try:
             cache_key = self.get_cache_key(address, provider)
-            ttl = ttl or self.default_ttl
+            # The response body is rendered from every entry of the address
+            deleted = {cache_key: None, self.get_response_key(address): None}
+            pipeline = self.redis.pipeline(transaction=False)
+            pipeline.delete(*deleted)
+            self._update_local_cache(deleted, pipeline)
+            pipeline.execute()
+            store = get_property_store()
+            if provider is not None and store is not None:
+                store.delete(self.get_address_hash(address), provider)
+            logger.debug("Deleted cache for %s", cache_key)
+            return True
+        except Exception as e:
+            logger.error("Error deleting cache: %s", e)
+            return False
+    
+    def get_response_key(self, address):
+        """
+        Generate the key of the rendered response body of an address.
+        
+        Args:
+            address (str): Property address
+            
+        Returns:
+            str: Response key
+        """
+        return f"response:{self.get_cache_key(address)}"
+    
+    def get_response_with_staleness(self, address, entries):
+        """
+        Get the rendered response body cached for an address, reading the
+        entries of ``get_many_with_staleness`` in the same MGET for when there
+        is none. Bodies are only kept while the entries are fresh.
+        
+        Args:
+            address (str): Property address
+            entries (list): ``(address, provider)`` pairs, provider may be None
+            
+        Returns:
+            tuple: JSON response body exactly as it was stored, or None if not
+                found, and ``(data, is_stale)`` tuples keyed by
+                ``(address, provider)``, empty when the body was found
+        """
+        entries = list(entries)
+        if not self.enabled:
+            return None, {}
             
-            self.redis.setex(
-                cache_key,
-                ttl,
-                json.dumps(data)
+        try:
+            cache_keys = [self.get_response_key(address)] + [
+                self.get_cache_key(entry_address, provider)
+                for entry_address, provider in entries
+            ]
+            cached_values = self._read_many(cache_keys)
+            if cached_values[0]:
+                return cached_values[0], {}
+            results = self._decode_many(entries, cached_values[1:])
+        except Exception as e:
+            logger.error("Error retrieving response from cache: %s", e)
+            results = {}
+        return None, self._read_through(entries, results)
+    
+    def cached_addresses(self, addresses):
+        """
+        Tell which addresses have fresh cached results, checking the existence
+        of their response bodies in one pipelined round-trip without reading
+        them.
+        
+        Args:
+            addresses (list): Property addresses
+            
+        Returns:
+            set: Addresses with fresh cached results. Empty when Redis is
+                unavailable.
+        """
+        addresses = list(addresses)
+        if not self.enabled or not addresses:
+            return set()
+            
+        try:
+            pipeline = self.redis.pipeline(transaction=False)
+            for address in addresses:
+                pipeline.exists(self.get_response_key(address))
+            return {
+                address for address, exists in zip(addresses, pipeline.execute()) if exists
+            }
+        except Exception as e:
+            logger.error("Error checking cached addresses: %s", e)
+            return set()
+    
+    def get_lock_key(self, address):
+        """
+        Generate the key of the lock held while an address is being fetched.
+        
+        Args:
+            address (str): Property address
+            
+        Returns:
+            str: Lock key
+        """
+        return f"lock:{self.get_cache_key(address)}"
+    
+    def acquire_lock(self, address, ttl):
+        """
+        Try to become the only worker fetching an address from the providers.
+        
+        Args:
+            address (str): Property address
+            ttl (int): Lock expiry in seconds, in case the holder dies
+            
+        Returns:
+            str: Lock token to release the lock with, or None if another worker
+                holds it. When Redis is unavailable a token is returned so the
+                caller proceeds uncoordinated.
+        """
+        token = uuid.uuid4().hex
+        if not self.enabled:
+            return token
+            
+        try:
+            if self.redis.set(self.get_lock_key(address), token, nx=True, ex=ttl):
+                return token
+            return None
+        except Exception as e:
+            logger.error("Error acquiring fetch lock: %s", e)
+            return token
+    
+    def release_lock(self, address, token):
+        """
+        Release a lock acquired with ``acquire_lock`` if we still hold it.
+        
+        Args:
+            address (str): Property address
+            token (str): Lock token returned by ``acquire_lock``
+        """
+        if not self.enabled:
+            return
+            
+        try:
+            self.redis.eval(RELEASE_LOCK_SCRIPT, 1, self.get_lock_key(address), token)
+        except Exception as e:
+            logger.error("Error releasing fetch lock: %s", e)
+    
+    def wait_for(self, address, timeout, poll_interval):
+        """
+        Wait for the worker holding the fetch lock of an address to cache its
+        combined results.
+        
+        Args:
+            address (str): Property address
+            timeout (float): Maximum seconds to wait
+            poll_interval (float): Seconds between cache checks
+            
+        Returns:
+            list: Cached combined results, or None if the lock holder finished
+                or the wait timed out without caching anything
+        """
+        deadline = time.monotonic() + timeout
+        lock_key = self.get_lock_key(address)
+        while True:
+            cached_results = self.get(address)
+            if cached_results:
+                return cached_results
+            try:
+                if not self.redis.exists(lock_key):
+                    # The holder is done, its write may have landed meanwhile
+                    return self.get(address)
+            except Exception as e:
+                logger.error("Error checking fetch lock: %s", e)
+                return None
+            if time.monotonic() + poll_interval > deadline:
+                return None
+            time.sleep(poll_interval)
+    
+    def _read_many(self, cache_keys):
+        """
+        Read raw cached values, serving what we can from the L1 cache and the
+        rest from Redis with a single MGET.
+        
+        Args:
+            cache_keys (list): Cache keys
+            
+        Returns:
+            list: Raw values in key order, None for misses
+        """
+        local_cache = get_local_cache()
+        if local_cache is None:
+            return self._mget(cache_keys)
+        
+        values = [local_cache.get(cache_key) for cache_key in cache_keys]
+        metrics.record_cache_lookups('l1', cache_keys, values)
+        missing = [index for index, value in enumerate(values) if value is None]
+        if missing:
+            redis_values = self._mget([cache_keys[index] for index in missing])
+            for index, value in zip(missing, redis_values):
+                if value:
+                    local_cache.set(cache_keys[index], value)
+                    values[index] = value
+        return values
+    
+    async def _aread_many(self, cache_keys):
+        """Asynchronous version of ``_read_many``."""
+        local_cache = get_local_cache()
+        if local_cache is None:
+            return await self._amget(cache_keys)
+        
+        values = [local_cache.get(cache_key) for cache_key in cache_keys]
+        metrics.record_cache_lookups('l1', cache_keys, values)
+        missing = [index for index, value in enumerate(values) if value is None]
+        if missing:
+            redis_values = await self._amget([cache_keys[index] for index in missing])
+            for index, value in zip(missing, redis_values):
+                if value:
+                    local_cache.set(cache_keys[index], value)
+                    values[index] = value
+        return values
+    
+    def _mget(self, cache_keys):
+        """MGET of raw values from Redis, timed and counted in ``metrics``."""
+        started = time.perf_counter()
+        values = self.redis.mget(cache_keys)
+        metrics.observe_redis('read', time.perf_counter() - started)
+        metrics.record_cache_lookups('redis', cache_keys, values)
+        return values
+    
+    async def _amget(self, cache_keys):
+        """Asynchronous version of ``_mget``."""
+        started = time.perf_counter()
+        values = await self.async_redis.mget(cache_keys)
+        metrics.observe_redis('read', time.perf_counter() - started)
+        metrics.record_cache_lookups('redis', cache_keys, values)
+        return values
+    
+    def _update_local_cache(self, values, pipeline, ttl=None):
+        """
+        Refresh this worker's L1 entries and queue an invalidation message for
+        the other workers on the same pipeline, so it costs no extra round-trip.
+        
+        Args:
+            values (dict): New raw values keyed by cache key, None for deletes
+            pipeline: Redis pipeline the writes are queued on
+            ttl (int, optional): Time to live of the new values in seconds
+        """
+        local_cache = get_local_cache()
+        if local_cache is None:
+            return
+        
+        for cache_key, value in values.items():
+            if value is None:
+                local_cache.delete(cache_key)
+            else:
+                local_cache.set(cache_key, value, ttl)
+        
+        pipeline.publish(
+            getattr(settings, 'L1_CACHE_INVALIDATION_CHANNEL', 'property:invalidate'),
+            json.dumps({'origin': _PROCESS_ID, 'keys': list(values)}),
+        )
+    
+    def _queue_writes(self, pipeline, items, ttl, responses=None):
+        """
+        Queue the SETEX commands of ``set_many`` and ``aset_many``.
+        
+        Entries live for the soft TTL plus the stale window; response bodies
+        only for the soft TTL, so stale hits go through the structured entries.
+        """
+        values = self._encode_many(items, ttl)
+        for cache_key, value in values.items():
+            pipeline.setex(cache_key, ttl + self.stale_ttl, value)
+        for address, body in (responses or {}).items():
+            values[self.get_response_key(address)] = body
+            pipeline.setex(self.get_response_key(address), ttl, body)
+        # The soft TTL bounds both kinds of values in the L1 cache
+        self._update_local_cache(values, pipeline, ttl)
+    
+    def _write_behind(self, items):
+        """
+        Buffer the provider entries of ``items`` for the property store.
+        Combined entries only reference them and errors are not worth keeping.
+        """
+        store = get_property_store()
+        if store is None:
+            return
+        
+        records = {}
+        for (address, provider), data in items.items():
+            if provider is None or not isinstance(data, dict) or 'error' in data:
+                continue
+            normalized_address = normalize_address(address)
+            address_hash = self.get_address_hash(address, normalized_address)
+            records[(address_hash, provider)] = (normalized_address, data)
+        if records:
+            store.enqueue(records)
+    
+    def _store_lookups(self, entries, results):
+        """Provider entries missed by Redis, keyed by their property store key."""
+        return {
+            (self.get_address_hash(address), provider): (address, provider)
+            for address, provider in entries
+            if provider is not None and (address, provider) not in results
+        }
+    
+    def _store_backfill(self, lookups, records):
+        """
+        Pair the records found in the property store with their entries, and
+        group them by the TTL with which to write them back to Redis: the
+        default one, shortened when the record expires from the store sooner.
+        """
+        store_ttl = getattr(settings, 'PROPERTY_STORE_TTL', 60 * 60 * 24 * 30)
+        now = time.time()
+        found = {}
+        backfill = {}
+        for key, (data, fetched_at) in records.items():
+            entry = lookups[key]
+            found[entry] = (data, False)
+            remaining = int(store_ttl - (now - fetched_at.timestamp()))
+            ttl = max(min(self.default_ttl, remaining), 1)
+            backfill.setdefault(ttl, {})[entry] = data
+        return found, backfill
+    
+    def _read_through(self, entries, results):
+        """
+        Complete the provider entries missed by Redis from the property store,
+        writing the records found back to Redis.
+        
+        Args:
+            entries (list): ``(address, provider)`` pairs that were read
+            results (dict): ``(data, is_stale)`` tuples read from Redis
+            
+        Returns:
+            dict: ``results`` with the records found added as fresh entries
+        """
+        store = get_property_store()
+        lookups = self._store_lookups(entries, results) if store is not None else None
+        if not lookups:
+            return results
+        
+        try:
+            records = store.get_many(lookups)
+            metrics.record_store_lookups(lookups, records)
+            found, backfill = self._store_backfill(lookups, records)
+        except Exception as e:
+            logger.error("Error reading the property store: %s", e)
+            return results
+        if not found:
+            return results
+        
+        logger.debug("Property store hits for %s of %s keys", len(found), len(lookups))
+        try:
+            pipeline = self.redis.pipeline(transaction=False)
+            for ttl, items in backfill.items():
+                self._queue_writes(pipeline, items, ttl)
+            pipeline.execute()
+        except Exception as e:
+            logger.error("Error caching property store records: %s", e)
+        return {**results, **found}
+    
+    async def _aread_through(self, entries, results):
+        """Asynchronous version of ``_read_through``."""
+        store = get_property_store()
+        lookups = self._store_lookups(entries, results) if store is not None else None
+        if not lookups:
+            return results
+        
+        try:
+            records = await store.aget_many(lookups)
+            metrics.record_store_lookups(lookups, records)
+            found, backfill = self._store_backfill(lookups, records)
+        except Exception as e:
+            logger.error("Error reading the property store: %s", e)
+            return results
+        if not found:
+            return results
+        
+        logger.debug("Property store hits for %s of %s keys", len(found), len(lookups))
+        try:
+            pipeline = self.async_redis.pipeline(transaction=False)
+            for ttl, items in backfill.items():
+                self._queue_writes(pipeline, items, ttl)
+            await pipeline.execute()
+        except Exception as e:
+            logger.error("Error caching property store records: %s", e)
+        return {**results, **found}
+    
+    def _encode_many(self, items, ttl):
+        """
+        Serialize property data keyed by ``(address, provider)`` into raw values
+        keyed by cache key, recording when each entry becomes stale.
+        """
+        codec = get_value_codec()
+        fresh_until = time.time() + ttl
+        return {
+            self.get_cache_key(address, provider): codec.encode(
+                {'fresh_until': fresh_until, 'data': data}
             )
-            logger.debug(f"Cached data for {cache_key} with TTL {ttl}s")
+            for (address, provider), data in items.items()
+        }
+    
+    @staticmethod
+    def _decode(cached_data):
+        """
+        Deserialize a raw cached value written by any cache codec.
+        
+        Returns:
+            tuple: (data, is_stale). Entries written before soft TTLs existed
+                are never stale.
+        """
+        decoded = CacheValueCodec.decode(cached_data)
+        if isinstance(decoded, dict) and decoded.keys() == {'fresh_until', 'data'}:
+            return decoded['data'], decoded['fresh_until'] <= time.time()
+        return decoded, False
+    
+    @classmethod
+    def _decode_many(cls, entries, cached_values):
+        """
+        Pair raw values with their entries as ``(data, is_stale)``, skipping
+        misses. Values that cannot be decoded are treated as misses too.
+        """
+        results = {}
+        for entry, cached_data in zip(entries, cached_values):
+            if not cached_data:
+                continue
+            try:
+                results[entry] = cls._decode(cached_data)
+            except Exception as e:
+                logger.warning("Ignoring undecodable cache entry for %s: %s", entry, e)
+        return results
+    
+    async def aget(self, address, provider=None):
+        """
+        Asynchronous version of ``get``.
+        
+        Args:
+            address (str): Property address
+            provider (str, optional): Provider name
+            
+        Returns:
+            dict: Cached property data or None if not found
+        """
+        if not self.enabled:
+            return None
+            
+        try:
+            cache_key = self.get_cache_key(address, provider)
+            cached_data = (await self._aread_many([cache_key]))[0]
+            
+            if cached_data:
+                logger.debug("Cache hit for %s", cache_key)
+                return self._decode(cached_data)[0]
+            
+            logger.debug("Cache miss for %s", cache_key)
+            return None
+        except Exception as e:
+            logger.error("Error retrieving from cache: %s", e)
+            return None
+    
+    async def aget_many(self, entries):
+        """
+        Asynchronous version of ``get_many``.
+        
+        Args:
+            entries (list): ``(address, provider)`` pairs, provider may be None
+            
+        Returns:
+            dict: Cached property data keyed by ``(address, provider)``
+        """
+        entries = list(entries)
+        if not self.enabled or not entries:
+            return {}
+            
+        try:
+            cache_keys = [self.get_cache_key(address, provider) for address, provider in entries]
+            cached_values = await self._aread_many(cache_keys)
+            results = self._decode_many(entries, cached_values)
+        except Exception as e:
+            logger.error("Error retrieving many from cache: %s", e)
+            results = {}
+        results = await self._aread_through(entries, results)
+        return {entry: data for entry, (data, _) in results.items()}
+    
+    async def aget_many_with_staleness(self, entries):
+        """
+        Asynchronous version of ``get_many_with_staleness``.
+        
+        Args:
+            entries (list): ``(address, provider)`` pairs, provider may be None
+            
+        Returns:
+            dict: ``(data, is_stale)`` tuples keyed by ``(address, provider)``
+        """
+        entries = list(entries)
+        if not self.enabled or not entries:
+            return {}
+            
+        try:
+            cache_keys = [self.get_cache_key(address, provider) for address, provider in entries]
+            results = self._decode_many(entries, await self._aread_many(cache_keys))
+        except Exception as e:
+            logger.error("Error retrieving many from cache: %s", e)
+            results = {}
+        return await self._aread_through(entries, results)
+    
+    async def aget_response_with_staleness(self, address, entries):
+        """Asynchronous version of ``get_response_with_staleness``."""
+        entries = list(entries)
+        if not self.enabled:
+            return None, {}
+            
+        try:
+            cache_keys = [self.get_response_key(address)] + [
+                self.get_cache_key(entry_address, provider)
+                for entry_address, provider in entries
+            ]
+            cached_values = await self._aread_many(cache_keys)
+            if cached_values[0]:
+                return cached_values[0], {}
+            results = self._decode_many(entries, cached_values[1:])
+        except Exception as e:
+            logger.error("Error retrieving response from cache: %s", e)
+            results = {}
+        return None, await self._aread_through(entries, results)
+    
+    async def aset(self, address, data, provider=None, ttl=None):
+        """
+        Asynchronous version of ``set``.
+        
+        Args:
+            address (str): Property address
+            data (dict): Property data to cache
+            provider (str, optional): Provider name
+            ttl (int, optional): Time to live in seconds
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return await self.aset_many({(address, provider): data}, ttl)
+    
+    async def aset_many(self, items, ttl=None, responses=None):
+        """
+        Asynchronous version of ``set_many``.
+        
+        Args:
+            items (dict): Property data keyed by ``(address, provider)`` pairs
+            ttl (int, optional): Time to live in seconds
+            responses (dict, optional): Rendered response bodies keyed by address
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not self.enabled or not items:
+            return False
+            
+        self._write_behind(items)
+        try:
+            ttl = ttl or self.default_ttl
+            pipeline = self.async_redis.pipeline(transaction=False)
+            self._queue_writes(pipeline, items, ttl, responses)
+            started = time.perf_counter()
+            await pipeline.execute()
+            metrics.observe_redis('write', time.perf_counter() - started)
+            logger.debug("Cached %s entries with TTL %ss", len(items), ttl)
             return True
         except Exception as e:
-            logger.error(f"Error caching data: {str(e)}")
+            logger.error("Error caching many entries: %s", e)
             return False
     
-    def delete(self, address, provider=None):
+    async def adelete(self, address, provider=None):
         """
-        Delete cached property data.
+        Asynchronous version of ``delete``.
         
         Args:
             address (str): Property address
@@ -123,9 +966,69 @@ class CacheService:
             
         try:
             cache_key = self.get_cache_key(address, provider)
-            self.redis.delete(cache_key)
-            logger.debug(f"Deleted cache for {cache_key}")
+            # The response body is rendered from every entry of the address
+            deleted = {cache_key: None, self.get_response_key(address): None}
+            pipeline = self.async_redis.pipeline(transaction=False)
+            pipeline.delete(*deleted)
+            self._update_local_cache(deleted, pipeline)
+            await pipeline.execute()
+            store = get_property_store()
+            if provider is not None and store is not None:
+                await store.adelete(self.get_address_hash(address), provider)
+            logger.debug("Deleted cache for %s", cache_key)
             return True
         except Exception as e:
-            logger.error(f"Error deleting cache: {str(e)}")
-            return False
\ No newline at end of file
+            logger.error("Error deleting cache: %s", e)
+            return False
+    
+    async def aacquire_lock(self, address, ttl):
+        """Asynchronous version of ``acquire_lock``."""
+        token = uuid.uuid4().hex
+        if not self.enabled:
+            return token
+            
+        try:
+            if await self.async_redis.set(self.get_lock_key(address), token, nx=True, ex=ttl):
+                return token
+            return None
+        except Exception as e:
+            logger.error("Error acquiring fetch lock: %s", e)
+            return token
+    
+    async def arelease_lock(self, address, token):
+        """Asynchronous version of ``release_lock``."""
+        if not self.enabled:
+            return
+            
+        try:
+            await self.async_redis.eval(RELEASE_LOCK_SCRIPT, 1, self.get_lock_key(address), token)
+        except Exception as e:
+            logger.error("Error releasing fetch lock: %s", e)
+    
+    async def await_for(self, address, timeout, poll_interval):
+        """Asynchronous version of ``wait_for``."""
+        deadline = time.monotonic() + timeout
+        lock_key = self.get_lock_key(address)
+        while True:
+            cached_results = await self.aget(address)
+            if cached_results:
+                return cached_results
+            try:
+                if not await self.async_redis.exists(lock_key):
+                    # The holder is done, its write may have landed meanwhile
+                    return await self.aget(address)
+            except Exception as e:
+                logger.error("Error checking fetch lock: %s", e)
+                return None
+            if time.monotonic() + poll_interval > deadline:
+                return None
+            await asyncio.sleep(poll_interval)
+    
+    async def aclose(self):
+        """Release the asyncio Redis client, leaving the shared pool open."""
+        if self._async_redis is not None:
+            try:
+                await self._async_redis.aclose()
+            except Exception as e:
+                logger.error("Error closing async Redis client: %s", e)
+            self._async_redis = None
@@ -0,0 +1,343 @@
+import logging
+import uuid
+from django.conf import settings
+from properties.services.cache_service import (
+    RELEASE_LOCK_SCRIPT,
+    get_async_redis_client,
+    get_redis_client,
+)
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class ProviderCircuitBreaker:
+    """
+    Circuit breakers of the providers, with their state kept in Redis so
+    every worker trips and recovers together.
+
+    A provider's circuit is closed until it fails
+    ``CIRCUIT_BREAKER_FAILURE_THRESHOLD`` times within
+    ``CIRCUIT_BREAKER_FAILURE_WINDOW`` seconds. It then opens, and calls fail
+    fast for ``CIRCUIT_BREAKER_OPEN_SECONDS``. After that it is half-open: a
+    single probe call at a time is let through, closing the circuit if it
+    succeeds and opening it again if it fails.
+
+    The probe is a random token set in Redis with SET NX PX, handed to the
+    probe call and expiring after ``CIRCUIT_BREAKER_PROBE_TIMEOUT`` if the
+    call never reports back. Only the call holding the token can close or
+    reopen the circuit with it, or release it without an outcome.
+
+    Keys per provider:
+        ``circuit:<provider>:open``       set while open, expires into half-open
+        ``circuit:<provider>:half_open``  set from the trip until a probe succeeds
+        ``circuit:<provider>:probe``      token of the probe call in flight
+        ``circuit:<provider>:failures``   failures counted in the current window
+
+    When Redis is unavailable every call is let through.
+    """
+
+    @staticmethod
+    def get_key(provider_name, name):
+        """
+        Generate the key of one part of a provider's circuit state.
+
+        Args:
+            provider_name (str): Provider name
+            name (str): ``open``, ``half_open``, ``probe`` or ``failures``
+
+        Returns:
+            str: Redis key
+        """
+        return f"circuit:{provider_name}:{name}"
+
+    @staticmethod
+    def _enabled():
+        return getattr(settings, "CIRCUIT_BREAKER_ENABLED", True)
+
+    def _state_keys(self, provider_names):
+        return [
+            self.get_key(provider_name, name)
+            for provider_name in provider_names
+            for name in ("open", "half_open")
+        ]
+
+    @staticmethod
+    def _states(provider_names, values):
+        states = {}
+        for index, provider_name in enumerate(provider_names):
+            is_open, half_open = values[2 * index], values[2 * index + 1]
+            states[provider_name] = OPEN if is_open else HALF_OPEN if half_open else CLOSED
+        return states
+
+    @staticmethod
+    def _admit(provider_name, state, probe):
+        if state == HALF_OPEN:
+            if not probe:
+                return OPEN
+            logger.info("Circuit for %s is half-open, sending a probe call", provider_name)
+        return state
+
+    def admit_many(self, provider_names):
+        """
+        Decide which providers may be called, reading every circuit in one
+        round-trip.
+
+        Args:
+            provider_names (list): Provider names
+
+        Returns:
+            tuple: State keyed by provider name, and the probe tokens of the
+                ``half_open`` providers keyed alike. ``closed`` providers may
+                be called, ``half_open`` ones may receive exactly one call, the
+                probe, which must be given the token, and ``open`` ones must
+                not be called.
+        """
+        provider_names = list(provider_names)
+        if not self._enabled() or not provider_names:
+            return dict.fromkeys(provider_names, CLOSED), {}
+
+        try:
+            client = get_redis_client()
+            states = self._states(provider_names, client.mget(self._state_keys(provider_names)))
+            probes = {
+                provider_name: self._acquire_probe(client, provider_name)
+                for provider_name, state in states.items()
+                if state == HALF_OPEN
+            }
+            states = {
+                provider_name: self._admit(provider_name, state, probes.get(provider_name))
+                for provider_name, state in states.items()
+            }
+            return states, {name: probe for name, probe in probes.items() if probe}
+        except Exception as e:
+            logger.error("Error reading circuit breakers: %s", e)
+            return dict.fromkeys(provider_names, CLOSED), {}
+
+    async def aadmit_many(self, provider_names):
+        """Asyncio version of ``admit_many``."""
+        provider_names = list(provider_names)
+        if not self._enabled() or not provider_names:
+            return dict.fromkeys(provider_names, CLOSED), {}
+
+        client = get_async_redis_client()
+        try:
+            states = self._states(
+                provider_names, await client.mget(self._state_keys(provider_names))
+            )
+            admitted = {}
+            probes = {}
+            for provider_name, state in states.items():
+                if state == HALF_OPEN:
+                    token = uuid.uuid4().hex
+                    if await client.set(
+                        self.get_key(provider_name, "probe"),
+                        token,
+                        nx=True,
+                        px=self._probe_timeout_ms(),
+                    ):
+                        probes[provider_name] = token
+                admitted[provider_name] = self._admit(
+                    provider_name, state, probes.get(provider_name)
+                )
+            return admitted, probes
+        except Exception as e:
+            logger.error("Error reading circuit breakers: %s", e)
+            return dict.fromkeys(provider_names, CLOSED), {}
+        finally:
+            await client.aclose()
+
+    @staticmethod
+    def _probe_timeout_ms():
+        return int(getattr(settings, "CIRCUIT_BREAKER_PROBE_TIMEOUT", 35) * 1000)
+
+    def _acquire_probe(self, client, provider_name):
+        """Take the probe of a half-open circuit, returning its token or None."""
+        token = uuid.uuid4().hex
+        key = self.get_key(provider_name, "probe")
+        if client.set(key, token, nx=True, px=self._probe_timeout_ms()):
+            return token
+        return None
+
+    def release_probe(self, provider_name, probe):
+        """
+        Give back the probe of a half-open circuit without an outcome, e.g.
+        when the probe call was shed before reaching the provider, so that
+        the next call can probe instead of waiting for the token to expire.
+
+        Args:
+            provider_name (str): Provider name
+            probe (str): Probe token from ``admit_many``, None for other calls
+
+        Returns:
+            bool: True if the token was still held and is now released
+        """
+        if probe is None:
+            return False
+        try:
+            return bool(
+                get_redis_client().eval(
+                    RELEASE_LOCK_SCRIPT, 1, self.get_key(provider_name, "probe"), probe
+                )
+            )
+        except Exception as e:
+            logger.error("Error releasing probe of %s: %s", provider_name, e)
+            return False
+
+    async def arelease_probe(self, provider_name, probe):
+        """Asyncio version of ``release_probe``."""
+        if probe is None:
+            return False
+        client = get_async_redis_client()
+        try:
+            return bool(
+                await client.eval(
+                    RELEASE_LOCK_SCRIPT, 1, self.get_key(provider_name, "probe"), probe
+                )
+            )
+        except Exception as e:
+            logger.error("Error releasing probe of %s: %s", provider_name, e)
+            return False
+        finally:
+            await client.aclose()
+
+    def _queue_trip(self, pipeline, provider_name):
+        open_seconds = getattr(settings, "CIRCUIT_BREAKER_OPEN_SECONDS", 30)
+        pipeline.set(self.get_key(provider_name, "open"), 1, ex=open_seconds)
+        # Half-open outlives the open state; it ends when a probe succeeds
+        pipeline.set(self.get_key(provider_name, "half_open"), 1, ex=open_seconds * 100)
+        pipeline.delete(
+            self.get_key(provider_name, "failures"), self.get_key(provider_name, "probe")
+        )
+
+    def _queue_close(self, pipeline, provider_name):
+        pipeline.delete(
+            self.get_key(provider_name, "half_open"),
+            self.get_key(provider_name, "failures"),
+        )
+
+    def record_success(self, provider_name, probe=None):
+        """
+        Record a successful call. Only the probe call touches Redis, closing
+        the circuit if its token is still held.
+
+        Args:
+            provider_name (str): Provider name
+            probe (str, optional): Probe token from ``admit_many``
+        """
+        if not self._enabled() or not self.release_probe(provider_name, probe):
+            return
+        try:
+            pipeline = get_redis_client().pipeline(transaction=False)
+            self._queue_close(pipeline, provider_name)
+            pipeline.execute()
+            logger.info("Circuit for %s closed", provider_name)
+        except Exception as e:
+            logger.error("Error closing circuit for %s: %s", provider_name, e)
+
+    def record_failure(self, provider_name, probe=None):
+        """
+        Record a failed call, opening the circuit when it was the probe or
+        the failure threshold is reached.
+
+        Args:
+            provider_name (str): Provider name
+            probe (str, optional): Probe token from ``admit_many``
+        """
+        if not self._enabled():
+            return
+        try:
+            client = get_redis_client()
+            if self.release_probe(provider_name, probe):
+                trip = True
+            else:
+                trip = self._count_failure(client, provider_name)
+            if trip:
+                pipeline = client.pipeline(transaction=False)
+                self._queue_trip(pipeline, provider_name)
+                pipeline.execute()
+                logger.warning("Circuit for %s opened", provider_name)
+        except Exception as e:
+            logger.error("Error recording failure of %s: %s", provider_name, e)
+
+    def _count_failure(self, client, provider_name):
+        key = self.get_key(provider_name, "failures")
+        pipeline = client.pipeline(transaction=False)
+        pipeline.incr(key)
+        pipeline.ttl(key)
+        failures, ttl = pipeline.execute()
+        if ttl < 0:
+            client.expire(key, getattr(settings, "CIRCUIT_BREAKER_FAILURE_WINDOW", 30))
+        return failures >= getattr(settings, "CIRCUIT_BREAKER_FAILURE_THRESHOLD", 5)
+
+    async def arecord_success(self, provider_name, probe=None):
+        """Asyncio version of ``record_success``."""
+        if not self._enabled() or not await self.arelease_probe(provider_name, probe):
+            return
+        client = get_async_redis_client()
+        try:
+            pipeline = client.pipeline(transaction=False)
+            self._queue_close(pipeline, provider_name)
+            await pipeline.execute()
+            logger.info("Circuit for %s closed", provider_name)
+        except Exception as e:
+            logger.error("Error closing circuit for %s: %s", provider_name, e)
+        finally:
+            await client.aclose()
+
+    async def arecord_failure(self, provider_name, probe=None):
+        """Asyncio version of ``record_failure``."""
+        if not self._enabled():
+            return
+        trip = await self.arelease_probe(provider_name, probe)
+        client = get_async_redis_client()
+        try:
+            if not trip:
+                key = self.get_key(provider_name, "failures")
+                pipeline = client.pipeline(transaction=False)
+                pipeline.incr(key)
+                pipeline.ttl(key)
+                failures, ttl = await pipeline.execute()
+                if ttl < 0:
+                    await client.expire(
+                        key, getattr(settings, "CIRCUIT_BREAKER_FAILURE_WINDOW", 30)
+                    )
+                trip = failures >= getattr(settings, "CIRCUIT_BREAKER_FAILURE_THRESHOLD", 5)
+            if trip:
+                pipeline = client.pipeline(transaction=False)
+                self._queue_trip(pipeline, provider_name)
+                await pipeline.execute()
+                logger.warning("Circuit for %s opened", provider_name)
+        except Exception as e:
+            logger.error("Error recording failure of %s: %s", provider_name, e)
+        finally:
+            await client.aclose()
+
+    def state(self, provider_name):
+        """
+        Get the current state of a provider's circuit.
+
+        Args:
+            provider_name (str): Provider name
+
+        Returns:
+            str: ``closed``, ``open`` or ``half_open``
+        """
+        return self._states(
+            [provider_name], get_redis_client().mget(self._state_keys([provider_name]))
+        )[provider_name]
+
+    def reset(self, provider_name):
+        """Close a provider's circuit and forget its failures."""
+        pipeline = get_redis_client().pipeline(transaction=False)
+        pipeline.delete(
+            self.get_key(provider_name, "open"), self.get_key(provider_name, "probe")
+        )
+        self._queue_close(pipeline, provider_name)
+        pipeline.execute()
+
+
+circuit_breaker = ProviderCircuitBreaker()
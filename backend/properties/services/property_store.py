@@ -0,0 +1,220 @@
+import atexit
+import logging
+import threading
+from datetime import timedelta
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+from properties.models import PropertyRecord
+
+logger = logging.getLogger(__name__)
+
+_store = None
+_store_lock = threading.Lock()
+
+
+class PropertyStore:
+    """
+    Durable tier of provider data behind Redis, in the Django database.
+
+    Records are keyed by ``(address_hash, provider)``. Writes are buffered
+    in memory and upserted in batches by ``flush``, so the request that
+    fetched the data never waits on the database. Buffered records are
+    served by ``get_many`` until they are flushed.
+    """
+
+    def __init__(self, batch_size=500, max_pending=10000):
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._wakeup = threading.Event()
+
+    @property
+    def pending(self):
+        """Number of records waiting to be written."""
+        return len(self._pending)
+
+    def enqueue(self, records):
+        """
+        Buffer records for the next flush, replacing buffered ones of the same
+        key.
+
+        Args:
+            records (dict): ``(address, data)`` tuples keyed by
+                ``(address_hash, provider)``
+        """
+        fetched_at = timezone.now()
+        with self._lock:
+            new = len(records.keys() - self._pending.keys())
+            if len(self._pending) + new > self.max_pending:
+                logger.warning(
+                    "Property store buffer is full, dropping %s records", len(records)
+                )
+                return
+            for key, (address, data) in records.items():
+                self._pending[key] = (address, data, fetched_at)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wakeup.set()
+
+    def flush(self):
+        """
+        Upsert every buffered record, ``batch_size`` rows per statement.
+
+        Returns:
+            int: Number of records written
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        records = [
+            PropertyRecord(
+                address_hash=address_hash,
+                provider=provider,
+                address=address,
+                data=data,
+                fetched_at=fetched_at,
+            )
+            for (address_hash, provider), (address, data, fetched_at) in pending.items()
+        ]
+        try:
+            PropertyRecord.objects.bulk_create(
+                records,
+                batch_size=self.batch_size,
+                update_conflicts=True,
+                unique_fields=["address_hash", "provider"],
+                update_fields=["address", "data", "fetched_at"],
+            )
+        except Exception as e:
+            logger.error("Error writing %s property records: %s", len(records), e)
+            # Retry them with the next flush unless newer data was buffered since
+            with self._lock:
+                for key, value in pending.items():
+                    if len(self._pending) >= self.max_pending:
+                        break
+                    self._pending.setdefault(key, value)
+            return 0
+        logger.debug("Wrote %s property records", len(records))
+        return len(records)
+
+    @staticmethod
+    def _cutoff():
+        max_age = getattr(settings, "PROPERTY_STORE_TTL", 60 * 60 * 24 * 30)
+        return timezone.now() - timedelta(seconds=max_age)
+
+    def _pending_many(self, keys, cutoff):
+        with self._lock:
+            buffered = {key: self._pending[key] for key in keys if key in self._pending}
+        return {
+            key: (data, fetched_at)
+            for key, (_, data, fetched_at) in buffered.items()
+            if fetched_at >= cutoff
+        }
+
+    @staticmethod
+    def _query(keys, cutoff):
+        return PropertyRecord.objects.filter(
+            address_hash__in={address_hash for address_hash, _ in keys},
+            provider__in={provider for _, provider in keys},
+            fetched_at__gte=cutoff,
+        ).only("address_hash", "provider", "data", "fetched_at")
+
+    def get_many(self, keys):
+        """
+        Read the records of many keys with one indexed query, ignoring those
+        older than ``PROPERTY_STORE_TTL``.
+
+        Args:
+            keys (list): ``(address_hash, provider)`` pairs
+
+        Returns:
+            dict: ``(data, fetched_at)`` tuples keyed by ``(address_hash, provider)``,
+                only for the records found
+        """
+        keys = set(keys)
+        cutoff = self._cutoff()
+        results = self._pending_many(keys, cutoff)
+        missing = keys - results.keys()
+        if missing:
+            for record in self._query(missing, cutoff):
+                key = (record.address_hash, record.provider)
+                if key in missing:
+                    results[key] = (record.data, record.fetched_at)
+        return results
+
+    async def aget_many(self, keys):
+        """Asyncio version of ``get_many``."""
+        keys = set(keys)
+        cutoff = self._cutoff()
+        results = self._pending_many(keys, cutoff)
+        missing = keys - results.keys()
+        if missing:
+            async for record in self._query(missing, cutoff):
+                key = (record.address_hash, record.provider)
+                if key in missing:
+                    results[key] = (record.data, record.fetched_at)
+        return results
+
+    def delete(self, address_hash, provider):
+        """
+        Delete the record of a key, buffered or written.
+
+        Args:
+            address_hash (str): Hash of the normalized address
+            provider (str): Provider name
+        """
+        with self._lock:
+            self._pending.pop((address_hash, provider), None)
+        PropertyRecord.objects.filter(address_hash=address_hash, provider=provider).delete()
+
+    async def adelete(self, address_hash, provider):
+        """Asyncio version of ``delete``."""
+        with self._lock:
+            self._pending.pop((address_hash, provider), None)
+        await PropertyRecord.objects.filter(
+            address_hash=address_hash, provider=provider
+        ).adelete()
+
+    def start(self, interval):
+        """
+        Flush in a daemon thread every ``interval`` seconds, or as soon as a
+        batch is full.
+
+        Args:
+            interval (float): Seconds between flushes
+        """
+        def run():
+            while True:
+                self._wakeup.wait(interval)
+                self._wakeup.clear()
+                close_old_connections()
+                self.flush()
+
+        threading.Thread(target=run, name="property-store", daemon=True).start()
+
+
+def get_property_store():
+    """
+    Get the process-wide property store, starting its flusher on first use.
+
+    Returns:
+        PropertyStore: Durable store, or None when ``PROPERTY_STORE_ENABLED`` is off
+    """
+    global _store
+    if not getattr(settings, "PROPERTY_STORE_ENABLED", False):
+        return None
+
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = PropertyStore(
+                    batch_size=getattr(settings, "PROPERTY_STORE_BATCH_SIZE", 500),
+                    max_pending=getattr(settings, "PROPERTY_STORE_MAX_PENDING", 10000),
+                )
+                _store.start(getattr(settings, "PROPERTY_STORE_FLUSH_INTERVAL", 1.0))
+                # Write what is left when the worker exits
+                atexit.register(_store.flush)
+    return _store
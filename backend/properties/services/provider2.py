@@ -1,25 +1,7 @@
-import os
-import requests
-from dotenv import load_dotenv
+from properties.services.base_provider import BaseProviderService
 
-load_dotenv()
 
-
-class Provider2Service:
-    def __init__(self):
-        self.api_key = os.getenv("PROVIDER2_API_KEY")
-        self.base_url = os.getenv("PROVIDER2_API_URL")
-
-    def get_property_details(self, address):
-        headers = {"X-API-KEY": self.api_key, "Accept": "application/json"}
-
-        params = {"address": address}
-
-        try:
-            response = requests.get(
-                self.base_url, headers=headers, params=params, timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": str(e)}
+class Provider2Service(BaseProviderService):
+    provider_name = "provider2"
+    api_key_env = "PROVIDER2_API_KEY"
+    api_url_env = "PROVIDER2_API_URL"
@@ -0,0 +1,159 @@
+import logging
+import threading
+import weakref
+import asyncio
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from properties.config.providers import PROVIDER_CONFIGS
+from properties.utils.data_procesor import DataProcessor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5  # seconds
+DEFAULT_READ_TIMEOUT = 30  # seconds
+
+
+def get_provider_timeouts(provider_name):
+    """
+    Get the connect and read timeouts configured for a provider.
+
+    Args:
+        provider_name (str): Provider name
+
+    Returns:
+        tuple: (connect timeout, read timeout) in seconds
+    """
+    config = PROVIDER_CONFIGS.get(provider_name, {})
+    return (
+        config.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT),
+        config.get("read_timeout", config.get("timeout", DEFAULT_READ_TIMEOUT)),
+    )
+
+
+class ProviderClientRegistry:
+    """
+    Process-wide registry of provider service instances and their pooled,
+    keep-alive HTTP clients.
+
+    A ``requests.Session`` is shared by every thread calling a provider, so
+    connections (and their TLS sessions) are reused across requests. Async
+    clients are bound to the event loop that created them, so they are kept
+    per loop, and ``aclose_loop_clients`` closes them when a loop is only
+    used for one request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._services = {}
+        self._sessions = {}
+        self._async_clients = weakref.WeakKeyDictionary()
+
+    def get_service(self, provider_name):
+        """
+        Get the shared service instance for a provider, creating it on first use.
+
+        Args:
+            provider_name (str): Provider name
+
+        Returns:
+            object: Provider service instance
+        """
+        service = self._services.get(provider_name)
+        if service is not None:
+            return service
+
+        with self._lock:
+            service = self._services.get(provider_name)
+            if service is None:
+                service_class = DataProcessor.load_service_class(
+                    PROVIDER_CONFIGS[provider_name]["service_class"]
+                )
+                service = service_class()
+                self._services[provider_name] = service
+            return service
+
+    def get_session(self, provider_name):
+        """
+        Get the pooled ``requests.Session`` for a provider.
+
+        Args:
+            provider_name (str): Provider name
+
+        Returns:
+            requests.Session: Session with a keep-alive connection pool
+        """
+        session = self._sessions.get(provider_name)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(provider_name)
+            if session is None:
+                pool_size = PROVIDER_CONFIGS.get(provider_name, {}).get(
+                    "pool_size", DEFAULT_POOL_SIZE
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[provider_name] = session
+                logger.info(
+                    "Created HTTP session for %s (pool size: %s)", provider_name, pool_size
+                )
+            return session
+
+    def get_async_client(self, provider_name):
+        """
+        Get the pooled ``httpx.AsyncClient`` for a provider on the running loop.
+
+        Args:
+            provider_name (str): Provider name
+
+        Returns:
+            httpx.AsyncClient: Async client with a keep-alive connection pool
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(provider_name)
+            if client is None:
+                pool_size = PROVIDER_CONFIGS.get(provider_name, {}).get(
+                    "pool_size", DEFAULT_POOL_SIZE
+                )
+                connect_timeout, read_timeout = get_provider_timeouts(provider_name)
+                client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=pool_size,
+                        max_keepalive_connections=pool_size,
+                    ),
+                    timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                )
+                clients[provider_name] = client
+            return client
+
+    async def aclose_loop_clients(self):
+        """
+        Close the async clients of the running loop, for loops that end with
+        the request, as under WSGI.
+        """
+        with self._lock:
+            clients = self._async_clients.pop(asyncio.get_running_loop(), {})
+        for provider_name, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.error("Error closing async client for %s: %s", provider_name, e)
+
+    def clear(self):
+        """Close every session and forget all cached services and clients."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._services.clear()
+            self._sessions.clear()
+            self._async_clients = weakref.WeakKeyDictionary()
+
+
+provider_clients = ProviderClientRegistry()
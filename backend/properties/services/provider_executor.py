@@ -0,0 +1,223 @@
+import logging
+import threading
+import concurrent.futures
+from django.conf import settings
+from properties.config.providers import PROVIDER_CONFIGS
+from properties.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorSaturatedError(Exception):
+    """
+    Raised when the provider executor cannot accept more work.
+    """
+
+    def __init__(self, message, retry_after=1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ProviderExecutor:
+    """
+    Long-lived, bounded thread pool shared by every provider call in the process.
+
+    The pool never holds more than ``max_workers + queue_size`` calls (running
+    or waiting), and each provider can additionally be capped with the
+    ``max_concurrency`` key of its ``PROVIDER_CONFIGS`` entry. Submissions over
+    either limit are rejected immediately instead of piling up. Batch calls
+    go through ``submit_batch`` and may only hold ``batch_share`` of each
+    provider's cap, so interactive lookups always find free slots.
+
+    Its depth and rejections are published in ``metrics`` under ``name``.
+    """
+
+    def __init__(
+        self,
+        max_workers,
+        queue_size,
+        retry_after=1,
+        provider_limits=None,
+        name="provider",
+        batch_share=0.5,
+    ):
+        self.name = name
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.retry_after = retry_after
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=name
+        )
+        self._slots = threading.BoundedSemaphore(max_workers + queue_size)
+        self._provider_slots = {
+            provider_name: threading.BoundedSemaphore(limit)
+            for provider_name, limit in (provider_limits or {}).items()
+        }
+        self._batch_slots = {
+            provider_name: threading.BoundedSemaphore(max(1, int(limit * batch_share)))
+            for provider_name, limit in (provider_limits or {}).items()
+        }
+        self._pending_lock = threading.Lock()
+        self._pending = 0
+
+    @property
+    def pending(self):
+        """Number of calls currently running or waiting for a worker."""
+        return self._pending
+
+    def submit(self, provider_name, fn, *args, **kwargs):
+        """
+        Submit a provider call without blocking.
+
+        Args:
+            provider_name (str): Provider name, used for the per-provider cap.
+                None for calls that are not capped per provider.
+            fn (callable): Function to run
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            concurrent.futures.Future: Future for the call
+
+        Raises:
+            ExecutorSaturatedError: If the queue or the provider cap is full
+        """
+        return self._submit(provider_name, None, fn, args, kwargs)
+
+    def _submit(self, provider_name, batch_slot, fn, args, kwargs):
+        if not self._slots.acquire(blocking=False):
+            metrics.record_executor_rejection(self.name)
+            raise ExecutorSaturatedError(
+                "Provider executor queue is full", retry_after=self.retry_after
+            )
+
+        provider_slot = self._provider_slots.get(provider_name)
+        if provider_slot is not None and not provider_slot.acquire(blocking=False):
+            self._slots.release()
+            metrics.record_executor_rejection(self.name)
+            raise ExecutorSaturatedError(
+                f"Concurrency limit reached for {provider_name}",
+                retry_after=self.retry_after,
+            )
+
+        with self._pending_lock:
+            self._pending += 1
+            metrics.set_executor_pending(self.name, self._pending, self.max_workers)
+
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            self._release(provider_slot, batch_slot)
+            raise
+
+        future.add_done_callback(lambda _: self._release(provider_slot, batch_slot))
+        return future
+
+    def submit_batch(self, provider_name, fn, *args, **kwargs):
+        """
+        Submit a provider call of a batch without blocking.
+
+        Batches share at most ``batch_share`` of the provider's cap between
+        them, the rest of it is kept for interactive lookups.
+
+        Args:
+            provider_name (str): Provider name
+            fn (callable): Function to run
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            concurrent.futures.Future: Future for the call
+
+        Raises:
+            ExecutorSaturatedError: If the queue, the provider cap or its
+                batch share is full
+        """
+        batch_slot = self._batch_slots.get(provider_name)
+        if batch_slot is None:
+            return self.submit(provider_name, fn, *args, **kwargs)
+        if not batch_slot.acquire(blocking=False):
+            metrics.record_executor_rejection(self.name)
+            raise ExecutorSaturatedError(
+                f"Batch concurrency limit reached for {provider_name}",
+                retry_after=self.retry_after,
+            )
+        try:
+            return self._submit(provider_name, batch_slot, fn, args, kwargs)
+        except ExecutorSaturatedError:
+            batch_slot.release()
+            raise
+
+    def _release(self, provider_slot, batch_slot=None):
+        if batch_slot is not None:
+            batch_slot.release()
+        with self._pending_lock:
+            self._pending -= 1
+            metrics.set_executor_pending(self.name, self._pending, self.max_workers)
+        if provider_slot is not None:
+            provider_slot.release()
+        self._slots.release()
+
+    def shutdown(self, wait=True):
+        """Shut down the underlying thread pool."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_provider_executor():
+    """
+    Get the process-wide provider executor, creating it on first use.
+
+    Returns:
+        ProviderExecutor: Shared executor configured from settings
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ProviderExecutor(
+                    max_workers=getattr(settings, "PROVIDER_EXECUTOR_MAX_WORKERS", 32),
+                    queue_size=getattr(settings, "PROVIDER_EXECUTOR_QUEUE_SIZE", 64),
+                    retry_after=getattr(settings, "PROVIDER_EXECUTOR_RETRY_AFTER", 1),
+                    provider_limits={
+                        provider_name: config["max_concurrency"]
+                        for provider_name, config in PROVIDER_CONFIGS.items()
+                        if config.get("max_concurrency")
+                    },
+                    batch_share=getattr(settings, "BATCH_PROVIDER_SHARE", 0.5),
+                )
+                logger.info(
+                    "Created provider executor (workers: %s, queue: %s)",
+                    _executor.max_workers,
+                    _executor.queue_size,
+                )
+    return _executor
+
+
+_refresh_executor = None
+
+
+def get_refresh_executor():
+    """
+    Get the process-wide executor for background cache refreshes.
+
+    Refreshes wait on provider calls running in the provider executor, so they
+    get their own small pool and can never starve those calls of threads.
+
+    Returns:
+        ProviderExecutor: Shared refresh executor configured from settings
+    """
+    global _refresh_executor
+    if _refresh_executor is None:
+        with _executor_lock:
+            if _refresh_executor is None:
+                _refresh_executor = ProviderExecutor(
+                    max_workers=getattr(settings, "REFRESH_EXECUTOR_MAX_WORKERS", 4),
+                    queue_size=getattr(settings, "REFRESH_EXECUTOR_QUEUE_SIZE", 64),
+                    retry_after=getattr(settings, "PROVIDER_EXECUTOR_RETRY_AFTER", 1),
+                    name="refresh",
+                )
+    return _refresh_executor
@@ -0,0 +1,234 @@
+import logging
+import math
+import threading
+from collections import deque
+from django.conf import settings
+from properties.config.providers import PROVIDER_CONFIGS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 30  # seconds
+# Observations between two recomputations of a provider's percentiles
+PERCENTILE_REFRESH_INTERVAL = 16
+# Hedges a provider may bank while it is quiet, on top of its steady budget
+HEDGE_BUDGET_BURST = 10
+
+
+class LatencyWindow:
+    """
+    Rolling window of the most recent call latencies of one provider.
+
+    Percentiles are read on every request but the window changes on every
+    call too, so the sorted snapshot they are read from is only rebuilt every
+    ``PERCENTILE_REFRESH_INTERVAL`` observations.
+    """
+
+    def __init__(self, size):
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=size)
+        self._sorted = []
+        self._unsorted = 0
+
+    def observe(self, seconds):
+        """
+        Record the latency of one call.
+
+        Args:
+            seconds (float): Call duration
+        """
+        with self._lock:
+            self._samples.append(seconds)
+            self._unsorted += 1
+
+    def __len__(self):
+        return len(self._samples)
+
+    def percentile(self, percent):
+        """
+        Get a latency percentile of the window (nearest rank).
+
+        Args:
+            percent (float): Percentile between 0 and 100
+
+        Returns:
+            float: Latency in seconds, None while the window is empty
+        """
+        with self._lock:
+            if self._unsorted >= PERCENTILE_REFRESH_INTERVAL or len(self._sorted) < min(
+                len(self._samples), PERCENTILE_REFRESH_INTERVAL
+            ):
+                self._sorted = sorted(self._samples)
+                self._unsorted = 0
+            snapshot = self._sorted
+        if not snapshot:
+            return None
+        rank = max(math.ceil(percent / 100 * len(snapshot)), 1)
+        return snapshot[rank - 1]
+
+
+class HedgeBudget:
+    """
+    Caps hedged calls to a share of the primary calls of a provider.
+
+    Every primary call earns ``ratio`` of a hedge, and a hedge can only be sent
+    while a whole one has been earned, so over time hedges never add more than
+    ``ratio`` extra calls (plus a small burst banked while traffic is calm).
+    """
+
+    def __init__(self, ratio, burst=HEDGE_BUDGET_BURST):
+        self._lock = threading.Lock()
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = 0.0
+
+    def record_call(self):
+        """Earn budget for one primary call."""
+        with self._lock:
+            self._tokens = min(self._tokens + self.ratio, self.burst)
+
+    def try_acquire(self):
+        """
+        Spend budget for one hedged call.
+
+        Returns:
+            bool: True if the hedge may be sent
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class ProviderLatencyRegistry:
+    """
+    Process-wide latency windows and hedge budgets of the providers, from
+    which call timeouts and hedge delays are derived.
+
+    Until a provider has ``PROVIDER_LATENCY_MIN_SAMPLES`` observations its
+    configured timeout is used and no hedges are sent.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._windows = {}
+        self._budgets = {}
+
+    def _window(self, provider_name):
+        window = self._windows.get(provider_name)
+        if window is None:
+            with self._lock:
+                window = self._windows.setdefault(
+                    provider_name,
+                    LatencyWindow(getattr(settings, "PROVIDER_LATENCY_WINDOW", 500)),
+                )
+        return window
+
+    def _budget(self, provider_name):
+        budget = self._budgets.get(provider_name)
+        if budget is None:
+            with self._lock:
+                budget = self._budgets.setdefault(
+                    provider_name,
+                    HedgeBudget(getattr(settings, "HEDGE_MAX_EXTRA_PERCENT", 5) / 100),
+                )
+        return budget
+
+    def _warm_percentile(self, provider_name, percent):
+        window = self._window(provider_name)
+        if len(window) < getattr(settings, "PROVIDER_LATENCY_MIN_SAMPLES", 50):
+            return None
+        return window.percentile(percent)
+
+    def observe(self, provider_name, seconds):
+        """
+        Record the latency of a provider call. Calls that timed out should be
+        recorded with the timeout they hit, so a slowing provider pushes its
+        own timeout up.
+
+        Args:
+            provider_name (str): Provider name
+            seconds (float): Call duration
+        """
+        self._window(provider_name).observe(seconds)
+
+    def percentile(self, provider_name, percent):
+        """
+        Get a latency percentile of a provider.
+
+        Args:
+            provider_name (str): Provider name
+            percent (float): Percentile between 0 and 100
+
+        Returns:
+            float: Latency in seconds, None without observations
+        """
+        return self._window(provider_name).percentile(percent)
+
+    def timeout(self, provider_name):
+        """
+        Get the timeout of the next call to a provider: a multiple of its
+        PROVIDER_TIMEOUT_PERCENTILE latency, within PROVIDER_TIMEOUT_MIN and
+        the timeout configured in PROVIDER_CONFIGS.
+
+        Args:
+            provider_name (str): Provider name
+
+        Returns:
+            float: Timeout in seconds
+        """
+        configured = PROVIDER_CONFIGS.get(provider_name, {}).get("timeout", DEFAULT_TIMEOUT)
+        if not getattr(settings, "ADAPTIVE_TIMEOUTS_ENABLED", True):
+            return configured
+        latency = self._warm_percentile(
+            provider_name, getattr(settings, "PROVIDER_TIMEOUT_PERCENTILE", 99)
+        )
+        if latency is None:
+            return configured
+        adaptive = latency * getattr(settings, "PROVIDER_TIMEOUT_MULTIPLIER", 2)
+        return min(max(adaptive, getattr(settings, "PROVIDER_TIMEOUT_MIN", 1)), configured)
+
+    def hedge_delay(self, provider_name):
+        """
+        Get how long to wait for a call to a provider before hedging it.
+
+        Args:
+            provider_name (str): Provider name
+
+        Returns:
+            float: Seconds after which a hedge may be sent, None if hedging is
+                disabled or the provider has too few observations
+        """
+        if not getattr(settings, "HEDGING_ENABLED", True):
+            return None
+        return self._warm_percentile(
+            provider_name, getattr(settings, "HEDGE_PERCENTILE", 95)
+        )
+
+    def record_call(self, provider_name):
+        """Record a primary call to a provider, earning hedge budget."""
+        self._budget(provider_name).record_call()
+
+    def try_hedge(self, provider_name):
+        """
+        Reserve budget for one hedged call to a provider.
+
+        Args:
+            provider_name (str): Provider name
+
+        Returns:
+            bool: True if the hedge may be sent
+        """
+        if self._budget(provider_name).try_acquire():
+            return True
+        logger.debug("Hedge budget of %s exhausted", provider_name)
+        return False
+
+    def clear(self):
+        """Forget every observation and budget."""
+        with self._lock:
+            self._windows.clear()
+            self._budgets.clear()
+
+
+provider_latency = ProviderLatencyRegistry()
@@ -0,0 +1,193 @@
+import asyncio
+import logging
+import time
+from django.conf import settings
+from properties.config.providers import PROVIDER_CONFIGS
+from properties.services.cache_service import get_async_redis_client, get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Priorities of provider calls, from the one served first
+INTERACTIVE = "interactive"
+BATCH = "batch"
+BACKGROUND = "background"
+
+# Refill the bucket for the time elapsed since it was last used, then take a
+# token if more than the tokens reserved for higher priorities are left.
+# Returns 0 once a token is taken, otherwise the seconds until one can be.
+# The clock is Redis' own, so every worker refills the bucket alike.
+TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local reserve = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(now - ts, 0) * rate)
+local wait = 0
+if tokens >= 1 + reserve then
+    tokens = tokens - 1
+else
+    wait = (1 + reserve - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+# Empty the bucket, e.g. after the provider answered 429
+DRAIN_SCRIPT = """
+local clock = redis.call('TIME')
+redis.call('HSET', KEYS[1], 'tokens', 0, 'ts', tonumber(clock[1]) + tonumber(clock[2]) / 1000000)
+redis.call('PEXPIRE', KEYS[1], tonumber(ARGV[1]))
+return 1
+"""
+
+
+class ProviderRateLimiter:
+    """
+    Token buckets metering the calls made to each provider by every worker,
+    kept in Redis.
+
+    A provider's bucket refills at ``rate_limit`` calls per second up to
+    ``rate_burst`` calls, both set in its ``PROVIDER_CONFIGS`` entry, so the
+    workers together never exceed its quota. Providers without ``rate_limit``
+    are not metered.
+
+    Interactive calls may take any token. Batch and background calls leave
+    ``RATE_LIMIT_RESERVED_PERCENT`` of the burst to interactive ones, so they
+    slow down first when the quota runs short. A call without a token waits
+    for one up to ``RATE_LIMIT_MAX_WAIT`` of its priority, then is shed.
+
+    When Redis is unavailable every call is let through.
+    """
+
+    @staticmethod
+    def get_key(provider_name):
+        """
+        Generate the key of a provider's bucket.
+
+        Args:
+            provider_name (str): Provider name
+
+        Returns:
+            str: Redis key
+        """
+        return f"ratelimit:{provider_name}"
+
+    @staticmethod
+    def _limits(provider_name):
+        if not getattr(settings, "RATE_LIMIT_ENABLED", True):
+            return None
+        config = PROVIDER_CONFIGS.get(provider_name, {})
+        rate = config.get("rate_limit")
+        if not rate:
+            return None
+        return rate, config.get("rate_burst", rate)
+
+    def _take_args(self, provider_name, limits, priority):
+        rate, burst = limits
+        reserve = 0
+        if priority != INTERACTIVE:
+            reserve = burst * getattr(settings, "RATE_LIMIT_RESERVED_PERCENT", 20) / 100
+        return TAKE_SCRIPT, 1, self.get_key(provider_name), rate, burst, reserve
+
+    @staticmethod
+    def _max_wait(priority):
+        return getattr(settings, "RATE_LIMIT_MAX_WAIT", {}).get(priority, 0)
+
+    def acquire(self, provider_name, priority=INTERACTIVE):
+        """
+        Take a token for one call to a provider, waiting for it if the
+        priority allows.
+
+        Args:
+            provider_name (str): Provider name
+            priority (str): ``interactive``, ``batch`` or ``background``
+
+        Returns:
+            bool: True if the call may be made, False if it is shed
+        """
+        limits = self._limits(provider_name)
+        if limits is None:
+            return True
+
+        give_up_at = time.monotonic() + self._max_wait(priority)
+        try:
+            client = get_redis_client()
+            while True:
+                wait = float(client.eval(*self._take_args(provider_name, limits, priority)))
+                if wait == 0:
+                    return True
+                if time.monotonic() + wait > give_up_at:
+                    logger.warning(
+                        "Rate limit of %s reached, shedding %s call", provider_name, priority
+                    )
+                    return False
+                time.sleep(wait)
+        except Exception as e:
+            logger.error("Error reading rate limit of %s: %s", provider_name, e)
+            return True
+
+    async def aacquire(self, provider_name, priority=INTERACTIVE):
+        """Asyncio version of ``acquire``."""
+        limits = self._limits(provider_name)
+        if limits is None:
+            return True
+
+        give_up_at = time.monotonic() + self._max_wait(priority)
+        client = get_async_redis_client()
+        try:
+            while True:
+                wait = float(await client.eval(*self._take_args(provider_name, limits, priority)))
+                if wait == 0:
+                    return True
+                if time.monotonic() + wait > give_up_at:
+                    logger.warning(
+                        "Rate limit of %s reached, shedding %s call", provider_name, priority
+                    )
+                    return False
+                await asyncio.sleep(wait)
+        except Exception as e:
+            logger.error("Error reading rate limit of %s: %s", provider_name, e)
+            return True
+        finally:
+            await client.aclose()
+
+    def _drain_args(self, provider_name, limits):
+        rate, burst = limits
+        return DRAIN_SCRIPT, 1, self.get_key(provider_name), int(burst / rate * 1000) + 1000
+
+    def drain(self, provider_name):
+        """
+        Empty a provider's bucket after it rejected a call for exceeding the
+        quota, so every worker backs off until it refills.
+
+        Args:
+            provider_name (str): Provider name
+        """
+        limits = self._limits(provider_name)
+        if limits is None:
+            return
+        try:
+            get_redis_client().eval(*self._drain_args(provider_name, limits))
+        except Exception as e:
+            logger.error("Error draining rate limit of %s: %s", provider_name, e)
+
+    async def adrain(self, provider_name):
+        """Asyncio version of ``drain``."""
+        limits = self._limits(provider_name)
+        if limits is None:
+            return
+        client = get_async_redis_client()
+        try:
+            await client.eval(*self._drain_args(provider_name, limits))
+        except Exception as e:
+            logger.error("Error draining rate limit of %s: %s", provider_name, e)
+        finally:
+            await client.aclose()
+
+
+rate_limiter = ProviderRateLimiter()
@@ -0,0 +1,169 @@
+import asyncio
+import logging
+import threading
+import concurrent.futures
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls sharing a key inside the process.
+
+    The first caller for a key (the leader) runs the function; callers arriving
+    while it runs (the followers) wait for the leader's result instead of
+    running the function again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, timeout=None, on_timeout=None):
+        """
+        Run ``fn`` once for every group of concurrent callers sharing ``key``.
+
+        Args:
+            key (str): Coalescing key
+            fn (callable): Function to run, without arguments
+            timeout (float, optional): Seconds a follower waits for the leader
+            on_timeout (callable, optional): Returns the result of a follower
+                the leader did not answer in time, without arguments. The
+                follower never runs ``fn`` itself, which would call the
+                providers a second time for the same key.
+
+        Returns:
+            object: Result of ``fn``, shared by the leader and its followers.
+                Callers must not mutate it.
+
+        Raises:
+            concurrent.futures.TimeoutError: If a follower timed out and no
+                ``on_timeout`` was given
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = concurrent.futures.Future()
+                self._calls[key] = future
+
+        if not leader:
+            logger.debug("Waiting for in-flight call for %s", key)
+            try:
+                return future.result(timeout=timeout)
+            except concurrent.futures.TimeoutError:
+                logger.warning("Timeout waiting for in-flight call for %s", key)
+                if on_timeout is None:
+                    raise
+                return on_timeout()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    async def ado(self, key, fn, timeout=None, on_timeout=None):
+        """
+        Asyncio version of ``do``, coalescing with the sync callers of the
+        same key.
+
+        Args:
+            key (str): Coalescing key
+            fn (callable): Coroutine function to run, without arguments
+            timeout (float, optional): Seconds a follower waits for the leader
+            on_timeout (callable, optional): Returns the result of a follower
+                the leader did not answer in time, without arguments
+
+        Returns:
+            object: Result of ``fn``, shared by the leader and its followers.
+                Callers must not mutate it.
+
+        Raises:
+            asyncio.TimeoutError: If a follower timed out and no
+                ``on_timeout`` was given
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = concurrent.futures.Future()
+                self._calls[key] = future
+
+        if not leader:
+            logger.debug("Waiting for in-flight call for %s", key)
+            try:
+                # Shielded, so a follower giving up does not cancel the call
+                return await asyncio.wait_for(
+                    asyncio.shield(asyncio.wrap_future(future)), timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Timeout waiting for in-flight call for %s", key)
+                if on_timeout is None:
+                    raise
+                return on_timeout()
+
+        try:
+            result = await fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def submit(self, key, fn, schedule):
+        """
+        Run ``fn`` in the background unless a call for ``key`` is in flight.
+
+        Args:
+            key (str): Coalescing key
+            fn (callable): Function to run, without arguments
+            schedule (callable): Schedules a callable to run in the background,
+                for example an executor's ``submit``
+
+        Returns:
+            concurrent.futures.Future: Future of the new or in-flight call
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future
+            future = concurrent.futures.Future()
+            self._calls[key] = future
+
+        def run():
+            try:
+                result = fn()
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+            finally:
+                with self._lock:
+                    self._calls.pop(key, None)
+
+        try:
+            schedule(run)
+        except BaseException:
+            with self._lock:
+                self._calls.pop(key, None)
+            raise
+        return future
+
+    def in_flight(self):
+        """Number of keys currently being computed."""
+        with self._lock:
+            return len(self._calls)
+
+
+provider_fetches = SingleFlight()
@@ -0,0 +1,13 @@
+# Batch lookup settings
+BATCH_MAX_ADDRESSES = 1000  # Maximum number of addresses accepted per batch request
+BATCH_MAX_CONCURRENCY = 32  # Provider calls in flight at once for a single batch
+BATCH_DEADLINE = 120  # seconds, budget of a batch that does not ask for one (1000 addresses at 10 calls/s per provider take 100s)
+BATCH_DEADLINE_MAX = 600  # seconds, largest budget a batch may ask for with ?deadline=
+BATCH_PROVIDER_SHARE = 0.5  # Share of each provider's max_concurrency all batches may hold, the rest is kept for interactive lookups
+
+# Cache warming (manage.py warm_cache)
+WARM_BATCH_SIZE = 200  # Addresses checked and fetched together
+WARM_MAX_CONCURRENCY = 8  # Provider calls in flight, leaving the executor to live traffic
+WARM_BATCH_TIMEOUT = 120  # seconds allowed for the provider calls of one batch
+WARM_RETRIES = 3  # Attempts for addresses whose results were partial (rate limited, timeout)
+WARM_RETRY_DELAY = 2  # seconds before retrying, doubled on every attempt
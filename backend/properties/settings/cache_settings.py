@@ -5,9 +5,16 @@ REDIS_DB = 0
 REDIS_PASSWORD = None
 REDIS_TIMEOUT = 5  # seconds
 
+# Redis connection pool (one per worker process)
+REDIS_MAX_CONNECTIONS = 50
+REDIS_HEALTH_CHECK_INTERVAL = 30  # seconds between PINGs on idle connections
+REDIS_SOCKET_KEEPALIVE = True
+REDIS_USE_DJANGO_CACHE = False  # Reuse the django_redis "default" pool in CacheService
+
 # Cache settings
 CACHE_ENABLED = True
 PROPERTY_CACHE_TTL = 86400  # 24 hours because providers data changes daily
+PROPERTY_CACHE_STALE_TTL = 21600  # 6 hours past PROPERTY_CACHE_TTL served stale while refreshing
 
 # Django Cache Configuration
 CACHES = {
@@ -18,6 +25,23 @@ CACHES = {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
             "SOCKET_CONNECT_TIMEOUT": REDIS_TIMEOUT,
             "SOCKET_TIMEOUT": REDIS_TIMEOUT,
+            "CONNECTION_POOL_KWARGS": {
+                "max_connections": REDIS_MAX_CONNECTIONS,
+                "health_check_interval": REDIS_HEALTH_CHECK_INTERVAL,
+                "socket_keepalive": REDIS_SOCKET_KEEPALIVE,
+            },
         },
     }
 }
+
+# In-process L1 cache in front of Redis (one per worker process)
+L1_CACHE_ENABLED = False
+L1_CACHE_MAX_ENTRIES = 1024
+L1_CACHE_TTL = 60  # seconds, capped by PROPERTY_CACHE_TTL
+L1_CACHE_INVALIDATION_CHANNEL = "property:invalidate"  # Redis pub/sub channel
+
+# Cached payload encoding. Values carry a header naming their codec, so these
+# can change without flushing the cache.
+CACHE_CODEC = "orjson"  # "json", "orjson" or "msgpack" (pip install msgpack)
+CACHE_COMPRESSION = "zlib"  # "none", "zlib", "zstd" (pip install zstandard) or "lz4"
+CACHE_COMPRESSION_THRESHOLD = 1024  # bytes, smaller payloads are stored uncompressed
@@ -0,0 +1,6 @@
+# Provider circuit breakers, shared by every worker through Redis
+CIRCUIT_BREAKER_ENABLED = True
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5  # failures within the window that open the circuit
+CIRCUIT_BREAKER_FAILURE_WINDOW = 30  # seconds
+CIRCUIT_BREAKER_OPEN_SECONDS = 30  # seconds calls fail fast before a probe is sent
+CIRCUIT_BREAKER_PROBE_TIMEOUT = 35  # seconds, should outlive the slowest provider call
@@ -0,0 +1,3 @@
+# Request deadline, shared by every provider call made for a request
+REQUEST_DEADLINE = 10  # seconds, budget of a request that does not ask for one
+REQUEST_DEADLINE_MAX = 30  # seconds, largest budget a request may ask for with ?deadline=
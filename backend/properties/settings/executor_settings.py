@@ -0,0 +1,8 @@
+# Provider executor settings (shared by every request in a worker process)
+PROVIDER_EXECUTOR_MAX_WORKERS = 32  # Threads calling providers at once
+PROVIDER_EXECUTOR_QUEUE_SIZE = 64  # Calls allowed to wait for a free thread
+PROVIDER_EXECUTOR_RETRY_AFTER = 1  # seconds, sent as Retry-After when saturated
+
+# Background refresh of stale cache entries
+REFRESH_EXECUTOR_MAX_WORKERS = 4  # Addresses refreshed at once
+REFRESH_EXECUTOR_QUEUE_SIZE = 64  # Refreshes allowed to wait, later ones are skipped
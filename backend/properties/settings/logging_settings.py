@@ -0,0 +1,3 @@
+# Request logging
+LOG_REQUEST_SUMMARY = True  # one INFO record per request with its outcome and timing
+LOG_PAYLOAD_SAMPLE_RATE = 0.0  # share of requests dumping provider payloads at DEBUG
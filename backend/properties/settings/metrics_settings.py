@@ -0,0 +1,8 @@
+# Prometheus metrics served at /metrics (pip install prometheus-client). Under
+# gunicorn, point PROMETHEUS_MULTIPROC_DIR at an empty directory shared by the
+# workers and call properties.utils.metrics.mark_process_dead from its
+# child_exit hook, so every worker's values are aggregated.
+METRICS_ENABLED = True  # no-op without prometheus_client
+METRICS_LATENCY_BUCKETS = (  # seconds, for provider, Redis and request durations
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30,
+)
@@ -0,0 +1,6 @@
+# Durable provider data in the Django database, read when Redis misses
+PROPERTY_STORE_ENABLED = False  # needs its table: python manage.py migrate --run-syncdb
+PROPERTY_STORE_TTL = 60 * 60 * 24 * 30  # seconds a stored record is served (30 days)
+PROPERTY_STORE_BATCH_SIZE = 500  # records per bulk upsert
+PROPERTY_STORE_FLUSH_INTERVAL = 1.0  # seconds between write-behind flushes
+PROPERTY_STORE_MAX_PENDING = 10000  # buffered records per worker, newer ones are dropped
@@ -0,0 +1,12 @@
+# Adaptive provider timeouts, derived from each provider's recent latency
+ADAPTIVE_TIMEOUTS_ENABLED = True
+PROVIDER_LATENCY_WINDOW = 500  # most recent calls kept per provider
+PROVIDER_LATENCY_MIN_SAMPLES = 50  # calls observed before the configured timeout is replaced
+PROVIDER_TIMEOUT_PERCENTILE = 99  # latency percentile the timeout is based on
+PROVIDER_TIMEOUT_MULTIPLIER = 2  # timeout = multiplier x percentile latency
+PROVIDER_TIMEOUT_MIN = 1  # seconds, the timeout in PROVIDER_CONFIGS is the maximum
+
+# Hedged requests: one duplicate call once a call is slower than usual
+HEDGING_ENABLED = True
+HEDGE_PERCENTILE = 95  # latency percentile after which a call is hedged
+HEDGE_MAX_EXTRA_PERCENT = 5  # hedges allowed per 100 calls to a provider
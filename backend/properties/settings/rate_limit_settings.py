@@ -0,0 +1,9 @@
+# Provider rate limiting, shared by every worker through Redis. Each provider's
+# quota is set with the rate_limit and rate_burst keys of PROVIDER_CONFIGS.
+RATE_LIMIT_ENABLED = True
+RATE_LIMIT_RESERVED_PERCENT = 20  # share of the burst only interactive calls may use
+RATE_LIMIT_MAX_WAIT = {  # seconds a call may wait for a token before it is shed
+    "interactive": 0.5,
+    "batch": 1,
+    "background": 0,  # background refreshes are skipped rather than hold a thread
+}
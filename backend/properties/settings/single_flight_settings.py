@@ -0,0 +1,5 @@
+# Request coalescing for concurrent lookups of the same address
+SINGLE_FLIGHT_ENABLED = True
+SINGLE_FLIGHT_LOCK_TTL = 35  # seconds, should outlive the slowest provider call
+SINGLE_FLIGHT_WAIT_TIMEOUT = 35  # seconds a follower waits for the leader
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05  # seconds between cache checks of a follower in another worker
@@ -1,13 +1,65 @@
+import asyncio
 import json
+import threading
+import time
 import concurrent.futures
-from unittest.mock import patch, MagicMock
-from django.test import TestCase
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest import mock, skipUnless
+from unittest.mock import patch, MagicMock, AsyncMock
+import requests
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import OperationalError
+from django.test import TestCase, AsyncRequestFactory, RequestFactory
 from django.http import QueryDict
+from django.utils import timezone
 from rest_framework.test import APIRequestFactory
-from rest_framework import status
-from properties.views import PropertyDetailsView
+from rest_framework import serializers, status
+from properties.views import (
+    PropertyLookupMixin,
+    PropertyDetailsView,
+    PropertyBatchView,
+    AsyncPropertyDetailsView,
+    MetricsView,
+)
+from properties.serializers.properties_serializer import PropertyDetailsSerializer
+from properties.serializers.lean_serializer import (
+    LeanSerializer,
+    property_details_serializer,
+)
+from properties.services import cache_service
 from properties.services.cache_service import CacheService
+from properties.services.cache_codecs import COMPRESSORS, CacheValueCodec
+from properties.services.local_cache import LocalCache
+from properties.services.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    ProviderCircuitBreaker,
+    circuit_breaker,
+)
+from properties.services.provider_clients import provider_clients
+from properties.services.provider_latency import (
+    HedgeBudget,
+    LatencyWindow,
+    provider_latency,
+)
+from properties.services.property_store import PropertyStore
+from properties.services.rate_limiter import ProviderRateLimiter, rate_limiter
+from properties.services.single_flight import SingleFlight, provider_fetches
+from properties.services.provider_executor import (
+    ProviderExecutor,
+    ExecutorSaturatedError,
+)
+from properties.utils import metrics, request_log
 from properties.utils.data_procesor import DataProcessor
+from properties.utils.deadline import Deadline, request_deadline
+from properties.utils.address_normalizer import normalize_address
+from properties.config.providers import PROVIDER_CONFIGS
+from properties.models import PropertyRecord
 
 
 class PropertyDetailsViewTest(TestCase):
@@ -15,6 +67,10 @@ class PropertyDetailsViewTest(TestCase):
 
     def setUp(self):
         """Set up test environment."""
+        # Services are cached process-wide, start every test from scratch
+        provider_clients.clear()
+        self.addCleanup(provider_clients.clear)
+
         # Use APIRequestFactory
         self.factory = APIRequestFactory()
 
@@ -102,11 +158,11 @@ class PropertyDetailsViewTest(TestCase):
         # Verify cache was not accessed
         mock_cache_get.assert_not_called()
 
-    @patch.object(CacheService, "get")
-    def test_get_cache_miss(self, mock_cache_get):
+    @patch.object(CacheService, "get_response_with_staleness")
+    def test_get_cache_miss(self, mock_cache_get_many):
         """Test GET request with cache miss."""
-        # Mock cache service to return None (cache miss)
-        mock_cache_get.return_value = None
+        # Mock cache service to return no entries (cache miss)
+        mock_cache_get_many.return_value = (None, {})
 
         # Create a real view for this test
         view = PropertyDetailsView()
@@ -123,8 +179,8 @@ class PropertyDetailsViewTest(TestCase):
                 side_effect=[self.standardized_data[0], self.standardized_data[1]],
             ):
 
-                # Mock CacheService.set
-                with patch.object(CacheService, "set") as mock_cache_set:
+                # Mock CacheService.set_many
+                with patch.object(CacheService, "set_many") as mock_cache_set_many:
 
                     # Mock PropertyDetailsSerializer
                     with patch(
@@ -158,14 +214,26 @@ class PropertyDetailsViewTest(TestCase):
         # Assert response
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        # Verify cache was checked
-        mock_cache_get.assert_called_once_with(self.test_address)
+        # Verify the response body, combined and provider entries were read
+        # in one round-trip
+        mock_cache_get_many.assert_called_once_with(
+            self.test_address,
+            [
+                (self.test_address, None),
+                (self.test_address, "provider1"),
+                (self.test_address, "provider2"),
+            ]
+        )
 
         # Verify provider data was fetched
-        mock_fetch_provider_data.assert_called_once_with(self.test_address)
+        mock_fetch_provider_data.assert_called_once_with(
+            self.test_address, {}, mock.ANY, "interactive"
+        )
 
-        # Verify data was cached
-        self.assertTrue(mock_cache_set.called)
+        # Verify data was cached in one round-trip
+        mock_cache_set_many.assert_called_once()
+        cache_writes = mock_cache_set_many.call_args[0][0]
+        self.assertIn((self.test_address, None), cache_writes)
 
     @patch.object(CacheService, "get")
     @patch.object(PropertyDetailsView, "get")
@@ -206,15 +274,15 @@ class PropertyDetailsViewTest(TestCase):
         # Verify cache was checked
         mock_cache_get.assert_called_once_with(self.test_address)
 
-    @patch("concurrent.futures.ThreadPoolExecutor")
-    @patch.object(CacheService, "get")
+    @patch("properties.views.get_provider_executor")
+    @patch.object(CacheService, "get_many")
     @patch.object(DataProcessor, "load_service_class")
     def test_fetch_provider_data(
         self, mock_load_service_class, mock_cache_get, mock_executor
     ):
         """Test _fetch_provider_data method."""
-        # Mock cache service to return None for each provider
-        mock_cache_get.return_value = None
+        # Mock cache service to return no provider entries
+        mock_cache_get.return_value = {}
 
         # Mock service classes
         mock_service1 = MagicMock()
@@ -233,16 +301,16 @@ class PropertyDetailsViewTest(TestCase):
             lambda: mock_service2,
         ]
 
-        # Mock ThreadPoolExecutor
+        # Mock the shared provider executor
         mock_executor_instance = MagicMock()
-        mock_executor.return_value.__enter__.return_value = mock_executor_instance
+        mock_executor.return_value = mock_executor_instance
 
-        # Mock futures
-        mock_future1 = MagicMock()
-        mock_future1.result.return_value = self.sample_provider_data["provider1"]
+        # Completed futures
+        mock_future1 = concurrent.futures.Future()
+        mock_future1.set_result(self.sample_provider_data["provider1"])
 
-        mock_future2 = MagicMock()
-        mock_future2.result.return_value = self.sample_provider_data["provider2"]
+        mock_future2 = concurrent.futures.Future()
+        mock_future2.set_result(self.sample_provider_data["provider2"])
 
         # Mock submit to return futures
         mock_executor_instance.submit.side_effect = [mock_future1, mock_future2]
@@ -270,15 +338,15 @@ class PropertyDetailsViewTest(TestCase):
         self.assertEqual(results["provider1"], self.sample_provider_data["provider1"])
         self.assertEqual(results["provider2"], self.sample_provider_data["provider2"])
 
-    @patch("concurrent.futures.ThreadPoolExecutor")
-    @patch.object(CacheService, "get")
+    @patch("properties.views.get_provider_executor")
+    @patch.object(CacheService, "get_many")
     @patch.object(DataProcessor, "load_service_class")
     def test_fetch_provider_data_timeout(
         self, mock_load_service_class, mock_cache_get, mock_executor
     ):
         """Test _fetch_provider_data method with timeout."""
-        # Mock cache service to return None
-        mock_cache_get.return_value = None
+        # Mock cache service to return no provider entries
+        mock_cache_get.return_value = {}
 
         # Mock service class
         mock_service = MagicMock()
@@ -286,44 +354,32 @@ class PropertyDetailsViewTest(TestCase):
         # Mock load_service_class to return service class
         mock_load_service_class.return_value = lambda: mock_service
 
-        # Mock ThreadPoolExecutor
+        # Mock the shared provider executor
         mock_executor_instance = MagicMock()
-        mock_executor.return_value.__enter__.return_value = mock_executor_instance
+        mock_executor.return_value = mock_executor_instance
 
-        # Mock future to raise TimeoutError
-        mock_future = MagicMock()
-        mock_future.result.side_effect = concurrent.futures.TimeoutError()
-
-        # Mock submit to return future
-        mock_executor_instance.submit.return_value = mock_future
-
-        # Mock PROVIDER_CONFIGS with just one provider
-        provider_configs = {
-            "provider1": {
-                "service_class": "properties.services.provider1_service.Provider1Service",
-                "mapping": {},
-                "timeout": 10,
-            }
-        }
+        # Futures that never complete
+        mock_executor_instance.submit.side_effect = (
+            lambda *args, **kwargs: concurrent.futures.Future()
+        )
 
-        with patch("properties.config.providers.PROVIDER_CONFIGS", provider_configs):
-            # Call method
-            view = PropertyDetailsView()
-            results = view._fetch_provider_data(self.test_address)
+        # Call method with a request deadline that expires right away
+        view = PropertyDetailsView()
+        results = view._fetch_provider_data(self.test_address, {}, Deadline(0.01))
 
         # Verify results contain error for timed out provider
         self.assertIn("error", results["provider1"])
         self.assertIn("Timeout", results["provider1"]["error"])
 
-    @patch("concurrent.futures.ThreadPoolExecutor")
-    @patch.object(CacheService, "get")
+    @patch("properties.views.get_provider_executor")
+    @patch.object(CacheService, "get_many")
     @patch.object(DataProcessor, "load_service_class")
     def test_fetch_provider_data_exception(
         self, mock_load_service_class, mock_cache_get, mock_executor
     ):
         """Test _fetch_provider_data method with exception."""
-        # Mock cache service to return None
-        mock_cache_get.return_value = None
+        # Mock cache service to return no provider entries
+        mock_cache_get.return_value = {}
 
         # Mock load_service_class to raise exception
         mock_load_service_class.side_effect = Exception("Test exception")
@@ -379,3 +435,2537 @@ class PropertyDetailsViewTest(TestCase):
         mock_response.status_code = status_code
         mock_response.data = data
         return mock_response
+
+
+class PropertyBatchViewTest(TestCase):
+    """Test cases for PropertyBatchView."""
+
+    def setUp(self):
+        """Set up test environment."""
+        # Services are cached process-wide, start every test from scratch
+        provider_clients.clear()
+        self.addCleanup(provider_clients.clear)
+
+        self.factory = APIRequestFactory()
+        self.cached_results = [
+            {"provider": "Provider 1", "bedrooms": 3, "cached": False},
+        ]
+        self.provider_results = {
+            "provider1": {"error": "Timeout fetching data from provider1"},
+        }
+
+    def _post(self, payload):
+        """Send a batch request through the view."""
+        request = self.factory.post("/properties/batch/", payload, format="json")
+        return PropertyBatchView.as_view()(request)
+
+    def test_missing_addresses(self):
+        """Test batch request without an address list."""
+        response = self._post({})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data, {"error": "Missing or empty addresses parameter"}
+        )
+
+    def test_non_object_body(self):
+        """Test batch request whose JSON body is not an object."""
+        response = self._post(["1 A St", "2 B St"])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {"error": "Request body must be a JSON object"})
+
+    def test_too_many_addresses(self):
+        """Test batch request over the configured size limit."""
+        with self.settings(BATCH_MAX_ADDRESSES=2):
+            response = self._post({"addresses": ["1 A St", "2 B St", "3 C St"]})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_address(self):
+        """Test batch request containing a blank address."""
+        response = self._post({"addresses": ["1 A St", "  "]})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch.object(CacheService, "set_many")
+    @patch.object(PropertyBatchView, "_fetch_provider_data_many")
+    @patch.object(CacheService, "get_many_with_staleness")
+    def test_only_misses_are_fetched(self, mock_get_many, mock_fetch_many, mock_set):
+        """Test that cache hits are served in bulk and only misses are fetched."""
+        mock_get_many.return_value = {("1 A St", None): (self.cached_results, False)}
+        mock_fetch_many.return_value = {"2 B St": self.provider_results}
+
+        response = self._post({"addresses": ["1 A St", "2 B St", "2  b st"]})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # One bulk cache read for the deduplicated addresses
+        self.assertEqual(
+            list(mock_get_many.call_args[0][0]),
+            PropertyBatchView._cache_lookups("1 A St")
+            + PropertyBatchView._cache_lookups("2 B St"),
+        )
+        mock_fetch_many.assert_called_once_with(
+            ["2 B St"], mock_get_many.return_value, mock.ANY, "batch", None
+        )
+
+        # One pipelined write for every fetched entry
+        mock_set.assert_called_once_with(
+            {("2 B St", None): mock.ANY}, responses={"2 B St": mock.ANY}
+        )
+
+        results = response.data["results"]
+        self.assertEqual(
+            [item["address"] for item in results], ["1 A St", "2 B St", "2  b st"]
+        )
+        self.assertTrue(results[0]["results"][0]["cached"])
+        self.assertEqual(results[1]["results"][0]["provider"], "provider1")
+        self.assertEqual(results[1]["results"], results[2]["results"])
+
+    @patch.object(CacheService, "set_many")
+    @patch.object(PropertyBatchView, "_fetch_provider_data_many")
+    @patch.object(CacheService, "get_many_with_staleness", return_value={})
+    def test_batch_deadline_settings(self, mock_get_many, mock_fetch_many, mock_set):
+        """Test that batches get their own deadline budget, not the interactive one."""
+        mock_fetch_many.return_value = {"1 A St": self.provider_results}
+
+        with self.settings(BATCH_DEADLINE=300, BATCH_DEADLINE_MAX=400):
+            self._post({"addresses": ["1 A St"]})
+            request = self.factory.post(
+                "/properties/batch/?deadline=1000", {"addresses": ["1 A St"]}, format="json"
+            )
+            PropertyBatchView.as_view()(request)
+
+        budgets = [call[0][2].budget for call in mock_fetch_many.call_args_list]
+        self.assertEqual(budgets, [300, 400])
+
+    @patch.object(CacheService, "get_many_with_staleness")
+    @patch.object(DataProcessor, "load_service_class")
+    def test_fetch_provider_data_many(self, mock_load_service_class, mock_get_many):
+        """Test that the batch fan-out only calls providers for uncached keys."""
+        mock_get_many.return_value = {
+            ("1 A St", "provider1"): (
+                {"provider": "Provider 1", "cached": False},
+                False,
+            ),
+            # Stale provider entries are fetched again
+            ("2 B St", "provider1"): ({"provider": "Provider 1"}, True),
+        }
+
+        mock_service = MagicMock()
+        mock_service.get_property_details.side_effect = lambda address, priority: {
+            "data": {"address": address}
+        }
+        mock_load_service_class.return_value = lambda: mock_service
+
+        view = PropertyBatchView()
+        results = view._fetch_provider_data_many(["1 A St", "2 B St"])
+
+        self.assertTrue(results["1 A St"]["provider1"]["cached"])
+        self.assertEqual(
+            results["2 B St"]["provider1"], {"data": {"address": "2 B St"}}
+        )
+        self.assertEqual(list(results["1 A St"]), ["provider1", "provider2"])
+        # 1 miss for provider1 plus 2 misses for provider2
+        self.assertEqual(mock_service.get_property_details.call_count, 3)
+        # Every provider entry of the batch is read in one round-trip
+        mock_get_many.assert_called_once()
+
+
+class AsyncPropertyDetailsViewTest(TestCase):
+    """Test cases for AsyncPropertyDetailsView."""
+
+    def setUp(self):
+        """Set up test environment."""
+        # Services are cached process-wide, start every test from scratch
+        provider_clients.clear()
+        self.addCleanup(provider_clients.clear)
+
+        self.factory = AsyncRequestFactory()
+        self.test_address = "123 Test Street, City, State"
+        self.provider_payload = {
+            "data": {
+                "squareFootage": 1500,
+                "bedrooms": 3,
+                "bathrooms": 2,
+                "features": {"septicSystem": False},
+            }
+        }
+
+    async def _get(self, params):
+        """Send a request through the async view."""
+        request = self.factory.get("/properties/async/", params)
+        return await AsyncPropertyDetailsView.as_view()(request)
+
+    async def test_missing_address(self):
+        """Test async GET request with missing address parameter."""
+        response = await self._get({})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            json.loads(response.content),
+            {"error": "Missing or empty address parameter"},
+        )
+
+    @patch.object(CacheService, "aclose", new_callable=AsyncMock)
+    @patch.object(CacheService, "aget_response_with_staleness", new_callable=AsyncMock)
+    async def test_cache_hit(self, mock_aget, mock_aclose):
+        """Test async GET request with cache hit."""
+        mock_aget.return_value = None, {
+            (self.test_address, None): (
+                [{"provider": "Provider 1", "bedrooms": 3}],
+                False,
+            )
+        }
+
+        response = await self._get({"address": self.test_address})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = json.loads(response.content)
+        self.assertTrue(data[0]["cached"])
+        mock_aget.assert_awaited_once()
+        mock_aclose.assert_awaited_once()
+
+    @patch.object(CacheService, "aclose", new_callable=AsyncMock)
+    @patch.object(CacheService, "aset_many", new_callable=AsyncMock)
+    @patch.object(CacheService, "aget_response_with_staleness", new_callable=AsyncMock)
+    @patch.object(DataProcessor, "load_service_class")
+    async def test_cache_miss(
+        self, mock_load_service_class, mock_aget, mock_aset, mock_aclose
+    ):
+        """Test async GET request fetching from providers on a cache miss."""
+        mock_aget.return_value = None, {}
+
+        mock_service = MagicMock()
+        mock_service.aget_property_details = AsyncMock(
+            return_value=self.provider_payload
+        )
+        mock_load_service_class.return_value = lambda: mock_service
+
+        response = await self._get({"address": self.test_address})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = json.loads(response.content)
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data[0]["provider"], "Provider 1")
+        self.assertFalse(data[0]["cached"])
+
+        # Two provider entries plus the combined entry in one round-trip
+        mock_aset.assert_awaited_once()
+        self.assertEqual(len(mock_aset.call_args[0][0]), 3)
+
+    @patch.object(CacheService, "aacquire_lock", new_callable=AsyncMock, return_value="token")
+    @patch.object(CacheService, "arelease_lock", new_callable=AsyncMock)
+    @patch.object(CacheService, "aset_many", new_callable=AsyncMock)
+    @patch.object(CacheService, "aget_response_with_staleness", new_callable=AsyncMock)
+    @patch.object(DataProcessor, "load_service_class")
+    async def test_concurrent_misses_call_providers_once(
+        self, mock_load_service_class, mock_aget, mock_aset, mock_release, mock_acquire
+    ):
+        """Test that concurrent misses of an address share one provider fetch."""
+        mock_aget.return_value = None, {}
+
+        async def call(address):
+            await asyncio.sleep(0.05)
+            return self.provider_payload
+
+        mock_service = MagicMock()
+        mock_service.aget_property_details = AsyncMock(side_effect=call)
+        mock_load_service_class.return_value = lambda: mock_service
+
+        with self.settings(HEDGING_ENABLED=False):
+            responses = await asyncio.gather(
+                *(self._get({"address": self.test_address}) for _ in range(3))
+            )
+
+        self.assertEqual([response.status_code for response in responses], [200] * 3)
+        self.assertEqual(
+            mock_service.aget_property_details.await_count, len(PROVIDER_CONFIGS)
+        )
+        mock_acquire.assert_awaited_once()
+        mock_release.assert_awaited_once_with(self.test_address, "token")
+        mock_aset.assert_awaited_once()
+
+    @patch.object(CacheService, "aget", new_callable=AsyncMock)
+    @patch.object(CacheService, "aacquire_lock", new_callable=AsyncMock, return_value=None)
+    @patch.object(CacheService, "aget_response_with_staleness", new_callable=AsyncMock)
+    @patch.object(DataProcessor, "load_service_class")
+    async def test_locked_miss_waits_for_other_worker(
+        self, mock_load_service_class, mock_aget_response, mock_acquire, mock_aget
+    ):
+        """Test that a miss locked by another worker is served from its cache write."""
+        mock_aget_response.return_value = None, {}
+        mock_aget.return_value = [{"provider": "Provider 1", "bedrooms": 3}]
+
+        with patch.object(
+            CacheService,
+            "aget_many_with_staleness",
+            new_callable=AsyncMock,
+            return_value={(self.test_address, None): (mock_aget.return_value, False)},
+        ):
+            response = await self._get({"address": self.test_address})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(json.loads(response.content)[0]["cached"])
+        mock_load_service_class.assert_not_called()
+
+    @patch("properties.views.aclose_async_pool", new_callable=AsyncMock)
+    @patch.object(CacheService, "aset_many", new_callable=AsyncMock)
+    @patch.object(CacheService, "aget_response_with_staleness", new_callable=AsyncMock)
+    @patch.object(DataProcessor, "load_service_class")
+    def test_wsgi_request_closes_loop_clients(
+        self, mock_load_service_class, mock_aget, mock_aset, mock_aclose_pool
+    ):
+        """Test that a request on its own event loop closes that loop's clients."""
+        mock_aget.return_value = None, {}
+        clients = []
+
+        async def call(address):
+            clients.append(provider_clients.get_async_client("provider1"))
+            return self.provider_payload
+
+        mock_service = MagicMock()
+        mock_service.aget_property_details = call
+        mock_load_service_class.return_value = lambda: mock_service
+
+        request = RequestFactory().get("/properties/async/", {"address": self.test_address})
+        response = async_to_sync(AsyncPropertyDetailsView.as_view())(request)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(clients)
+        self.assertTrue(all(client.is_closed for client in clients))
+        mock_aclose_pool.assert_awaited_once()
+
+    @patch.object(DataProcessor, "load_service_class")
+    async def test_provider_timeout(self, mock_load_service_class):
+        """Test that a slow provider is reported as a timeout error."""
+        async def slow_call(address):
+            await asyncio.sleep(1)
+
+        mock_service = MagicMock()
+        mock_service.aget_property_details = slow_call
+        mock_load_service_class.return_value = lambda: mock_service
+
+        provider_configs = {
+            name: dict(config, timeout=0.01)
+            for name, config in PROVIDER_CONFIGS.items()
+        }
+        with patch.dict("properties.views.PROVIDER_CONFIGS", provider_configs):
+            view = AsyncPropertyDetailsView()
+            results = await view._afetch_provider_data(self.test_address, {})
+
+        self.assertIn("Timeout", results["provider1"]["error"])
+        self.assertIn("Timeout", results["provider2"]["error"])
+
+
+class ProviderClientRegistryTest(TestCase):
+    """Test cases for the process-wide provider client registry."""
+
+    def setUp(self):
+        """Set up test environment."""
+        provider_clients.clear()
+        self.addCleanup(provider_clients.clear)
+
+    def test_service_is_reused(self):
+        """Test that each provider service is only instantiated once."""
+        with patch.object(
+            DataProcessor, "load_service_class", wraps=DataProcessor.load_service_class
+        ) as mock_load_service_class:
+            first = provider_clients.get_service("provider1")
+            second = provider_clients.get_service("provider1")
+
+        self.assertIs(first, second)
+        mock_load_service_class.assert_called_once()
+
+    def test_session_is_pooled_per_provider(self):
+        """Test that sessions are shared and sized from PROVIDER_CONFIGS."""
+        session = provider_clients.get_session("provider1")
+
+        self.assertIs(session, provider_clients.get_session("provider1"))
+        self.assertIsNot(session, provider_clients.get_session("provider2"))
+
+        adapter = session.get_adapter("https://example.com")
+        self.assertEqual(
+            adapter._pool_maxsize, PROVIDER_CONFIGS["provider1"]["pool_size"]
+        )
+
+    def test_service_uses_pooled_session(self):
+        """Test that provider calls go through the shared session."""
+        service = provider_clients.get_service("provider1")
+        session = provider_clients.get_session("provider1")
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"data": {}}
+        with patch.object(session, "get", return_value=mock_response) as mock_get:
+            service.base_url = "https://provider1.test/"
+            self.assertEqual(service.get_property_details("1 A St"), {"data": {}})
+
+        _, kwargs = mock_get.call_args
+        self.assertEqual(
+            kwargs["timeout"],
+            (
+                PROVIDER_CONFIGS["provider1"]["connect_timeout"],
+                PROVIDER_CONFIGS["provider1"]["read_timeout"],
+            ),
+        )
+
+
+class ProviderExecutorTest(TestCase):
+    """Test cases for the shared, bounded provider executor."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+
+    def _blocking_call(self):
+        self.release.wait(5)
+        return "done"
+
+    def test_rejects_when_queue_is_full(self):
+        """Test that submissions beyond workers plus queue are rejected."""
+        executor = ProviderExecutor(max_workers=1, queue_size=1, retry_after=3)
+        self.addCleanup(executor.shutdown, wait=False)
+
+        first = executor.submit("provider1", self._blocking_call)
+        executor.submit("provider1", self._blocking_call)
+        self.assertEqual(executor.pending, 2)
+
+        with self.assertRaises(ExecutorSaturatedError) as ctx:
+            executor.submit("provider1", self._blocking_call)
+        self.assertEqual(ctx.exception.retry_after, 3)
+
+        # Slots are released once calls complete
+        self.release.set()
+        self.assertEqual(first.result(timeout=5), "done")
+        executor.shutdown()
+        self.assertEqual(executor.pending, 0)
+
+    def test_per_provider_cap(self):
+        """Test that one provider cannot take every slot."""
+        executor = ProviderExecutor(
+            max_workers=4, queue_size=4, provider_limits={"provider1": 1}
+        )
+        self.addCleanup(executor.shutdown, wait=False)
+
+        executor.submit("provider1", self._blocking_call)
+        with self.assertRaises(ExecutorSaturatedError):
+            executor.submit("provider1", self._blocking_call)
+
+        # Other providers are unaffected
+        executor.submit("provider2", self._blocking_call)
+
+    def test_batch_share(self):
+        """Test that batches keep part of each provider's cap free."""
+        executor = ProviderExecutor(
+            max_workers=8, queue_size=8, provider_limits={"provider1": 4}, batch_share=0.5
+        )
+        self.addCleanup(executor.shutdown, wait=False)
+
+        batch = [
+            executor.submit_batch("provider1", self._blocking_call) for _ in range(2)
+        ]
+        with self.assertRaises(ExecutorSaturatedError):
+            executor.submit_batch("provider1", self._blocking_call)
+
+        # Interactive calls still get the rest of the cap
+        executor.submit("provider1", self._blocking_call)
+        executor.submit("provider1", self._blocking_call)
+        with self.assertRaises(ExecutorSaturatedError):
+            executor.submit("provider1", self._blocking_call)
+
+        # Batch slots are released once calls complete
+        self.release.set()
+        concurrent.futures.wait(batch, timeout=5)
+        while executor.pending:
+            time.sleep(0.01)
+        self.assertEqual(executor.submit_batch("provider1", lambda: "done").result(5), "done")
+
+    @patch("properties.views.get_provider_executor")
+    def test_interactive_lookup_during_batch(self, mock_get_executor):
+        """Test that an interactive lookup succeeds while a batch is running."""
+        executor = ProviderExecutor(
+            max_workers=16,
+            queue_size=16,
+            provider_limits={"provider1": 4, "provider2": 4},
+            batch_share=0.5,
+        )
+        self.addCleanup(executor.shutdown, wait=False)
+        mock_get_executor.return_value = executor
+        service = MagicMock()
+        service.get_property_details.side_effect = (
+            lambda address, priority=None: {"data": {"address": address}}
+            if address == "9 Other St"
+            else self._blocking_call()
+        )
+
+        with patch.object(provider_clients, "get_service", return_value=service), \
+                patch.object(circuit_breaker, "admit_many",
+                             side_effect=lambda names: (dict.fromkeys(names, CLOSED), {})):
+            batch = threading.Thread(
+                target=PropertyBatchView()._fetch_provider_data_many,
+                args=([f"{index} Main St" for index in range(20)], {}, Deadline(5)),
+            )
+            batch.start()
+            self.addCleanup(batch.join, 5)
+            while executor.pending < 4:
+                time.sleep(0.01)
+
+            results = PropertyDetailsView()._fetch_provider_data(
+                "9 Other St", {}, Deadline(2)
+            )
+
+        for provider_name in PROVIDER_CONFIGS:
+            self.assertEqual(results[provider_name], {"data": {"address": "9 Other St"}})
+
+    @patch.object(CacheService, "get_many")
+    @patch.object(PropertyDetailsView, "_fetch_provider_data")
+    def test_view_returns_503_when_saturated(self, mock_fetch, mock_cache_get):
+        """Test that the view fails fast with Retry-After when saturated."""
+        mock_cache_get.return_value = {}
+        mock_fetch.side_effect = ExecutorSaturatedError("full", retry_after=2)
+
+        request = APIRequestFactory().get("/properties/", {"address": "1 A St"})
+        response = PropertyDetailsView.as_view()(request)
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response["Retry-After"], "2")
+
+
+class CacheServiceConnectionPoolTest(TestCase):
+    """Test cases for the process-wide Redis connection pool."""
+
+    def setUp(self):
+        """Set up test environment."""
+        cache_service.reset_connection_pools()
+        self.addCleanup(cache_service.reset_connection_pools)
+
+    def test_pool_is_shared(self):
+        """Test that every CacheService shares one connection pool."""
+        with self.settings(REDIS_MAX_CONNECTIONS=7, REDIS_HEALTH_CHECK_INTERVAL=11):
+            first = CacheService()
+            second = CacheService()
+
+        self.assertIsNot(first.redis, second.redis)
+        pool = first.redis.connection_pool
+        self.assertIs(pool, second.redis.connection_pool)
+        self.assertEqual(pool.max_connections, 7)
+        self.assertEqual(pool.connection_kwargs["health_check_interval"], 11)
+        self.assertTrue(pool.connection_kwargs["socket_keepalive"])
+
+    def test_django_redis_pool(self):
+        """Test that the django_redis client can be reused."""
+        django_client = MagicMock()
+        with self.settings(REDIS_USE_DJANGO_CACHE=True):
+            with patch(
+                "django_redis.get_redis_connection", return_value=django_client
+            ) as mock_get_connection:
+                service = CacheService()
+
+        self.assertIs(service.redis, django_client)
+        mock_get_connection.assert_called_once_with("default")
+
+    async def test_async_pool_is_shared_per_loop(self):
+        """Test that asyncio clients share the pool of the running loop."""
+        first = CacheService()
+        second = CacheService()
+
+        self.assertIs(
+            first.async_redis.connection_pool, second.async_redis.connection_pool
+        )
+        await first.aclose()
+        await second.aclose()
+
+
+class CacheServiceBulkTest(TestCase):
+    """Test cases for the bulk CacheService operations."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.service = CacheService()
+        self.service.redis = MagicMock()
+
+    def test_get_many_uses_single_mget(self):
+        """Test that get_many reads every entry with one MGET."""
+        self.service.redis.mget.return_value = [None, b'{"bedrooms": 3}']
+
+        results = self.service.get_many([("1 A St", None), ("1 A St", "provider1")])
+
+        self.service.redis.mget.assert_called_once_with(
+            [
+                self.service.get_cache_key("1 A St"),
+                self.service.get_cache_key("1 A St", "provider1"),
+            ]
+        )
+        self.assertEqual(results, {("1 A St", "provider1"): {"bedrooms": 3}})
+
+    def test_set_many_uses_single_pipeline(self):
+        """Test that set_many writes every entry in one pipelined round-trip."""
+        pipeline = self.service.redis.pipeline.return_value
+        self.service.stale_ttl = 40
+
+        result = self.service.set_many(
+            {("1 A St", None): [{"provider": "provider1"}], ("1 A St", "provider1"): {}},
+            ttl=60,
+        )
+
+        self.assertTrue(result)
+        self.service.redis.pipeline.assert_called_once_with(transaction=False)
+        self.assertEqual(pipeline.setex.call_count, 2)
+
+        # Entries live for the soft TTL plus the stale window
+        cache_key, ttl, value = pipeline.setex.call_args_list[0][0]
+        self.assertEqual(cache_key, self.service.get_cache_key("1 A St"))
+        self.assertEqual(ttl, 100)
+        self.assertEqual(
+            CacheValueCodec.decode(value)["data"], [{"provider": "provider1"}]
+        )
+        pipeline.execute.assert_called_once()
+
+    def test_get_many_redis_error(self):
+        """Test that Redis errors degrade to a cache miss."""
+        self.service.redis.mget.side_effect = Exception("connection refused")
+
+        self.assertEqual(self.service.get_many([("1 A St", None)]), {})
+
+
+class LocalCacheTest(TestCase):
+    """Test cases for the in-process L1 cache."""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        local_cache = LocalCache(max_entries=2, ttl=60)
+        local_cache.set("a", b"1")
+        local_cache.set("b", b"2")
+        local_cache.get("a")
+        local_cache.set("c", b"3")
+
+        self.assertIsNone(local_cache.get("b"))
+        self.assertEqual(local_cache.get("a"), b"1")
+        self.assertEqual(local_cache.get("c"), b"3")
+        self.assertEqual(local_cache.stats()["evictions"], 1)
+
+    def test_ttl_expiry(self):
+        """Test that expired entries are treated as misses."""
+        local_cache = LocalCache(max_entries=2, ttl=60)
+        with patch("properties.services.local_cache.time.monotonic", return_value=0):
+            local_cache.set("a", b"1", ttl=10)
+        with patch("properties.services.local_cache.time.monotonic", return_value=11):
+            self.assertIsNone(local_cache.get("a"))
+
+        self.assertEqual(
+            local_cache.stats(), {"hits": 0, "misses": 1, "evictions": 0, "size": 0}
+        )
+
+
+class CacheServiceLocalCacheTest(TestCase):
+    """Test cases for the L1 tier of CacheService."""
+
+    def setUp(self):
+        """Set up test environment."""
+        settings_override = self.settings(L1_CACHE_ENABLED=True, L1_CACHE_TTL=30)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        listener = patch.object(cache_service, "_start_invalidation_listener")
+        listener.start()
+        self.addCleanup(listener.stop)
+
+        cache_service.reset_local_cache()
+        self.addCleanup(cache_service.reset_local_cache)
+
+        self.service = CacheService()
+        self.service.redis = MagicMock()
+        self.local_cache = cache_service.get_local_cache()
+
+    def test_hits_are_served_locally(self):
+        """Test that repeated reads only reach Redis once."""
+        self.service.redis.mget.return_value = [b'{"bedrooms": 3}']
+
+        self.assertEqual(self.service.get("1 A St"), {"bedrooms": 3})
+        self.assertEqual(self.service.get("1 A St"), {"bedrooms": 3})
+
+        self.service.redis.mget.assert_called_once()
+        self.assertEqual(self.local_cache.stats()["hits"], 1)
+        self.assertEqual(self.local_cache.ttl, 30)
+
+    def test_writes_publish_invalidation(self):
+        """Test that writes refresh L1 and notify other workers in one pipeline."""
+        pipeline = self.service.redis.pipeline.return_value
+        cache_key = self.service.get_cache_key("1 A St")
+
+        self.service.set("1 A St", {"bedrooms": 4})
+
+        self.assertEqual(
+            CacheService._decode(self.local_cache.get(cache_key)),
+            ({"bedrooms": 4}, False),
+        )
+        channel, message = pipeline.publish.call_args[0]
+        self.assertEqual(channel, "property:invalidate")
+        self.assertEqual(json.loads(message)["keys"], [cache_key])
+        pipeline.execute.assert_called_once()
+
+        self.service.delete("1 A St")
+        self.assertIsNone(self.local_cache.get(cache_key))
+
+    def test_invalidation_from_other_workers(self):
+        """Test that messages from other workers evict local entries."""
+        self.local_cache.set("property:abc", b"1")
+        self.local_cache.set("property:def", b"2")
+
+        cache_service._handle_invalidation_message(
+            self.local_cache,
+            {"data": json.dumps({"origin": "other", "keys": ["property:abc"]})},
+        )
+        # Our own messages are ignored
+        cache_service._handle_invalidation_message(
+            self.local_cache,
+            {
+                "data": json.dumps(
+                    {"origin": cache_service._PROCESS_ID, "keys": ["property:def"]}
+                )
+            },
+        )
+
+        self.assertIsNone(self.local_cache.get("property:abc"))
+        self.assertEqual(self.local_cache.get("property:def"), b"2")
+
+
+class SingleFlightTest(TestCase):
+    """Test cases for coalescing concurrent lookups of the same address."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.single_flight = SingleFlight()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def _slow_fetch(self):
+        self.calls += 1
+        self.release.wait(5)
+        return ["result"]
+
+    def _wait_for_leader(self):
+        for _ in range(500):
+            if self.single_flight.in_flight():
+                return
+            threading.Event().wait(0.01)
+
+    def test_followers_share_leader_result(self):
+        """Test that concurrent callers with the same key run the call once."""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            leader = executor.submit(self.single_flight.do, "key", self._slow_fetch)
+            self._wait_for_leader()
+            followers = [
+                executor.submit(self.single_flight.do, "key", self._slow_fetch)
+                for _ in range(2)
+            ]
+            self.release.set()
+            results = [leader.result(5)] + [f.result(5) for f in followers]
+
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(self.single_flight.in_flight(), 0)
+
+    def test_followers_receive_leader_exception(self):
+        """Test that a failing leader fails its followers too."""
+
+        def failing_fetch():
+            self.release.wait(5)
+            raise ExecutorSaturatedError("full")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(self.single_flight.do, "key", failing_fetch)
+            self._wait_for_leader()
+            follower = executor.submit(self.single_flight.do, "key", failing_fetch)
+            self.release.set()
+
+            with self.assertRaises(ExecutorSaturatedError):
+                leader.result(5)
+            with self.assertRaises(ExecutorSaturatedError):
+                follower.result(5)
+
+    def test_follower_timeout(self):
+        """Test that a follower timing out does not run the call again."""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(self.single_flight.do, "key", self._slow_fetch)
+            self._wait_for_leader()
+
+            with self.assertRaises(concurrent.futures.TimeoutError):
+                self.single_flight.do("key", self._slow_fetch, timeout=0.05)
+            result = self.single_flight.do(
+                "key", self._slow_fetch, timeout=0.05, on_timeout=lambda: ["timeout"]
+            )
+            self.release.set()
+            leader.result(5)
+
+        self.assertEqual(result, ["timeout"])
+        self.assertEqual(self.calls, 1)
+
+    @patch.object(CacheService, "set_many")
+    @patch.object(CacheService, "release_lock")
+    @patch.object(CacheService, "acquire_lock", return_value="token")
+    def test_follower_timeout_calls_providers_once(
+        self, mock_acquire, mock_release, mock_set_many
+    ):
+        """Test that a follower past its deadline reports timeouts instead of fetching."""
+        def get_property_details(address, priority=None):
+            self._slow_fetch()
+            return {"data": {"squareFootage": 1}}
+
+        service = MagicMock()
+        service.get_property_details.side_effect = get_property_details
+
+        with self.settings(HEDGING_ENABLED=False), \
+                patch.object(provider_clients, "get_service", return_value=service), \
+                patch.object(circuit_breaker, "admit_many",
+                             side_effect=lambda names: (dict.fromkeys(names, CLOSED), {})), \
+                patch.object(provider_fetches, "_calls", {}):
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                leader = executor.submit(
+                    PropertyDetailsView()._fetch_coalesced, "1 A St", {}, Deadline(5)
+                )
+                while self.calls < len(PROVIDER_CONFIGS):
+                    time.sleep(0.01)
+
+                results = PropertyDetailsView()._fetch_coalesced(
+                    "1 A St", {}, Deadline(0.1)
+                )
+                self.release.set()
+                leader.result(5)
+
+        self.assertEqual(service.get_property_details.call_count, len(PROVIDER_CONFIGS))
+        self.assertEqual(len(results), len(PROVIDER_CONFIGS))
+        self.assertTrue(all("Timeout" in result["error"] for result in results))
+
+    @patch.object(CacheService, "release_lock")
+    @patch.object(CacheService, "get_many_with_staleness")
+    @patch.object(CacheService, "wait_for")
+    @patch.object(CacheService, "acquire_lock", return_value=None)
+    @patch.object(PropertyDetailsView, "_fetch_and_cache")
+    def test_waits_for_other_worker(
+        self,
+        mock_fetch_and_cache,
+        mock_acquire,
+        mock_wait_for,
+        mock_get_many,
+        mock_release,
+    ):
+        """Test that a follower in another worker reuses the leader's cache write."""
+        mock_wait_for.return_value = [{"$ref": "provider1"}]
+        mock_get_many.return_value = {
+            ("1 A St", None): ([{"$ref": "provider1"}], False),
+            ("1 A St", "provider1"): (
+                {"provider": "Provider 1", "cached": False},
+                False,
+            ),
+        }
+
+        view = PropertyDetailsView()
+        results = view._fetch_coalesced("1 A St", {}, Deadline(5))
+
+        self.assertTrue(results[0]["cached"])
+        mock_fetch_and_cache.assert_not_called()
+        mock_release.assert_not_called()
+
+    @patch.object(CacheService, "release_lock")
+    @patch.object(CacheService, "acquire_lock", return_value="token")
+    @patch.object(PropertyDetailsView, "_fetch_and_cache")
+    def test_leader_releases_lock(
+        self, mock_fetch_and_cache, mock_acquire, mock_release
+    ):
+        """Test that the leader fetches and releases its lock."""
+        mock_fetch_and_cache.return_value = []
+
+        deadline = Deadline(5)
+        view = PropertyDetailsView()
+        view._fetch_coalesced("1 A St", {}, deadline)
+
+        mock_fetch_and_cache.assert_called_once_with("1 A St", {}, deadline)
+        mock_release.assert_called_once_with("1 A St", "token")
+
+    def test_lock_commands(self):
+        """Test the Redis commands used for the cross-worker lock."""
+        service = CacheService()
+        service.redis = MagicMock()
+        service.redis.set.return_value = None
+
+        self.assertIsNone(service.acquire_lock("1 A St", ttl=10))
+        service.redis.set.assert_called_once_with(
+            service.get_lock_key("1 A St"), mock.ANY, nx=True, ex=10
+        )
+
+        service.release_lock("1 A St", "token")
+        service.redis.eval.assert_called_once_with(
+            cache_service.RELEASE_LOCK_SCRIPT,
+            1,
+            service.get_lock_key("1 A St"),
+            "token",
+        )
+
+
+class StaleWhileRevalidateTest(TestCase):
+    """Test cases for serving stale cache entries while refreshing them."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.service = CacheService()
+        self.service.redis = MagicMock()
+        self.address = "1 A St"
+
+    def _envelope(self, data, fresh_until):
+        return json.dumps({"fresh_until": fresh_until, "data": data}).encode()
+
+    def test_staleness_from_soft_ttl(self):
+        """Test that entries past their soft TTL are reported as stale."""
+        self.service.redis.mget.return_value = [
+            self._envelope(["fresh"], time.time() + 60),
+            self._envelope(["stale"], time.time() - 60),
+            b'["legacy"]',
+        ]
+
+        results = self.service.get_many_with_staleness(
+            [(self.address, None), (self.address, "provider1"), ("2 B St", None)]
+        )
+
+        self.assertEqual(results[(self.address, None)], (["fresh"], False))
+        self.assertEqual(results[(self.address, "provider1")], (["stale"], True))
+        self.assertEqual(results[("2 B St", None)], (["legacy"], False))
+
+    @patch.object(PropertyDetailsView, "_schedule_refresh")
+    @patch.object(CacheService, "get_response_with_staleness")
+    def test_stale_hit_is_served_and_refreshed(self, mock_get_many, mock_refresh):
+        """Test that a stale hit returns immediately and schedules a refresh."""
+        mock_get_many.return_value = None, {
+            (self.address, None): ([{"provider": "Provider 1", "bedrooms": 3}], True)
+        }
+
+        request = APIRequestFactory().get("/properties/", {"address": self.address})
+        response = PropertyDetailsView.as_view()(request)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data[0]["cached"])
+        self.assertTrue(response.data[0]["stale"])
+        mock_refresh.assert_called_once_with(self.address)
+
+    @patch.object(CacheService, "release_lock")
+    @patch.object(CacheService, "acquire_lock", return_value="token")
+    @patch.object(PropertyDetailsView, "_fetch_and_cache")
+    def test_refresh_is_deduplicated(
+        self, mock_fetch_and_cache, mock_acquire, mock_release
+    ):
+        """Test that only one refresh per address runs at a time."""
+        release = threading.Event()
+        mock_fetch_and_cache.side_effect = lambda address, entries, priority: release.wait(5)
+
+        view = PropertyDetailsView()
+        view._schedule_refresh(self.address)
+        view._schedule_refresh(self.address)
+        release.set()
+
+        for _ in range(500):
+            if not provider_fetches.in_flight():
+                break
+            threading.Event().wait(0.01)
+
+        mock_fetch_and_cache.assert_called_once_with(
+            self.address, {}, priority="background"
+        )
+        mock_release.assert_called_once_with(self.address, "token")
+
+    @patch.object(CacheService, "acquire_lock", return_value=None)
+    @patch.object(PropertyDetailsView, "_fetch_and_cache")
+    def test_refresh_skipped_when_other_worker_refreshes(
+        self, mock_fetch_and_cache, mock_acquire
+    ):
+        """Test that a refresh already running in another worker is not repeated."""
+        self.assertIsNone(PropertyDetailsView()._refresh(self.address))
+        mock_fetch_and_cache.assert_not_called()
+
+
+class CacheCodecTest(TestCase):
+    """Test cases for the cache value codecs and the combined entry references."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.value = {
+            "fresh_until": 1700000000.5,
+            "data": [{"provider": "Provider 1", "address": "1 A St"}] * 50,
+        }
+
+    def test_round_trip(self):
+        """Test that every available codec decodes what it encodes."""
+        for codec in ("json", "orjson"):
+            for compression in ("none", "zlib"):
+                value_codec = CacheValueCodec(codec, compression, compression_threshold=64)
+                encoded = value_codec.encode(self.value)
+
+                self.assertEqual(encoded[0], 0)
+                self.assertEqual(CacheValueCodec.decode(encoded), self.value)
+
+    def test_compression_threshold(self):
+        """Test that only payloads over the threshold are compressed."""
+        small = CacheValueCodec("json", "zlib", compression_threshold=10**6)
+        large = CacheValueCodec("json", "zlib", compression_threshold=64)
+
+        self.assertEqual(small.encode(self.value)[3], 0)
+        self.assertEqual(large.encode(self.value)[3], 1)
+        self.assertLess(len(large.encode(self.value)), len(small.encode(self.value)))
+
+    @skipUnless("zstd" in COMPRESSORS, "zstandard is not installed")
+    def test_zstd_across_threads(self):
+        """Test that zstd values written by concurrent threads are all readable."""
+        value_codec = CacheValueCodec("json", "zstd", compression_threshold=64)
+        values = [{**self.value, "index": index} for index in range(64)]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            encoded = list(executor.map(value_codec.encode, values))
+
+        self.assertEqual([CacheValueCodec.decode(raw) for raw in encoded], values)
+
+    def test_legacy_json_is_readable(self):
+        """Test that values written as plain JSON are still decoded."""
+        self.assertEqual(CacheValueCodec.decode(json.dumps(self.value)), self.value)
+        self.assertEqual(CacheValueCodec.decode(b'[{"provider": "Provider 1"}]'), [
+            {"provider": "Provider 1"}
+        ])
+
+    def test_unavailable_codec(self):
+        """Test that unknown codecs fail at configuration and read time."""
+        with self.assertRaises(ImproperlyConfigured):
+            CacheValueCodec("pickle")
+        with self.assertRaises(ValueError):
+            CacheValueCodec.decode(b"\x00\x01\x63\x00{}")
+
+    def test_combined_entry_references_provider_entries(self):
+        """Test that the combined entry is stored once and rebuilt on read."""
+        provider_data = {"provider": "Provider 1", "bedrooms": 3}
+        error = {"provider": "provider2", "error": "Timeout", "cached": False}
+
+        writes = PropertyDetailsView._cache_writes(
+            "1 A St",
+            {"provider1": {"data": {}}, "provider2": {"error": "Timeout"}},
+            [provider_data, error],
+            {"provider1": provider_data},
+        )
+
+        self.assertEqual(writes[("1 A St", None)], [{"$ref": "provider1"}, error])
+        entries = {entry: (data, False) for entry, data in writes.items()}
+        self.assertEqual(
+            PropertyDetailsView._resolve_cached_results("1 A St", entries),
+            ([provider_data, error], False),
+        )
+
+        # A combined entry whose provider entry has expired is a miss
+        del entries[("1 A St", "provider1")]
+        self.assertEqual(
+            PropertyDetailsView._resolve_cached_results("1 A St", entries),
+            (None, False),
+        )
+
+
+    def test_combined_entry_references_cached_provider_entries(self):
+        """Test that provider entries served from the cache are referenced, not copied."""
+        cached = {"provider": "Provider 1", "bedrooms": 3, "cached": True}
+        fresh = {"provider": "Provider 2", "bedrooms": 4, "cached": False}
+
+        writes = PropertyDetailsView._cache_writes(
+            "1 A St",
+            {"provider1": cached, "provider2": {"data": {}}},
+            [cached, fresh],
+            {"provider2": fresh},
+        )
+
+        self.assertEqual(
+            writes[("1 A St", None)], [{"$ref": "provider1"}, {"$ref": "provider2"}]
+        )
+        # The cached provider entry is not written again
+        self.assertNotIn(("1 A St", "provider1"), writes)
+
+
+class AddressNormalizerTest(TestCase):
+    """Test cases for the address canonicalization behind the cache keys."""
+
+    def test_spellings_share_a_canonical_form(self):
+        """Test that common spellings of one address normalize identically."""
+        spellings = [
+            "123 Main Street, Apt 4, Boston, Massachusetts 02118",
+            "123 main st #4 boston ma 02118-1234",
+            "123 MAIN ST. UNIT 4, BOSTON, MA 021181234, USA",
+        ]
+
+        self.assertEqual(
+            {normalize_address(spelling) for spelling in spellings},
+            {"123 MAIN ST # 4 BOSTON MA 02118"},
+        )
+
+    def test_directionals_and_ordinals(self):
+        """Test that directionals and ordinal street names are abbreviated."""
+        self.assertEqual(
+            normalize_address("500 North First Avenue Suite 200"),
+            normalize_address("500 N 1st Ave Ste 200"),
+        )
+
+    def test_distinct_units_stay_distinct(self):
+        """Test that different units and designators are not merged."""
+        self.assertNotEqual(
+            normalize_address("123 Main St Apt 4"), normalize_address("123 Main St Apt 5")
+        )
+        self.assertNotEqual(
+            normalize_address("123 Main St Apt 4"), normalize_address("123 Main St Ste 4")
+        )
+
+    def test_address_without_letters_or_digits(self):
+        """Test that punctuation-only addresses are refused instead of sharing a key."""
+        for address in ("...", "---", ", ,", "#"):
+            with self.subTest(address=address):
+                with self.assertRaises(ValueError):
+                    normalize_address(address)
+
+        request = APIRequestFactory().get("/properties/", {"address": "..."})
+        response = PropertyDetailsView.as_view()(request)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_state_name_only_after_a_city(self):
+        """Test that a trailing city named like a state is not abbreviated."""
+        self.assertEqual(normalize_address("123 Main St, Washington"), "123 MAIN ST WASHINGTON")
+        self.assertNotEqual(
+            normalize_address("123 Main St, Washington"), normalize_address("123 Main St, WA")
+        )
+        self.assertEqual(
+            normalize_address("123 Main St, Seattle, Washington 98101"),
+            "123 MAIN ST SEATTLE WA 98101",
+        )
+
+    def test_hyphenated_house_numbers(self):
+        """Test that hyphens between digits are kept and ZIP+4 codes still reduced."""
+        self.assertNotEqual(
+            normalize_address("107-20 71st Ave"), normalize_address("10720 71st Ave")
+        )
+        self.assertEqual(normalize_address("107-20 71st Ave"), "107-20 71ST AVE")
+        self.assertEqual(
+            normalize_address("1 Main St Apt 4-B Queens NY 11375-1234"),
+            "1 MAIN ST # 4B QUEENS NY 11375",
+        )
+
+    def test_positional_abbreviations(self):
+        """Test that state names and unit designators only apply in their position."""
+        self.assertNotEqual(
+            normalize_address("100 Main St Floor 2, Miami"),
+            normalize_address("100 Main St Florida 2, Miami"),
+        )
+        self.assertEqual(
+            normalize_address("100 Main St Floor 2, Miami, Florida 33101"),
+            "100 MAIN ST FL 2 MIAMI FL 33101",
+        )
+        # Street names are left alone
+        self.assertEqual(normalize_address("1 Front St"), "1 FRONT ST")
+        self.assertEqual(
+            normalize_address("9 Florida Ave, Washington, District of Columbia"),
+            "9 FLORIDA AVE WASHINGTON DC",
+        )
+
+    def test_cache_key_uses_canonical_address(self):
+        """Test that equivalent addresses share a cache key."""
+        service = CacheService()
+
+        self.assertEqual(
+            service.get_cache_key("123 Main Street, Apt 4", "provider1"),
+            service.get_cache_key("123 main st #4", "provider1"),
+        )
+
+
+class MappingCompilerTest(TestCase):
+    """Test cases for the compiled provider mapping extractors."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.mapping = PROVIDER_CONFIGS["provider1"]["mapping"]
+        self.payloads = [
+            {
+                "squareFootage": 2000,
+                "lotSizeSqFt": 43560,
+                "bedrooms": 3,
+                "features": {"roomCount": 7, "septicSystem": True},
+                "lastSalePrice": 300000,
+            },
+            {"squareFootage": 1500, "lotSizeSqFt": None, "features": None},
+            {"features": "not a dict"},
+        ]
+
+    def test_matches_interpreted_mapping(self):
+        """Test that compiled extractors return what the interpreted loop returns."""
+        for provider_name, config in PROVIDER_CONFIGS.items():
+            extractor = DataProcessor.compile_mapping(config["mapping"], provider_name)
+            for payload in self.payloads:
+                self.assertEqual(
+                    extractor(payload),
+                    DataProcessor._extract_fields(payload, config["mapping"], provider_name),
+                )
+
+    def test_provider_mappings_compiled_at_startup(self):
+        """Test that the configured mappings are compiled when the app loads."""
+        for provider_name, config in PROVIDER_CONFIGS.items():
+            self.assertIs(
+                DataProcessor._extractors[provider_name].mapping, config["mapping"]
+            )
+
+    def test_invalid_mapping_reported(self):
+        """Test that every invalid field is reported when compiling."""
+        with self.assertRaises(ImproperlyConfigured) as context:
+            DataProcessor.compile_mappings(
+                {"bad": {"mapping": {"bedrooms": 3, "room_count": (), "year_built": "yearBuilt"}}}
+            )
+
+        message = str(context.exception)
+        self.assertIn("bedrooms", message)
+        self.assertIn("room_count", message)
+        self.assertNotIn("year_built", message)
+
+    def test_failing_field_falls_back_to_interpreted_loop(self):
+        """Test that a failing transform only nulls its own field."""
+        result = DataProcessor.standardize_data(
+            {"data": {"squareFootage": 2000, "lotSizeSqFt": "not a number"}},
+            self.mapping,
+            "provider1",
+        )
+
+        self.assertEqual(result["square_footage"], 2000)
+        self.assertIsNone(result["lot_size_acres"])
+
+
+class LeanSerializerParityTest(TestCase):
+    """Test that the lean serializer matches PropertyDetailsSerializer exactly."""
+
+    VALUES = [
+        None, "", "  ", " text ", "12", "12.0", "1.5", "abc", "true", "No", "null",
+        0, 1, -3, 1.0, 1.5, True, False, float("inf"), 10**400, "9" * 1001,
+        [], {}, "a\x00b", "\ud800x",
+    ]
+
+    @staticmethod
+    def _drf_validate(data):
+        serializer = PropertyDetailsSerializer(data=data)
+        if serializer.is_valid():
+            return dict(serializer.validated_data), None
+        return None, dict(serializer.errors)
+
+    @staticmethod
+    def _represent(serialize, instance):
+        try:
+            return serialize(instance)
+        except Exception as e:
+            return type(e)
+
+    def _assert_same_errors(self, expected, actual):
+        self.assertEqual(expected, actual)
+        for field, details in (expected or {}).items():
+            self.assertEqual(
+                [detail.code for detail in details],
+                [detail.code for detail in actual[field]],
+            )
+
+    def test_validation_parity(self):
+        """Test validated data and error details for every field and value."""
+        for field in PropertyDetailsSerializer().fields:
+            for value in self.VALUES:
+                with self.subTest(field=field, value=value):
+                    data = {"provider": "Provider 1", field: value}
+                    expected = self._drf_validate(data)
+                    actual = property_details_serializer.validate(data)
+
+                    self.assertEqual(expected[0], actual[0])
+                    self._assert_same_errors(expected[1], actual[1])
+
+    def test_invalid_payload_parity(self):
+        """Test error details for payloads that are not records."""
+        for data in (None, [], "text", {}, {"provider": None}):
+            with self.subTest(data=data):
+                expected = self._drf_validate(data)
+                actual = property_details_serializer.validate(data)
+
+                self.assertEqual(expected[0], actual[0])
+                self._assert_same_errors(expected[1], actual[1])
+
+    def test_representation_parity(self):
+        """Test representations, including key order and error records."""
+        instances = [
+            {"provider": "Provider 1", field: value}
+            for field in PropertyDetailsSerializer().fields
+            for value in self.VALUES
+        ]
+        instances += [
+            {"error": "Timeout", "provider": "provider1"},
+            {"error": "Timeout", "cached": True, "stale": True},
+            {"bedrooms": 3},
+        ]
+        for instance in instances:
+            with self.subTest(instance=instance):
+                expected = self._represent(
+                    lambda item: PropertyDetailsSerializer(item).data, instance
+                )
+                actual = self._represent(
+                    property_details_serializer.to_representation, instance
+                )
+
+                self.assertEqual(expected, actual)
+                if isinstance(expected, dict):
+                    self.assertEqual(list(expected), list(actual))
+
+    def test_unsupported_serializer_refused(self):
+        """Test that serializers the lean path cannot mirror are refused."""
+
+        class LimitedSerializer(PropertyDetailsSerializer):
+            bedrooms = serializers.IntegerField(max_value=10)
+
+        with self.assertRaises(ImproperlyConfigured):
+            LeanSerializer(LimitedSerializer)
+
+    def test_representation_override_refused(self):
+        """Test that serializers with their own representation are refused."""
+
+        class FormattedSerializer(PropertyDetailsSerializer):
+            def to_representation(self, instance):
+                return {"formatted": True}
+
+        with self.assertRaises(ImproperlyConfigured):
+            LeanSerializer(FormattedSerializer)
+
+    def test_plain_serializer_has_no_error_records(self):
+        """Test that only PropertyDetailsSerializer's error records are mirrored."""
+
+        class PlainSerializer(serializers.Serializer):
+            provider = serializers.CharField()
+            error = serializers.CharField(required=False)
+
+        instance = {"provider": "provider1", "error": "Timeout"}
+
+        self.assertEqual(
+            LeanSerializer(PlainSerializer).to_representation(instance),
+            PlainSerializer(instance).data,
+        )
+
+
+class CachedResponseBodyTest(TestCase):
+    """Test cases for serving cache hits as stored response bodies."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.address = "1 A St"
+        self.factory = APIRequestFactory()
+        self.service = CacheService()
+        self.service.redis = MagicMock()
+        self.service.stale_ttl = 40
+
+    @patch.object(CacheService, "_decode_many")
+    @patch("properties.services.cache_service.get_local_cache", return_value=None)
+    @patch("properties.services.cache_service.get_redis_client")
+    def test_hit_served_as_stored_bytes(self, mock_redis, mock_local_cache, mock_decode):
+        """Test that a stored body is returned untouched, skipping decoding."""
+        body = b'[{"provider":"Provider 1","cached":true,"stale":false}]'
+        mock_redis.return_value.mget.return_value = [body, None, None, None]
+
+        request = self.factory.get("/properties/", {"address": self.address})
+        response = PropertyDetailsView.as_view()(request)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, body)
+        self.assertEqual(response["Content-Type"], "application/json")
+        mock_decode.assert_not_called()
+        # The body and the entries were read in one round-trip
+        mock_redis.return_value.mget.assert_called_once()
+
+    @patch.object(CacheService, "set_many")
+    @patch.object(PropertyDetailsView, "_fetch_provider_data")
+    def test_fetch_stores_rendered_body(self, mock_fetch, mock_set_many):
+        """Test that a fetch stores the body later hits will be served."""
+        mock_fetch.return_value = {
+            "provider1": {"data": {"squareFootage": 2000, "bedrooms": 3}}
+        }
+
+        results = PropertyDetailsView()._fetch_and_cache(self.address, {})
+
+        self.assertFalse(results[0]["cached"])
+        body = mock_set_many.call_args.kwargs["responses"][self.address]
+        rendered = json.loads(body)
+        self.assertEqual(rendered[0]["square_footage"], 2000)
+        self.assertTrue(rendered[0]["cached"])
+        self.assertFalse(rendered[0]["stale"])
+
+    def test_body_expires_with_soft_ttl(self):
+        """Test that bodies are written with the soft TTL only."""
+        pipeline = self.service.redis.pipeline.return_value
+
+        self.service.set_many(
+            {(self.address, None): []}, ttl=60, responses={self.address: b"[]"}
+        )
+
+        pipeline.setex.assert_any_call(
+            self.service.get_response_key(self.address), 60, b"[]"
+        )
+        pipeline.setex.assert_any_call(
+            self.service.get_cache_key(self.address), 100, mock.ANY
+        )
+
+    def test_delete_removes_body(self):
+        """Test that deleting an address also deletes its response body."""
+        pipeline = self.service.redis.pipeline.return_value
+
+        self.service.delete(self.address)
+
+        pipeline.delete.assert_called_once_with(
+            self.service.get_cache_key(self.address),
+            self.service.get_response_key(self.address),
+        )
+
+    @patch("properties.services.cache_service.get_property_store", return_value=None)
+    def test_delete_provider_entry_removes_body(self, mock_store):
+        """Test that deleting a provider entry also deletes the response body."""
+        pipeline = self.service.redis.pipeline.return_value
+
+        self.service.delete(self.address, "provider1")
+
+        pipeline.delete.assert_called_once_with(
+            self.service.get_cache_key(self.address, "provider1"),
+            self.service.get_response_key(self.address),
+        )
+
+
+class RequestLogTest(TestCase):
+    """Test cases for per-request summary logging."""
+
+    def setUp(self):
+        """Set up test environment."""
+        provider_clients.clear()
+        self.addCleanup(provider_clients.clear)
+
+        self.address = "1 A St"
+        self.factory = APIRequestFactory()
+        self.results = {
+            "provider1": {"data": {"squareFootage": 2000, "bedrooms": 3}},
+            "provider2": {"error": "Timeout fetching data from provider2"},
+        }
+
+    def _logged_fetch(self):
+        """Fetch and cache the address inside a logged request."""
+
+        @request_log.logged_request("test")
+        def fetch():
+            PropertyDetailsView()._fetch_and_cache(self.address, {})
+            return MagicMock(status_code=200)
+
+        return fetch()
+
+    @patch.object(CacheService, "get_response_with_staleness", return_value=(None, {}))
+    @patch.object(PropertyDetailsView, "_fetch_coalesced")
+    def test_single_summary_per_request(self, mock_fetch, mock_get_cache):
+        """Test that a request logs one INFO record carrying its summary."""
+
+        def fetch(address, cached_entries, deadline):
+            request_log.record_provider("provider1", "ok")
+            request_log.record_provider("provider2", "timeout")
+            return []
+
+        mock_fetch.side_effect = fetch
+        request = self.factory.get("/properties/", {"address": self.address})
+
+        with self.assertLogs("properties", level="INFO") as logs:
+            PropertyDetailsView.as_view()(request)
+
+        self.assertEqual(len(logs.records), 1)
+        summary = logs.records[0].summary
+        self.assertEqual(summary["view"], "property_details")
+        self.assertEqual(summary["address"], self.address)
+        self.assertEqual(summary["cache"], "miss")
+        self.assertEqual(summary["status"], 200)
+        self.assertEqual(
+            summary["providers"], {"provider1": "ok", "provider2": "timeout"}
+        )
+        self.assertIn("providers=provider1:ok,provider2:timeout", logs.output[0])
+
+    @patch.object(CacheService, "set_many")
+    @patch.object(PropertyDetailsView, "_fetch_provider_data")
+    def test_payloads_not_serialized_at_info(self, mock_fetch, mock_set_many):
+        """Test that payload dumps cost nothing when DEBUG is disabled."""
+        mock_fetch.return_value = self.results
+
+        with self.settings(LOG_PAYLOAD_SAMPLE_RATE=1.0), patch.object(
+            request_log, "payload"
+        ) as mock_payload, self.assertLogs("properties", level="INFO"):
+            self._logged_fetch()
+
+        mock_payload.assert_not_called()
+
+    @patch.object(CacheService, "set_many")
+    @patch.object(PropertyDetailsView, "_fetch_provider_data")
+    def test_payload_dumps_are_sampled(self, mock_fetch, mock_set_many):
+        """Test that payloads are only dumped for sampled requests at DEBUG."""
+        mock_fetch.return_value = self.results
+
+        with patch.object(request_log, "payload") as mock_payload, self.assertLogs(
+            "properties", level="DEBUG"
+        ):
+            with self.settings(LOG_PAYLOAD_SAMPLE_RATE=0.0):
+                self._logged_fetch()
+            mock_payload.assert_not_called()
+
+            with self.settings(LOG_PAYLOAD_SAMPLE_RATE=1.0):
+                self._logged_fetch()
+            mock_payload.assert_called()
+
+    def test_record_outside_request(self):
+        """Test that recording outside a logged request is a no-op."""
+        request_log.record(cache="hit")
+        request_log.record_provider("provider1", "ok")
+
+        self.assertFalse(request_log.dump_payloads())
+
+    async def test_async_summary(self):
+        """Test that async views log their summary too."""
+        request = AsyncRequestFactory().get(
+            "/properties/async/", {"address": self.address}
+        )
+
+        with patch.object(
+            CacheService, "aget_response_with_staleness", new_callable=AsyncMock,
+            return_value=(b"[]", {}),
+        ), patch.object(
+            CacheService, "aclose", new_callable=AsyncMock
+        ), self.assertLogs("properties", level="INFO") as logs:
+            await AsyncPropertyDetailsView.as_view()(request)
+
+        self.assertEqual(len(logs.records), 1)
+        summary = logs.records[0].summary
+        self.assertEqual(summary["view"], "async_property_details")
+        self.assertEqual(summary["cache"], "response")
+
+
+class RequestDeadlineTest(TestCase):
+    """Test cases for the request deadline shared by provider calls."""
+
+    def setUp(self):
+        """Set up test environment."""
+        provider_clients.clear()
+        self.addCleanup(provider_clients.clear)
+
+        self.address = "1 A St"
+        self.factory = APIRequestFactory()
+        self.payload = {"data": {"squareFootage": 2000, "bedrooms": 3}}
+
+    def _executor(self, finished):
+        """Executor completing the calls of ``finished`` providers only."""
+        executor = MagicMock()
+
+        def submit(provider_name, fn, address, priority):
+            future = concurrent.futures.Future()
+            if provider_name in finished:
+                future.set_result(self.payload)
+            return future
+
+        executor.submit.side_effect = submit
+        executor.submit_batch.side_effect = submit
+        return executor
+
+    def test_budget(self):
+        """Test the default budget and the cap on requested budgets."""
+        with self.settings(REQUEST_DEADLINE=5, REQUEST_DEADLINE_MAX=20):
+            self.assertEqual(request_deadline().budget, 5)
+            self.assertEqual(request_deadline("2.5").budget, 2.5)
+            self.assertEqual(request_deadline("60").budget, 20)
+            for invalid in ("0", "-1", "soon", "nan", "inf"):
+                with self.assertRaises(ValueError):
+                    request_deadline(invalid)
+
+    @patch.object(DataProcessor, "load_service_class", return_value=MagicMock)
+    @patch("properties.views.get_provider_executor")
+    def test_returns_partial_results_at_deadline(self, mock_executor, mock_load):
+        """Test that finished providers are returned once the deadline hits."""
+        mock_executor.return_value = self._executor({"provider1"})
+
+        started = time.monotonic()
+        results = PropertyDetailsView()._fetch_provider_data(
+            self.address, {}, Deadline(0.05)
+        )
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(results["provider1"], self.payload)
+        self.assertTrue(results["provider2"]["timeout"])
+        self.assertEqual(list(results), list(PROVIDER_CONFIGS))
+
+    @patch.object(CacheService, "set_many")
+    @patch.object(PropertyDetailsView, "_fetch_provider_data")
+    def test_partial_results_are_not_cached_combined(self, mock_fetch, mock_set_many):
+        """Test that partial results only cache the providers that answered."""
+        mock_fetch.return_value = {
+            "provider1": self.payload,
+            "provider2": PropertyDetailsView._timeout_result("provider2"),
+        }
+
+        results = PropertyDetailsView()._fetch_and_cache(self.address, {})
+
+        self.assertIn("Timeout", results[1]["error"])
+        writes = mock_set_many.call_args[0][0]
+        self.assertEqual(list(writes), [(self.address, "provider1")])
+        self.assertEqual(mock_set_many.call_args.kwargs["responses"], {})
+
+    @patch.object(DataProcessor, "load_service_class", return_value=MagicMock)
+    @patch("properties.views.get_provider_executor")
+    def test_batch_deadline(self, mock_executor, mock_load):
+        """Test that batch calls outstanding at the deadline are timeouts."""
+        mock_executor.return_value = self._executor({"provider1"})
+
+        results = PropertyBatchView()._fetch_provider_data_many(
+            ["1 A St", "2 B St"], {}, Deadline(0.05)
+        )
+
+        for address in ("1 A St", "2 B St"):
+            self.assertEqual(results[address]["provider1"], self.payload)
+            self.assertTrue(results[address]["provider2"]["timeout"])
+
+    def test_invalid_deadline_parameter(self):
+        """Test that an invalid deadline is rejected before any lookup."""
+        request = self.factory.get(
+            "/properties/", {"address": self.address, "deadline": "soon"}
+        )
+
+        response = PropertyDetailsView.as_view()(request)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ProviderLatencyTest(TestCase):
+    """Test cases for adaptive provider timeouts and hedged calls."""
+
+    def setUp(self):
+        """Set up test environment."""
+        provider_latency.clear()
+        self.addCleanup(provider_latency.clear)
+        provider_clients.clear()
+        self.addCleanup(provider_clients.clear)
+
+        self.address = "1 A St"
+        self.payload = {"data": {"squareFootage": 2000, "bedrooms": 3}}
+
+    def _warm_up(self, provider_name, latencies):
+        for seconds in latencies:
+            provider_latency.observe(provider_name, seconds)
+
+    def test_percentiles(self):
+        """Test nearest-rank percentiles over the rolling window."""
+        window = LatencyWindow(size=100)
+        for seconds in range(1, 201):
+            window.observe(seconds / 1000)
+
+        # Only the most recent 100 calls (101ms to 200ms) are kept
+        self.assertEqual(window.percentile(50), 0.15)
+        self.assertEqual(window.percentile(95), 0.195)
+        self.assertEqual(window.percentile(100), 0.2)
+
+    def test_timeout_follows_latency(self):
+        """Test that timeouts use the configured value until warmed up."""
+        configured = PROVIDER_CONFIGS["provider1"]["timeout"]
+        with self.settings(
+            PROVIDER_LATENCY_MIN_SAMPLES=10,
+            PROVIDER_TIMEOUT_MULTIPLIER=2,
+            PROVIDER_TIMEOUT_MIN=1,
+        ):
+            self._warm_up("provider1", [0.8] * 9)
+            self.assertEqual(provider_latency.timeout("provider1"), configured)
+
+            self._warm_up("provider1", [0.8, 2.0])
+            self.assertEqual(provider_latency.timeout("provider1"), 4.0)
+
+            # Never above the configured timeout nor below the minimum
+            self._warm_up("provider2", [60] * 10)
+            self.assertEqual(provider_latency.timeout("provider2"), configured)
+            self._warm_up("provider1", [0.01] * 500)
+            self.assertEqual(provider_latency.timeout("provider1"), 1)
+
+    def test_hedge_budget(self):
+        """Test that hedges stay within the configured share of calls."""
+        budget = HedgeBudget(ratio=0.05)
+
+        hedges = 0
+        for _ in range(1000):
+            budget.record_call()
+            hedges += budget.try_acquire()
+
+        self.assertEqual(hedges, 50)
+
+    @patch("properties.views.get_provider_executor")
+    def test_slow_call_is_hedged(self, mock_executor):
+        """Test that a call past its hedge delay races a duplicate."""
+        first_calls = set()
+
+        def submit(provider_name, fn, address, priority):
+            future = concurrent.futures.Future()
+            if provider_name in first_calls:
+                future.set_result(self.payload)  # The hedge answers at once
+            first_calls.add(provider_name)
+            return future
+
+        mock_executor.return_value.submit.side_effect = submit
+        for provider_name in PROVIDER_CONFIGS:
+            self._warm_up(provider_name, [0.01] * 50)
+            for _ in range(20):
+                provider_latency.record_call(provider_name)
+
+        with patch.object(DataProcessor, "load_service_class", return_value=MagicMock):
+            results = PropertyDetailsView()._fetch_provider_data(
+                self.address, {}, Deadline(5)
+            )
+
+        self.assertEqual(results["provider1"], self.payload)
+        self.assertEqual(results["provider2"], self.payload)
+        self.assertEqual(mock_executor.return_value.submit.call_count, 4)
+
+    @patch("properties.views.get_provider_executor")
+    def test_no_hedge_without_budget(self, mock_executor):
+        """Test that slow calls are not hedged once the budget is spent."""
+        mock_executor.return_value.submit.side_effect = (
+            lambda *args, **kwargs: concurrent.futures.Future()
+        )
+        self._warm_up("provider1", [0.01] * 50)
+
+        with patch.object(DataProcessor, "load_service_class", return_value=MagicMock):
+            results = PropertyDetailsView()._fetch_provider_data(
+                self.address, {"provider2": {"cached": True}}, Deadline(0.1)
+            )
+
+        self.assertTrue(results["provider1"]["timeout"])
+        self.assertEqual(mock_executor.return_value.submit.call_count, 1)
+
+    async def test_async_hedge(self):
+        """Test that async calls race a duplicate once past their hedge delay."""
+        calls = []
+
+        async def get_property_details(address):
+            calls.append(address)
+            if len(calls) == 1:
+                await asyncio.sleep(5)
+            return self.payload
+
+        service = MagicMock()
+        service.aget_property_details = get_property_details
+        self._warm_up("provider1", [0.01] * 50)
+        for _ in range(20):
+            provider_latency.record_call("provider1")
+
+        result, hedged = await AsyncPropertyDetailsView._ahedged_call(
+            "provider1", service, self.address
+        )
+
+        self.assertEqual(result, self.payload)
+        self.assertTrue(hedged)
+        self.assertEqual(len(calls), 2)
+
+
+class CircuitBreakerTest(TestCase):
+    """Test cases for the provider circuit breakers shared through Redis."""
+
+    def setUp(self):
+        """Set up test environment."""
+        provider_clients.clear()
+        self.addCleanup(provider_clients.clear)
+
+        self.breaker = ProviderCircuitBreaker()
+        self.redis = MagicMock()
+        patcher = patch(
+            "properties.services.circuit_breaker.get_redis_client",
+            return_value=self.redis,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pipeline = self.redis.pipeline.return_value
+
+    def test_admit_many(self):
+        """Test that circuits are read in one round-trip and probes are exclusive."""
+        # provider1 open, provider2 half-open, provider3 closed
+        self.redis.mget.return_value = [b"1", b"1", None, b"1", None, None]
+        self.redis.set.return_value = True
+
+        states, probes = self.breaker.admit_many(["provider1", "provider2", "provider3"])
+
+        self.assertEqual(
+            states,
+            {"provider1": "open", "provider2": "half_open", "provider3": "closed"},
+        )
+        self.assertEqual(list(probes), ["provider2"])
+        self.redis.mget.assert_called_once()
+        self.redis.set.assert_called_once_with(
+            "circuit:provider2:probe", probes["provider2"], nx=True, px=35000
+        )
+
+        # Another caller finds the probe taken
+        self.redis.set.return_value = None
+        self.assertEqual(
+            self.breaker.admit_many(["provider2"]), ({"provider2": "open"}, {})
+        )
+
+    def test_redis_errors_keep_circuits_closed(self):
+        """Test that calls are let through when Redis is unavailable."""
+        self.redis.mget.side_effect = ConnectionError("down")
+
+        self.assertEqual(
+            self.breaker.admit_many(["provider1"]), ({"provider1": "closed"}, {})
+        )
+
+    def test_threshold_opens_circuit(self):
+        """Test that reaching the failure threshold opens the circuit."""
+        with self.settings(CIRCUIT_BREAKER_FAILURE_THRESHOLD=3):
+            self.pipeline.execute.return_value = [2, 25]
+            self.breaker.record_failure("provider1")
+            self.pipeline.set.assert_not_called()
+
+            self.pipeline.execute.return_value = [3, 20]
+            self.breaker.record_failure("provider1")
+
+        self.pipeline.set.assert_any_call("circuit:provider1:open", 1, ex=mock.ANY)
+
+    def test_probe_outcome(self):
+        """Test that a probe closes the circuit on success and reopens it on failure."""
+        self.redis.mget.return_value = [None, b"1"]
+        self.redis.set.return_value = True
+        self.redis.eval.return_value = 1
+
+        # Ordinary successes never touch Redis
+        self.breaker.record_success("provider1")
+        self.redis.eval.assert_not_called()
+        self.pipeline.delete.assert_not_called()
+
+        _, probes = self.breaker.admit_many(["provider1"])
+        self.breaker.record_success("provider1", probes["provider1"])
+        self.redis.eval.assert_called_once_with(
+            cache_service.RELEASE_LOCK_SCRIPT,
+            1,
+            "circuit:provider1:probe",
+            probes["provider1"],
+        )
+        self.pipeline.delete.assert_called_once_with(
+            "circuit:provider1:half_open", "circuit:provider1:failures"
+        )
+
+        _, probes = self.breaker.admit_many(["provider1"])
+        self.breaker.record_failure("provider1", probes["provider1"])
+        self.pipeline.incr.assert_not_called()
+        self.pipeline.set.assert_any_call("circuit:provider1:open", 1, ex=mock.ANY)
+
+    def test_expired_probe_does_not_close(self):
+        """Test that a probe whose token expired or was taken over changes nothing."""
+        self.redis.eval.return_value = 0
+
+        self.breaker.record_success("provider1", "expired")
+        self.pipeline.delete.assert_not_called()
+
+        # A late failure counts like any other
+        self.pipeline.execute.return_value = [1, 30]
+        self.breaker.record_failure("provider1", "expired")
+        self.pipeline.incr.assert_called_once_with("circuit:provider1:failures")
+        self.pipeline.set.assert_not_called()
+
+    @patch.object(rate_limiter, "acquire", return_value=False)
+    def test_shed_probe_is_released(self, mock_acquire):
+        """Test that a probe call shed by the rate limiter gives its probe back."""
+        service = provider_clients.get_service("provider1")
+
+        result = service.get_property_details("1 A St", probe="token")
+
+        self.assertTrue(result["rate_limited"])
+        self.redis.eval.assert_called_once_with(
+            cache_service.RELEASE_LOCK_SCRIPT, 1, "circuit:provider1:probe", "token"
+        )
+
+    @patch("properties.views.get_provider_executor")
+    def test_probe_is_not_hedged(self, mock_executor):
+        """Test that the probe call carries its token and is never hedged."""
+        mock_executor.return_value.submit.side_effect = (
+            lambda *args, **kwargs: concurrent.futures.Future()
+        )
+        provider_latency.clear()
+        self.addCleanup(provider_latency.clear)
+        for _ in range(50):
+            provider_latency.observe("provider1", 0.01)
+            provider_latency.record_call("provider1")
+
+        with patch.object(
+            circuit_breaker,
+            "admit_many",
+            return_value=({"provider1": HALF_OPEN}, {"provider1": "token"}),
+        ), patch.object(DataProcessor, "load_service_class", return_value=MagicMock):
+            results = PropertyDetailsView()._fetch_provider_data(
+                "1 A St", {"provider2": {"cached": True}}, Deadline(0.2)
+            )
+
+        self.assertTrue(results["provider1"]["timeout"])
+        mock_executor.return_value.submit.assert_called_once_with(
+            "provider1", mock.ANY, "1 A St", priority="interactive", probe="token"
+        )
+
+    def test_only_outages_count(self):
+        """Test that client errors do not count against the provider."""
+        service = provider_clients.get_service("provider1")
+        service.base_url = "https://provider1.test/"
+        session = provider_clients.get_session("provider1")
+
+        for status_code, counted in ((404, False), (503, True)):
+            response = requests.Response()
+            response.status_code = status_code
+            with patch.object(session, "get", return_value=response), patch.object(
+                circuit_breaker, "record_failure"
+            ) as mock_failure:
+                self.assertIn("error", service.get_property_details("1 A St"))
+            self.assertEqual(mock_failure.called, counted)
+
+    @patch.object(DataProcessor, "load_service_class", return_value=MagicMock)
+    @patch("properties.views.get_provider_executor")
+    @patch.object(CacheService, "set_many")
+    def test_open_circuit_fails_fast(self, mock_set_many, mock_executor, mock_load):
+        """Test that providers with an open circuit are not called nor cached."""
+        future = concurrent.futures.Future()
+        future.set_result({"data": {"squareFootage": 2000}})
+        mock_executor.return_value.submit.return_value = future
+        self.redis.mget.return_value = [None, None, b"1", b"1"]
+
+        results = PropertyDetailsView()._fetch_and_cache("1 A St", {})
+
+        mock_executor.return_value.submit.assert_called_once()
+        self.assertIn("circuit breaker is open", results[1]["error"])
+        writes, = mock_set_many.call_args[0]
+        self.assertEqual(list(writes), [("1 A St", "provider1")])
+
+
+class StreamingResponseTest(TestCase):
+    """Test cases for streaming provider results as they arrive."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.address = "1 A St"
+        self.factory = APIRequestFactory()
+        self.payload = {"data": {"squareFootage": 2000, "bedrooms": 3}}
+
+    def _get(self, accept=None, **params):
+        """Call the view for ``self.address`` with optional Accept header."""
+        headers = {"HTTP_ACCEPT": accept} if accept else {}
+        request = self.factory.get(
+            "/properties/", {"address": self.address, **params}, **headers
+        )
+        return PropertyDetailsView.as_view()(request)
+
+    @staticmethod
+    def _ndjson(response):
+        """Decode the events of an NDJSON response."""
+        body = b"".join(response.streaming_content).decode()
+        return [json.loads(line) for line in body.splitlines()]
+
+    @patch.object(CacheService, "set_many")
+    @patch.object(CacheService, "get_many_with_staleness", return_value={})
+    @patch.object(PropertyDetailsView, "_iter_provider_data")
+    def test_ndjson_miss(self, mock_iter, mock_get_many, mock_set_many):
+        """Test that a miss streams each record, then caches and summarizes."""
+        mock_iter.return_value = iter(
+            [("provider2", self.payload), ("provider1", {"error": "boom"})]
+        )
+
+        response = self._get(accept="application/x-ndjson")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        events = self._ndjson(response)
+        self.assertEqual([event["type"] for event in events], ["result", "result", "summary"])
+        self.assertEqual(events[0]["provider"], "Provider 2")
+        self.assertEqual(events[1]["data"]["error"], "boom")
+        self.assertEqual(events[2]["cache"], "miss")
+        self.assertTrue(events[2]["complete"])
+        self.assertEqual(events[2]["errors"], ["provider1"])
+
+        # Cached in configuration order once every provider answered
+        writes = mock_set_many.call_args[0][0]
+        combined = writes[(self.address, None)]
+        self.assertEqual(combined[0]["provider"], "provider1")
+        self.assertIn(self.address, mock_set_many.call_args.kwargs["responses"])
+
+    @patch.object(CacheService, "set_many")
+    @patch.object(CacheService, "get_many_with_staleness", return_value={})
+    @patch.object(PropertyDetailsView, "_iter_provider_data")
+    def test_records_sent_before_slow_provider(self, mock_iter, mock_get_many, mock_set_many):
+        """Test that a record is sent before the next provider answers."""
+        progress = []
+
+        def provider_data():
+            yield "provider1", self.payload
+            progress.append("provider2")
+            yield "provider2", PropertyDetailsView._timeout_result("provider2")
+
+        mock_iter.return_value = provider_data()
+
+        response = self._get(format="ndjson")
+        chunks = iter(response.streaming_content)
+        first = json.loads(next(chunks))
+
+        self.assertEqual(first["type"], "result")
+        self.assertEqual(progress, [])
+        events = [json.loads(chunk) for chunk in chunks]
+        self.assertFalse(events[-1]["complete"])
+        self.assertEqual(mock_set_many.call_args.kwargs["responses"], {})
+
+    @patch.object(PropertyDetailsView, "_iter_provider_data")
+    @patch.object(CacheService, "get_many_with_staleness")
+    def test_sse_hit(self, mock_get_many, mock_iter):
+        """Test that a cache hit is sent as Server-Sent Events without fetching."""
+        mock_get_many.return_value = {
+            (self.address, None): (
+                [{"provider": "Provider 1", "square_footage": 2000}],
+                False,
+            )
+        }
+
+        response = self._get(format="sse")
+
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertEqual(response["Cache-Control"], "no-cache")
+        frames = b"".join(response.streaming_content).decode().split("\n\n")[:-1]
+        self.assertTrue(frames[0].startswith("event: result\ndata: "))
+        record = json.loads(frames[0].split("data: ", 1)[1])
+        self.assertTrue(record["data"]["cached"])
+        self.assertIn('"cache":"hit"', frames[1])
+        mock_iter.assert_not_called()
+
+    @patch.object(CacheService, "get_many_with_staleness", return_value={})
+    @patch.object(PropertyDetailsView, "_iter_provider_data")
+    def test_errors_rendered_as_events(self, mock_iter, mock_get_many):
+        """Test that rejections use the negotiated stream format."""
+        mock_iter.side_effect = ExecutorSaturatedError("full", retry_after=2)
+
+        response = self._get(accept="application/x-ndjson")
+        response.render()
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response["Retry-After"], "2")
+        event = json.loads(response.content)
+        self.assertEqual(event["type"], "error")
+
+        self.address = ""
+        response = self._get(format="sse")
+        response.render()
+        self.assertTrue(response.content.startswith(b"event: error\n"))
+
+    @patch.object(CacheService, "set_many")
+    @patch.object(CacheService, "get_many_with_staleness", return_value={})
+    @patch.object(PropertyDetailsView, "_iter_provider_data")
+    def test_summary_logged_when_stream_ends(self, mock_iter, mock_get_many, mock_set_many):
+        """Test that the request summary is logged after the last event."""
+        def provider_data():
+            request_log.record_provider("provider1", "ok")
+            yield "provider1", self.payload
+
+        mock_iter.return_value = provider_data()
+
+        with self.assertLogs("properties.utils.request_log", "INFO") as logs:
+            response = self._get(format="ndjson")
+            self.assertEqual(logs.output, [])
+            self._ndjson(response)
+
+        self.assertEqual(len(logs.records), 1)
+        summary = logs.records[0].summary
+        self.assertEqual(summary["stream"], "ndjson")
+        self.assertEqual(summary["providers"], {"provider1": "ok"})
+
+
+class RateLimiterTest(TestCase):
+    """Test cases for the provider rate limits shared through Redis."""
+
+    def setUp(self):
+        """Set up test environment."""
+        provider_clients.clear()
+        self.addCleanup(provider_clients.clear)
+
+        self.limiter = ProviderRateLimiter()
+        self.redis = MagicMock()
+        patcher = patch(
+            "properties.services.rate_limiter.get_redis_client",
+            return_value=self.redis,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_priorities_reserve_tokens(self):
+        """Test that only interactive calls may use the reserved tokens."""
+        self.redis.eval.return_value = b"0"
+        limits = PROVIDER_CONFIGS["provider1"]
+
+        with self.settings(RATE_LIMIT_RESERVED_PERCENT=25):
+            self.assertTrue(self.limiter.acquire("provider1"))
+            self.assertTrue(self.limiter.acquire("provider1", "batch"))
+
+        interactive, batch = [call.args for call in self.redis.eval.call_args_list]
+        self.assertEqual(interactive[2:], ("ratelimit:provider1", 10, 20, 0))
+        self.assertEqual(batch[5], limits["rate_burst"] * 0.25)
+
+    @patch("properties.services.rate_limiter.time.sleep")
+    def test_waits_or_sheds(self, mock_sleep):
+        """Test that calls wait for a token within their priority's budget."""
+        self.redis.eval.side_effect = [b"0.2", b"0"]
+        with self.settings(RATE_LIMIT_MAX_WAIT={"interactive": 0.5}):
+            self.assertTrue(self.limiter.acquire("provider1"))
+        mock_sleep.assert_called_once_with(0.2)
+
+        mock_sleep.reset_mock()
+        self.redis.eval.side_effect = None
+        self.redis.eval.return_value = b"0.2"
+        self.assertFalse(self.limiter.acquire("provider1", "background"))
+        mock_sleep.assert_not_called()
+
+    def test_unmetered(self):
+        """Test that disabled or unconfigured limits never touch Redis."""
+        self.assertTrue(self.limiter.acquire("unknown"))
+        with self.settings(RATE_LIMIT_ENABLED=False):
+            self.assertTrue(self.limiter.acquire("provider1"))
+        self.redis.eval.assert_not_called()
+
+    def test_fails_open(self):
+        """Test that calls are let through when Redis is unavailable."""
+        self.redis.eval.side_effect = Exception("Redis down")
+
+        self.assertTrue(self.limiter.acquire("provider1", "batch"))
+
+    async def test_async_sheds(self):
+        """Test that the asyncio limiter sheds like the blocking one."""
+        client = AsyncMock()
+        client.eval.return_value = b"3"
+        with patch(
+            "properties.services.rate_limiter.get_async_redis_client",
+            return_value=client,
+        ):
+            self.assertFalse(await self.limiter.aacquire("provider1"))
+        client.aclose.assert_awaited_once()
+
+    def test_service_respects_limit(self):
+        """Test that shed calls and 429s are flagged as rate limited."""
+        service = provider_clients.get_service("provider1")
+        service.base_url = "https://provider1.test/"
+        session = provider_clients.get_session("provider1")
+
+        with patch.object(rate_limiter, "acquire", return_value=False), patch.object(
+            session, "get"
+        ) as mock_get:
+            result = service.get_property_details("1 A St", priority="batch")
+        mock_get.assert_not_called()
+        self.assertTrue(result["rate_limited"])
+
+        response = requests.Response()
+        response.status_code = 429
+        with patch.object(rate_limiter, "acquire", return_value=True), patch.object(
+            session, "get", return_value=response
+        ), patch.object(rate_limiter, "drain") as mock_drain, patch.object(
+            circuit_breaker, "record_failure"
+        ):
+            result = service.get_property_details("1 A St")
+        mock_drain.assert_called_once_with("provider1")
+        self.assertTrue(result["rate_limited"])
+
+    def test_rate_limited_results_not_cached_combined(self):
+        """Test that rate limited results leave the combined entry uncached."""
+        view = PropertyDetailsView()
+        results = {
+            "provider1": {"data": {"squareFootage": 2000}},
+            "provider2": {"error": "Rate limit of provider2 reached", "rate_limited": True},
+        }
+        standardized_data, validated = view._standardize_provider_results(results)
+
+        writes, responses = view._result_writes(
+            "1 A St", results, standardized_data, validated
+        )
+
+        self.assertEqual(list(writes), [("1 A St", "provider1")])
+        self.assertEqual(responses, {})
+
+
+class PropertyStoreTest(TestCase):
+    """Test cases for the durable property store behind Redis."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.store = PropertyStore(batch_size=2)
+        patcher = patch(
+            "properties.services.cache_service.get_property_store",
+            return_value=self.store,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.redis = MagicMock()
+        self.redis.mget.side_effect = lambda keys: [None] * len(keys)
+        self.service = CacheService()
+        self.service.redis = self.redis
+        self.address = "1 A St"
+        self.address_hash = self.service.get_address_hash(self.address)
+
+    def test_flush_upserts_in_batches(self):
+        """Test that buffered records are upserted, the latest data winning."""
+        self.store.enqueue(
+            {
+                (f"hash{index}", "provider1"): (f"{index} a st", {"bedrooms": index})
+                for index in range(3)
+            }
+        )
+        self.assertEqual(self.store.flush(), 3)
+
+        self.store.enqueue({("hash1", "provider1"): ("1 a st", {"bedrooms": 5})})
+        self.store.flush()
+
+        self.assertEqual(self.store.pending, 0)
+        self.assertEqual(PropertyRecord.objects.count(), 3)
+        record = PropertyRecord.objects.get(address_hash="hash1", provider="provider1")
+        self.assertEqual(record.data, {"bedrooms": 5})
+
+    def test_get_many_ignores_expired_records(self):
+        """Test that buffered records are served and expired ones are not."""
+        self.store.enqueue({("hash1", "provider1"): ("1 a st", {"bedrooms": 3})})
+        self.assertEqual(
+            self.store.get_many([("hash1", "provider1")])[("hash1", "provider1")][0],
+            {"bedrooms": 3},
+        )
+        self.store.flush()
+
+        with self.settings(PROPERTY_STORE_TTL=60):
+            PropertyRecord.objects.update(
+                fetched_at=timezone.now() - timedelta(seconds=120)
+            )
+            self.assertEqual(self.store.get_many([("hash1", "provider1")]), {})
+
+    def test_set_many_writes_provider_entries_behind(self):
+        """Test that only valid provider entries are buffered for the store."""
+        self.service.set_many(
+            {
+                (self.address, None): [{"$ref": "provider1"}],
+                (self.address, "provider1"): {"bedrooms": 3},
+                (self.address, "provider2"): {"error": "boom"},
+            }
+        )
+
+        self.assertEqual(self.store.pending, 1)
+        self.store.flush()
+        record = PropertyRecord.objects.get()
+        self.assertEqual(
+            (record.address_hash, record.provider), (self.address_hash, "provider1")
+        )
+        self.assertEqual(record.address, normalize_address(self.address))
+
+    def test_redis_miss_reads_through(self):
+        """Test that Redis misses are served from the store and written back."""
+        PropertyRecord.objects.create(
+            address_hash=self.address_hash,
+            provider="provider1",
+            address=self.address,
+            data={"bedrooms": 3},
+            fetched_at=timezone.now(),
+        )
+
+        results = self.service.get_many_with_staleness(
+            [(self.address, None), (self.address, "provider1"), (self.address, "provider2")]
+        )
+
+        self.assertEqual(results, {(self.address, "provider1"): ({"bedrooms": 3}, False)})
+        pipeline = self.redis.pipeline.return_value
+        cache_key, _, _ = pipeline.setex.call_args[0]
+        self.assertEqual(cache_key, self.service.get_cache_key(self.address, "provider1"))
+        # Written back to Redis, not to the store again
+        self.assertEqual(self.store.pending, 0)
+
+    @patch("properties.views.get_provider_executor")
+    def test_stored_address_calls_no_provider(self, mock_executor):
+        """Test that an address known to the store is answered without providers."""
+        for provider_name in PROVIDER_CONFIGS:
+            PropertyRecord.objects.create(
+                address_hash=self.address_hash,
+                provider=provider_name,
+                address=self.address,
+                data={"provider": provider_name, "bedrooms": 3},
+                fetched_at=timezone.now(),
+            )
+
+        with patch(
+            "properties.services.cache_service.get_redis_client", return_value=self.redis
+        ):
+            request = APIRequestFactory().get("/properties/", {"address": self.address})
+            response = PropertyDetailsView.as_view()(request)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), len(PROVIDER_CONFIGS))
+        self.assertTrue(all(item["cached"] for item in response.data))
+        mock_executor.return_value.submit.assert_not_called()
+
+    @patch.object(DataProcessor, "load_service_class")
+    def test_database_error_falls_back_to_providers(self, mock_load_service_class):
+        """Test that a store without its table leaves the lookups to the providers."""
+        mock_service = MagicMock()
+        mock_service.get_property_details.side_effect = lambda address, priority: {
+            "data": {"address": address}
+        }
+        mock_load_service_class.return_value = lambda: mock_service
+
+        with patch.object(
+            self.store, "_query", side_effect=OperationalError("no such table")
+        ) as mock_query, patch(
+            "properties.services.cache_service.get_redis_client", return_value=self.redis
+        ):
+            results = PropertyBatchView()._fetch_provider_data_many([self.address])
+
+        mock_query.assert_called_once()
+        self.assertEqual(
+            results[self.address]["provider1"], {"data": {"address": self.address}}
+        )
+        self.assertEqual(
+            mock_service.get_property_details.call_count, len(PROVIDER_CONFIGS)
+        )
+
+    async def test_async_read_through(self):
+        """Test that the asyncio reads fall back to the store too."""
+        self.store.enqueue(
+            {(self.address_hash, "provider1"): (self.address, {"bedrooms": 3})}
+        )
+        await sync_to_async(self.store.flush)()
+        self.service._async_redis = MagicMock()
+        self.service._async_redis.mget = AsyncMock(return_value=[None])
+        self.service._async_redis.pipeline.return_value.execute = AsyncMock()
+
+        results = await self.service.aget_many([(self.address, "provider1")])
+
+        self.assertEqual(results, {(self.address, "provider1"): {"bedrooms": 3}})
+
+
+@patch.object(CacheService, "set_many")
+@patch.object(CacheService, "get_many_with_staleness", return_value={})
+class WarmCacheCommandTest(TestCase):
+    """Test cases for the warm_cache management command."""
+
+    def setUp(self):
+        """Set up test environment."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.ok = {
+            provider_name: {"data": {"squareFootage": 2000}}
+            for provider_name in PROVIDER_CONFIGS
+        }
+
+    def _write(self, name, content):
+        """Write an input file and return its path."""
+        path = os.path.join(self.directory, name)
+        with open(path, "w") as file:
+            file.write(content)
+        return path
+
+    def _warm(self, path, **options):
+        """Run the command and return its output."""
+        stdout = StringIO()
+        with self.settings(WARM_RETRY_DELAY=0):
+            call_command("warm_cache", path, stdout=stdout, stderr=StringIO(), **options)
+        return stdout.getvalue()
+
+    @patch.object(CacheService, "cached_addresses", return_value={"1 A St"})
+    @patch.object(PropertyLookupMixin, "_fetch_provider_data_many")
+    def test_skips_cached_addresses(self, mock_fetch, mock_cached, mock_get_many, mock_set_many):
+        """Test that cached and duplicate addresses are not fetched."""
+        mock_fetch.side_effect = lambda addresses, *args: {
+            address: self.ok for address in addresses
+        }
+        path = self._write("addresses.csv", "address,id\n1 A St,1\n2 B St,2\n,3\n2  b st,4\n")
+
+        output = self._warm(path)
+
+        self.assertEqual(mock_fetch.call_args[0][0], ["2 B St"])
+        self.assertEqual(mock_fetch.call_args[0][3:], ("batch", 8))
+        self.assertIn(("2 B St", None), mock_set_many.call_args[0][0])
+        self.assertIn("Done: 2 warmed, 1 already cached, 1 failed", output)
+        self.assertFalse(os.path.exists(f"{path}.checkpoint"))
+
+    @patch.object(CacheService, "cached_addresses", return_value=set())
+    @patch.object(PropertyLookupMixin, "_fetch_provider_data_many")
+    def test_resumes_from_checkpoint(self, mock_fetch, mock_cached, mock_get_many, mock_set_many):
+        """Test that addresses before the checkpoint position are skipped."""
+        mock_fetch.side_effect = lambda addresses, *args: {
+            address: self.ok for address in addresses
+        }
+        path = self._write(
+            "addresses.ndjson",
+            '{"address": "1 A St"}\n"2 B St"\n\n{"address": "3 C St"}\n',
+        )
+        with open(f"{path}.checkpoint", "w") as file:
+            json.dump({"source": os.path.abspath(path), "position": 2, "warmed": 2}, file)
+
+        output = self._warm(path)
+
+        self.assertIn("Resuming after 2 addresses", output)
+        mock_fetch.assert_called_once()
+        self.assertEqual(mock_fetch.call_args[0][0], ["3 C St"])
+        self.assertIn("Done: 3 warmed", output)
+
+    @patch.object(CacheService, "cached_addresses", return_value=set())
+    @patch.object(PropertyLookupMixin, "_fetch_provider_data_many")
+    def test_retries_partial_results(self, mock_fetch, mock_cached, mock_get_many, mock_set_many):
+        """Test that rate limited addresses are retried until they complete."""
+        limited = dict(self.ok, provider2={"error": "Rate limit", "rate_limited": True})
+        mock_fetch.side_effect = [{"1 A St": limited}, {"1 A St": self.ok}]
+        path = self._write("addresses.csv", "address\n1 A St\n")
+
+        output = self._warm(path)
+
+        self.assertEqual(mock_fetch.call_count, 2)
+        self.assertIn("Done: 1 warmed, 0 already cached, 0 failed", output)
+
+    @patch.object(CacheService, "cached_addresses", return_value=set())
+    @patch.object(PropertyLookupMixin, "_fetch_provider_data_many")
+    def test_interrupted_run_keeps_checkpoint(
+        self, mock_fetch, mock_cached, mock_get_many, mock_set_many
+    ):
+        """Test that the checkpoint records the batches finished before a crash."""
+        mock_fetch.side_effect = [{"1 A St": self.ok}, RuntimeError("crash")]
+        path = self._write("addresses.csv", "address\n1 A St\n2 B St\n")
+
+        with self.assertRaises(RuntimeError):
+            self._warm(path, batch_size=1)
+
+        with open(f"{path}.checkpoint") as file:
+            checkpoint = json.load(file)
+        self.assertEqual((checkpoint["position"], checkpoint["warmed"]), (1, 1))
+
+    def test_cached_addresses_single_round_trip(self, mock_get_many, mock_set_many):
+        """Test that existence checks are pipelined without reading values."""
+        service = CacheService()
+        service.redis = MagicMock()
+        pipeline = service.redis.pipeline.return_value
+        pipeline.execute.return_value = [1, 0]
+
+        self.assertEqual(service.cached_addresses(["1 A St", "2 B St"]), {"1 A St"})
+        pipeline.exists.assert_any_call(service.get_response_key("1 A St"))
+        pipeline.execute.assert_called_once()
+
+
+@skipUnless(metrics.prometheus_client, "prometheus_client is not installed")
+class MetricsTest(TestCase):
+    """Test cases for the Prometheus metrics."""
+
+    def setUp(self):
+        """Set up test environment."""
+        provider_clients.clear()
+        self.addCleanup(provider_clients.clear)
+
+        self.registry = metrics.prometheus_client.CollectorRegistry()
+        patcher = patch.object(
+            metrics, "_metrics", metrics.PropertyMetrics(registry=self.registry)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def sample(self, name, **labels):
+        return self.registry.get_sample_value(name, labels) or 0
+
+    def test_provider_calls(self):
+        """Test that provider calls are timed and counted by outcome."""
+        service = provider_clients.get_service("provider1")
+        service.base_url = "https://provider1.test/"
+        session = provider_clients.get_session("provider1")
+        response = MagicMock()
+        response.json.return_value = {"data": {"squareFootage": 2000}}
+
+        with patch.object(rate_limiter, "acquire", return_value=True), patch.object(
+            circuit_breaker, "record_success"
+        ), patch.object(circuit_breaker, "record_failure"), patch.object(
+            session, "get", side_effect=[response, requests.exceptions.ReadTimeout()]
+        ):
+            service.get_property_details("1 A St")
+            service.get_property_details("1 A St")
+
+        self.assertEqual(self.sample(
+            "property_provider_calls_total", provider="provider1", outcome="ok"
+        ), 1)
+        self.assertEqual(self.sample(
+            "property_provider_calls_total", provider="provider1", outcome="timeout"
+        ), 1)
+        self.assertEqual(self.sample(
+            "property_provider_call_duration_seconds_count", provider="provider1"
+        ), 2)
+        self.assertEqual(self.sample(
+            "property_provider_calls_in_flight", provider="provider1"
+        ), 0)
+
+    def test_cache_lookups_by_tier_and_key(self):
+        """Test that Redis hits and misses are counted per kind of entry."""
+        service = CacheService()
+        service.redis = MagicMock()
+        service.redis.mget.return_value = [b"cached", None]
+
+        with patch.object(cache_service, "get_local_cache", return_value=None):
+            service._read_many(["property:abc:provider1", "property:abc"])
+
+        self.assertEqual(self.sample(
+            "property_cache_lookups_total", tier="redis", key="provider1", result="hit"
+        ), 1)
+        self.assertEqual(self.sample(
+            "property_cache_lookups_total", tier="redis", key="combined", result="miss"
+        ), 1)
+        self.assertEqual(self.sample(
+            "property_redis_duration_seconds_count", operation="read"
+        ), 1)
+        self.assertEqual(metrics.cache_key_label("response:property:abc"), "response")
+
+    def test_validation_failures(self):
+        """Test that invalid provider records are counted per field."""
+        view = PropertyDetailsView()
+        view._standardize_provider_results(
+            {"provider1": {"data": {"squareFootage": "not a number"}}}
+        )
+
+        self.assertEqual(self.sample(
+            "property_validation_failures_total",
+            provider="provider1",
+            field="square_footage",
+        ), 1)
+
+    def test_executor_depth(self):
+        """Test that the pending calls and queue depth of a pool are published."""
+        executor = ProviderExecutor(max_workers=1, queue_size=1, name="test")
+        self.addCleanup(executor.shutdown)
+        release = threading.Event()
+
+        futures = [executor.submit(None, release.wait) for _ in range(2)]
+        self.assertEqual(self.sample("property_executor_pending", executor="test"), 2)
+        self.assertEqual(self.sample("property_executor_queue_depth", executor="test"), 1)
+        with self.assertRaises(ExecutorSaturatedError):
+            executor.submit(None, release.wait)
+        self.assertEqual(self.sample(
+            "property_executor_rejections_total", executor="test"
+        ), 1)
+
+        release.set()
+        concurrent.futures.wait(futures)
+        executor.shutdown()
+        self.assertEqual(self.sample("property_executor_pending", executor="test"), 0)
+
+    def test_request_duration(self):
+        """Test that requests are timed by view and cache outcome."""
+        summary = request_log.RequestSummary("property_details")
+        summary.fields["cache"] = "hit"
+
+        request_log._finish(summary, 200)
+
+        self.assertEqual(self.sample(
+            "property_request_duration_seconds_count", view="property_details", cache="hit"
+        ), 1)
+
+    def test_metrics_view(self):
+        """Test that the endpoint renders the text format, or 404 when disabled."""
+        metrics.provider_call_started("provider2")
+        request = APIRequestFactory().get("/metrics")
+
+        response = MetricsView.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            b'property_provider_calls_in_flight{provider="provider2"} 1.0', response.content
+        )
+
+        with patch.object(metrics, "_metrics", False):
+            self.assertEqual(MetricsView.as_view()(request).status_code, 404)
@@ -1,6 +1,8 @@
 from django.urls import path
-from .views import PropertyDetailsView
+from .views import PropertyDetailsView, PropertyBatchView, AsyncPropertyDetailsView
 
 urlpatterns = [
     path('', PropertyDetailsView.as_view(), name='property_view'),
-]
\ No newline at end of file
+    path('batch/', PropertyBatchView.as_view(), name='property_batch_view'),
+    path('async/', AsyncPropertyDetailsView.as_view(), name='property_async_view'),
+]
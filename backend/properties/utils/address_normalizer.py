@@ -0,0 +1,264 @@
+import re
+from functools import lru_cache
+
+# USPS Publication 28 abbreviations. Suffixes, directionals and ordinals are
+# looked up at any position, unit designators only after the street and state
+# names only where the state goes, so common spellings of the same address map
+# to the same canonical form without merging different addresses.
+STREET_SUFFIXES = {
+    'ALLEY': 'ALY', 'ALLEE': 'ALY', 'ALLY': 'ALY',
+    'ANNEX': 'ANX', 'ANNX': 'ANX',
+    'ARCADE': 'ARC',
+    'AVENUE': 'AVE', 'AV': 'AVE', 'AVEN': 'AVE', 'AVENU': 'AVE', 'AVN': 'AVE', 'AVNUE': 'AVE',
+    'BAYOU': 'BYU', 'BAYOO': 'BYU',
+    'BEACH': 'BCH',
+    'BEND': 'BND',
+    'BLUFF': 'BLF', 'BLUF': 'BLF',
+    'BOTTOM': 'BTM', 'BOTTM': 'BTM', 'BOT': 'BTM',
+    'BOULEVARD': 'BLVD', 'BOULV': 'BLVD', 'BOUL': 'BLVD',
+    'BRANCH': 'BR', 'BRNCH': 'BR',
+    'BRIDGE': 'BRG', 'BRDGE': 'BRG',
+    'BROOK': 'BRK',
+    'BYPASS': 'BYP', 'BYPA': 'BYP', 'BYPAS': 'BYP', 'BYPS': 'BYP',
+    'CAMP': 'CP', 'CMP': 'CP',
+    'CANYON': 'CYN', 'CANYN': 'CYN', 'CNYN': 'CYN',
+    'CAUSEWAY': 'CSWY', 'CAUSWA': 'CSWY',
+    'CENTER': 'CTR', 'CENTRE': 'CTR', 'CENT': 'CTR', 'CENTR': 'CTR', 'CNTER': 'CTR', 'CNTR': 'CTR', 'CEN': 'CTR',
+    'CIRCLE': 'CIR', 'CIRC': 'CIR', 'CIRCL': 'CIR', 'CRCL': 'CIR', 'CRCLE': 'CIR',
+    'CLIFF': 'CLF',
+    'CLUB': 'CLB',
+    'COMMON': 'CMN',
+    'CORNER': 'COR',
+    'COURSE': 'CRSE',
+    'COURT': 'CT',
+    'COVE': 'CV',
+    'CREEK': 'CRK',
+    'CRESCENT': 'CRES', 'CRSENT': 'CRES', 'CRSNT': 'CRES',
+    'CROSSING': 'XING', 'CRSSNG': 'XING',
+    'DALE': 'DL',
+    'DAM': 'DM',
+    'DIVIDE': 'DV', 'DIV': 'DV', 'DVD': 'DV',
+    'DRIVE': 'DR', 'DRIV': 'DR', 'DRV': 'DR',
+    'ESTATE': 'EST',
+    'ESTATES': 'ESTS',
+    'EXPRESSWAY': 'EXPY', 'EXPRESS': 'EXPY', 'EXPR': 'EXPY', 'EXPW': 'EXPY',
+    'EXTENSION': 'EXT', 'EXTN': 'EXT', 'EXTNSN': 'EXT',
+    'FALLS': 'FLS',
+    'FERRY': 'FRY', 'FRRY': 'FRY',
+    'FIELD': 'FLD',
+    'FIELDS': 'FLDS',
+    'FLAT': 'FLT',
+    'FOREST': 'FRST', 'FORESTS': 'FRST',
+    'FORGE': 'FRG', 'FORG': 'FRG',
+    'FORK': 'FRK',
+    'FORT': 'FT', 'FRT': 'FT',
+    'FREEWAY': 'FWY', 'FREEWY': 'FWY', 'FRWAY': 'FWY', 'FRWY': 'FWY',
+    'GARDEN': 'GDN', 'GARDN': 'GDN', 'GRDEN': 'GDN', 'GRDN': 'GDN',
+    'GARDENS': 'GDNS', 'GRDNS': 'GDNS',
+    'GATEWAY': 'GTWY', 'GATEWY': 'GTWY', 'GATWAY': 'GTWY', 'GTWAY': 'GTWY',
+    'GLEN': 'GLN',
+    'GREEN': 'GRN',
+    'GROVE': 'GRV', 'GROV': 'GRV',
+    'HARBOR': 'HBR', 'HARB': 'HBR', 'HARBR': 'HBR', 'HRBOR': 'HBR',
+    'HAVEN': 'HVN',
+    'HEIGHTS': 'HTS', 'HT': 'HTS',
+    'HIGHWAY': 'HWY', 'HIGHWY': 'HWY', 'HIWAY': 'HWY', 'HIWY': 'HWY', 'HWAY': 'HWY',
+    'HILL': 'HL',
+    'HILLS': 'HLS',
+    'HOLLOW': 'HOLW', 'HLLW': 'HOLW', 'HOLLOWS': 'HOLW', 'HOLWS': 'HOLW',
+    'ISLAND': 'IS', 'ISLND': 'IS',
+    'JUNCTION': 'JCT', 'JCTION': 'JCT', 'JCTN': 'JCT', 'JUNCTN': 'JCT', 'JUNCTON': 'JCT',
+    'KNOLL': 'KNL', 'KNOL': 'KNL',
+    'LAKE': 'LK',
+    'LAKES': 'LKS',
+    'LANDING': 'LNDG', 'LNDNG': 'LNDG',
+    'LANE': 'LN',
+    'LIGHT': 'LGT',
+    'LOCK': 'LCK',
+    'LODGE': 'LDG', 'LDGE': 'LDG', 'LODG': 'LDG',
+    'MANOR': 'MNR',
+    'MEADOW': 'MDW',
+    'MEADOWS': 'MDWS', 'MEDOWS': 'MDWS',
+    'MILL': 'ML',
+    'MISSION': 'MSN', 'MISSN': 'MSN', 'MSSN': 'MSN',
+    'MOTORWAY': 'MTWY',
+    'MOUNT': 'MT', 'MNT': 'MT',
+    'MOUNTAIN': 'MTN', 'MNTAIN': 'MTN', 'MNTN': 'MTN', 'MOUNTIN': 'MTN', 'MTIN': 'MTN',
+    'ORCHARD': 'ORCH', 'ORCHRD': 'ORCH',
+    'OVERPASS': 'OPAS',
+    'PARKWAY': 'PKWY', 'PARKWY': 'PKWY', 'PKWAY': 'PKWY', 'PKY': 'PKWY',
+    'PASSAGE': 'PSGE',
+    'PIKE': 'PIKE', 'PIKES': 'PIKE',
+    'PINE': 'PNE',
+    'PLACE': 'PL',
+    'PLAIN': 'PLN',
+    'PLAZA': 'PLZ', 'PLZA': 'PLZ',
+    'POINT': 'PT',
+    'PORT': 'PRT',
+    'PRAIRIE': 'PR', 'PRR': 'PR',
+    'RANCH': 'RNCH', 'RANCHES': 'RNCH', 'RNCHS': 'RNCH',
+    'RIDGE': 'RDG', 'RDGE': 'RDG',
+    'RIVER': 'RIV', 'RVR': 'RIV', 'RIVR': 'RIV',
+    'ROAD': 'RD',
+    'ROUTE': 'RTE',
+    'SHORE': 'SHR', 'SHOAR': 'SHR',
+    'SPRING': 'SPG', 'SPNG': 'SPG', 'SPRNG': 'SPG',
+    'SQUARE': 'SQ', 'SQR': 'SQ', 'SQRE': 'SQ', 'SQU': 'SQ',
+    'STATION': 'STA', 'STATN': 'STA', 'STN': 'STA',
+    'STREAM': 'STRM', 'STREME': 'STRM',
+    'STREET': 'ST', 'STRT': 'ST', 'STR': 'ST',
+    'STREETS': 'STS',
+    'SUMMIT': 'SMT', 'SUMIT': 'SMT', 'SUMITT': 'SMT',
+    'TERRACE': 'TER', 'TERR': 'TER',
+    'TRACE': 'TRCE', 'TRACES': 'TRCE',
+    'TRACK': 'TRAK', 'TRACKS': 'TRAK', 'TRK': 'TRAK', 'TRKS': 'TRAK',
+    'TRAIL': 'TRL', 'TRAILS': 'TRL', 'TRLS': 'TRL',
+    'TUNNEL': 'TUNL', 'TUNEL': 'TUNL', 'TUNLS': 'TUNL', 'TUNNELS': 'TUNL', 'TUNNL': 'TUNL',
+    'TURNPIKE': 'TPKE', 'TRNPK': 'TPKE', 'TURNPK': 'TPKE',
+    'UNDERPASS': 'UPAS',
+    'VALLEY': 'VLY', 'VALLY': 'VLY', 'VLLY': 'VLY',
+    'VIADUCT': 'VIA', 'VDCT': 'VIA', 'VIADCT': 'VIA',
+    'VIEW': 'VW',
+    'VILLAGE': 'VLG', 'VILL': 'VLG', 'VILLAG': 'VLG', 'VILLG': 'VLG', 'VILLIAGE': 'VLG',
+    'VILLE': 'VL',
+    'VISTA': 'VIS', 'VIST': 'VIS', 'VST': 'VIS', 'VSTA': 'VIS',
+    'WALKS': 'WALK',
+    'WELL': 'WL',
+    'WELLS': 'WLS',
+}
+
+DIRECTIONALS = {
+    'NORTH': 'N', 'SOUTH': 'S', 'EAST': 'E', 'WEST': 'W',
+    'NORTHEAST': 'NE', 'NORTHWEST': 'NW', 'SOUTHEAST': 'SE', 'SOUTHWEST': 'SW',
+}
+
+# Designators that only say "this is a unit" are folded into '#', so "Apt 4",
+# "Unit 4" and "#4" are the same address. Specific ones keep their meaning.
+GENERIC_UNIT_DESIGNATORS = {'#', 'APT', 'APARTMENT', 'UNIT', 'NO', 'NUM', 'NUMBER'}
+UNIT_DESIGNATORS = {
+    'BASEMENT': 'BSMT', 'BUILDING': 'BLDG', 'DEPARTMENT': 'DEPT', 'FLOOR': 'FL',
+    'FRONT': 'FRNT', 'HANGAR': 'HNGR', 'LOBBY': 'LBBY', 'LOWER': 'LOWR',
+    'OFFICE': 'OFC', 'PENTHOUSE': 'PH', 'PIER': 'PIER', 'REAR': 'REAR',
+    'ROOM': 'RM', 'SIDE': 'SIDE', 'SLIP': 'SLIP', 'SPACE': 'SPC', 'STOP': 'STOP',
+    'SUITE': 'STE', 'TRAILER': 'TRLR', 'UPPER': 'UPPR',
+}
+
+ORDINALS = {
+    'FIRST': '1ST', 'SECOND': '2ND', 'THIRD': '3RD', 'FOURTH': '4TH', 'FIFTH': '5TH',
+    'SIXTH': '6TH', 'SEVENTH': '7TH', 'EIGHTH': '8TH', 'NINTH': '9TH', 'TENTH': '10TH',
+    'ELEVENTH': '11TH', 'TWELFTH': '12TH',
+}
+
+STATES = {
+    'ALABAMA': 'AL', 'ALASKA': 'AK', 'ARIZONA': 'AZ', 'ARKANSAS': 'AR', 'CALIFORNIA': 'CA',
+    'COLORADO': 'CO', 'CONNECTICUT': 'CT', 'DELAWARE': 'DE', 'FLORIDA': 'FL', 'GEORGIA': 'GA',
+    'HAWAII': 'HI', 'IDAHO': 'ID', 'ILLINOIS': 'IL', 'INDIANA': 'IN', 'IOWA': 'IA',
+    'KANSAS': 'KS', 'KENTUCKY': 'KY', 'LOUISIANA': 'LA', 'MAINE': 'ME', 'MARYLAND': 'MD',
+    'MASSACHUSETTS': 'MA', 'MICHIGAN': 'MI', 'MINNESOTA': 'MN', 'MISSISSIPPI': 'MS',
+    'MISSOURI': 'MO', 'MONTANA': 'MT', 'NEBRASKA': 'NE', 'NEVADA': 'NV',
+    'NEW HAMPSHIRE': 'NH', 'NEW JERSEY': 'NJ', 'NEW MEXICO': 'NM', 'NEW YORK': 'NY',
+    'NORTH CAROLINA': 'NC', 'NORTH DAKOTA': 'ND', 'OHIO': 'OH', 'OKLAHOMA': 'OK',
+    'OREGON': 'OR', 'PENNSYLVANIA': 'PA', 'RHODE ISLAND': 'RI', 'SOUTH CAROLINA': 'SC',
+    'SOUTH DAKOTA': 'SD', 'TENNESSEE': 'TN', 'TEXAS': 'TX', 'UTAH': 'UT', 'VERMONT': 'VT',
+    'VIRGINIA': 'VA', 'WASHINGTON': 'WA', 'WEST VIRGINIA': 'WV', 'WISCONSIN': 'WI',
+    'WYOMING': 'WY', 'DISTRICT OF COLUMBIA': 'DC',
+}
+
+
+def _build_token_table():
+    table = {}
+    table.update(STREET_SUFFIXES)
+    table.update(DIRECTIONALS)
+    table.update(ORDINALS)
+    return table
+
+
+def _build_unit_table():
+    table = dict(UNIT_DESIGNATORS)
+    table.update({designator: '#' for designator in GENERIC_UNIT_DESIGNATORS})
+    return table
+
+
+# Built once at import so normalize_address does no per-call setup.
+_TOKEN_TABLE = _build_token_table()
+_UNIT_TABLE = _build_unit_table()
+_STREET_SUFFIX_TOKENS = set(STREET_SUFFIXES) | set(STREET_SUFFIXES.values())
+# State names by word count, longest first, so 'WEST VIRGINIA' wins over 'VIRGINIA'
+_STATE_NAMES = sorted(
+    ((tuple(name.split()), code) for name, code in STATES.items()),
+    key=lambda item: -len(item[0]),
+)
+_COUNTRY_SUFFIXES = (['UNITED', 'STATES', 'OF', 'AMERICA'], ['UNITED', 'STATES'], ['USA'], ['US'])
+_PUNCTUATION = str.maketrans({
+    '.': None, "'": None, '"': None,
+    ',': ' ', ';': ' ', ':': ' ', '(': ' ', ')': ' ', '/': ' ',
+    '#': ' # ',
+})
+# Hyphens are dropped except between digits, where they tell apart house
+# numbers such as Queens' "107-20" from "10720"
+_HYPHEN = re.compile(r'-(?!\d)|(?<!\d)-')
+_ZIP_PLUS_4 = re.compile(r'(\d{5})-?\d{4}')
+
+
+def _street_end(tokens):
+    """Index of the last token of the street: its first suffix, else its first word."""
+    for index in range(1, len(tokens)):
+        if tokens[index] in _STREET_SUFFIX_TOKENS:
+            return index
+    return 1
+
+
+@lru_cache(maxsize=4096)
+def normalize_address(address):
+    """
+    Canonicalize a US street address so that different spellings of the same
+    address compare equal, e.g. "123 Main Street, Apt 4" and "123 main st #4".
+
+    Street suffixes, directionals and ordinals are abbreviated wherever they
+    appear, unit designators after the street and state names before the
+    ZIP code or at the end, when a city comes between them and the street. Punctuation is dropped, except hyphens between
+    digits, and ZIP+4 codes are reduced to their 5-digit ZIP. The result is
+    meant for comparison and cache keys, not for display or provider requests.
+
+    Args:
+        address (str): Free-form address
+
+    Returns:
+        str: Canonical upper-case address
+
+    Raises:
+        ValueError: If the address has no letters or digits, as all such
+            addresses would share one canonical form
+    """
+    tokens = _HYPHEN.sub('', address.upper()).translate(_PUNCTUATION).split()
+    if not any(character.isalnum() for token in tokens for character in token):
+        raise ValueError(f"Address {address!r} has no letters or digits")
+
+    for country in _COUNTRY_SUFFIXES:
+        if tokens[-len(country):] == country and len(tokens) > len(country):
+            del tokens[-len(country):]
+            break
+
+    # The state is the last token, or the one before the ZIP code, and follows
+    # a city: in "1 Main St, Washington" the last word is the city
+    street_end = _street_end(tokens)
+    end = len(tokens)
+    if len(tokens) > 1:
+        zip_code = _ZIP_PLUS_4.fullmatch(tokens[-1])
+        if zip_code:
+            tokens[-1] = zip_code.group(1)
+        if len(tokens[-1]) == 5 and tokens[-1].isdigit():
+            end -= 1
+    state = None
+    for name, code in _STATE_NAMES:
+        if end - len(name) > street_end + 1 and tuple(tokens[end - len(name):end]) == name:
+            tokens[end - len(name):end] = [code]
+            state = end - len(name)
+            break
+
+    return ' '.join([
+        _UNIT_TABLE.get(token, _TOKEN_TABLE.get(token, token))
+        if index > street_end and index != state
+        else _TOKEN_TABLE.get(token, token)
+        for index, token in enumerate(tokens)
+    ])
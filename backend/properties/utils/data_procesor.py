@@ -1,5 +1,6 @@
 import logging
 import importlib
+from django.core.exceptions import ImproperlyConfigured
 
 logger = logging.getLogger(__name__)
 
@@ -7,6 +8,9 @@ class DataProcessor:
     """
     Utility class for standardizing and processing property data from different providers.
     """
+
+    # Compiled mapping extractors keyed by provider name
+    _extractors = {}
     
     @staticmethod
     def standardize_data(data, mapping, provider_name):
@@ -22,43 +26,20 @@ class DataProcessor:
             dict: Standardized property data
         """
         if 'error' in data:
-            logger.error(f"Error in data from {provider_name}: {data['error']}")
+            logger.error("Error in data from %s: %s", provider_name, data['error'])
             return {'error': data['error'], 'provider': provider_name}
 
         try:
             property_data = data.get('data', {})
             if not property_data:
-                logger.warning(f"Empty data received from {provider_name}")
+                logger.warning("Empty data received from %s", provider_name)
                 return {'error': 'No data available', 'provider': provider_name}
-                
-            standardized = {}
-
-            for target_field, source_field in mapping.items():
-                try:
-                    # Case 1: Field with transformation function
-                    if isinstance(source_field, tuple) and len(source_field) == 2 and callable(source_field[1]):
-                        field_name, transform_func = source_field
-                        value = property_data.get(field_name)
-                        standardized[target_field] = transform_func(value) if value is not None else None
-                        
-                    # Case 2: Nested field path
-                    elif isinstance(source_field, tuple):
-                        nested_data = property_data
-                        for nested_field in source_field:
-                            if isinstance(nested_data, dict):
-                                nested_data = nested_data.get(nested_field)
-                            else:
-                                nested_data = None
-                                break
-                        standardized[target_field] = nested_data
-
-                    # Case 3: Direct field mapping
-                    else:
-                        standardized[target_field] = property_data.get(source_field)
-
-                except Exception as e:
-                    logger.error(f"Error processing field {target_field} from {provider_name}: {str(e)}")
-                    standardized[target_field] = None
+
+            try:
+                standardized = DataProcessor.get_extractor(mapping, provider_name)(property_data)
+            except Exception:
+                # The interpreted loop isolates the failing field
+                standardized = DataProcessor._extract_fields(property_data, mapping, provider_name)
 
             # Post-processing
             DataProcessor._apply_post_processing(standardized)
@@ -69,9 +50,173 @@ class DataProcessor:
             return standardized
 
         except Exception as e:
-            logger.error(f"Error standardizing data from {provider_name}: {str(e)}")
+            logger.error("Error standardizing data from %s: %s", provider_name, e)
             return {'error': f'Error standardizing data: {str(e)}', 'provider': provider_name}
     
+    @staticmethod
+    def _extract_fields(property_data, mapping, provider_name):
+        """
+        Interpret a field mapping against raw provider data, one field at a
+        time. Reference implementation of the compiled extractors.
+        
+        Args:
+            property_data (dict): Raw property data from the provider
+            mapping (dict): Field mapping configuration
+            provider_name (str): Name of the provider
+            
+        Returns:
+            dict: Standardized fields, None for fields that failed
+        """
+        standardized = {}
+
+        for target_field, source_field in mapping.items():
+            try:
+                # Case 1: Field with transformation function
+                if isinstance(source_field, tuple) and len(source_field) == 2 and callable(source_field[1]):
+                    field_name, transform_func = source_field
+                    value = property_data.get(field_name)
+                    standardized[target_field] = transform_func(value) if value is not None else None
+                    
+                # Case 2: Nested field path
+                elif isinstance(source_field, tuple):
+                    nested_data = property_data
+                    for nested_field in source_field:
+                        if isinstance(nested_data, dict):
+                            nested_data = nested_data.get(nested_field)
+                        else:
+                            nested_data = None
+                            break
+                    standardized[target_field] = nested_data
+
+                # Case 3: Direct field mapping
+                else:
+                    standardized[target_field] = property_data.get(source_field)
+
+            except Exception as e:
+                logger.error("Error processing field %s from %s: %s", target_field, provider_name, e)
+                standardized[target_field] = None
+
+        return standardized
+    
+    @staticmethod
+    def get_extractor(mapping, provider_name):
+        """
+        Get the compiled extractor of a mapping, compiling it on first use if
+        it was not compiled at startup.
+        
+        Args:
+            mapping (dict): Field mapping configuration
+            provider_name (str): Name of the provider
+            
+        Returns:
+            function: Extractor turning raw property data into standardized fields
+        """
+        extractor = DataProcessor._extractors.get(provider_name)
+        if extractor is None or extractor.mapping is not mapping:
+            extractor = DataProcessor.compile_mapping(mapping, provider_name)
+            DataProcessor._extractors[provider_name] = extractor
+        return extractor
+    
+    @staticmethod
+    def compile_mappings(provider_configs):
+        """
+        Compile the mapping of every provider, reporting all invalid fields at
+        once. Called when the app is loaded.
+        
+        Args:
+            provider_configs (dict): Provider configurations keyed by provider name
+            
+        Raises:
+            ImproperlyConfigured: If any mapping is invalid
+        """
+        errors = []
+        for provider_name, config in provider_configs.items():
+            try:
+                DataProcessor._extractors[provider_name] = DataProcessor.compile_mapping(
+                    config['mapping'], provider_name
+                )
+            except ImproperlyConfigured as e:
+                errors.append(str(e))
+        if errors:
+            raise ImproperlyConfigured('\n'.join(errors))
+    
+    @staticmethod
+    def compile_mapping(mapping, provider_name):
+        """
+        Compile a field mapping into a single generated function, so the
+        mapping shape is only inspected once instead of for every record.
+        
+        The extractor returns the same fields as ``_extract_fields`` and
+        raises instead of isolating a failing field.
+        
+        Args:
+            mapping (dict): Field mapping configuration
+            provider_name (str): Name of the provider
+            
+        Returns:
+            function: Extractor turning raw property data into standardized fields
+            
+        Raises:
+            ImproperlyConfigured: If the mapping is invalid
+        """
+        if not isinstance(mapping, dict):
+            raise ImproperlyConfigured(f"Mapping of {provider_name} must be a dict")
+
+        errors = []
+        namespace = {}
+        lines = ['def extract(data):']
+        fields = []
+        for index, (target_field, source_field) in enumerate(mapping.items()):
+            if not isinstance(target_field, str):
+                errors.append(f"{target_field!r}: target field must be a string")
+                continue
+
+            value = f'value{index}'
+            # Case 1: Field with transformation function
+            if isinstance(source_field, tuple) and len(source_field) == 2 and callable(source_field[1]):
+                field_name, transform_func = source_field
+                if not isinstance(field_name, str):
+                    errors.append(f"{target_field}: source field must be a string")
+                    continue
+                namespace[f'transform{index}'] = transform_func
+                lines.append(f'    {value} = data.get({field_name!r})')
+                fields.append(
+                    f'{target_field!r}: transform{index}({value}) if {value} is not None else None'
+                )
+
+            # Case 2: Nested field path
+            elif isinstance(source_field, tuple):
+                if not source_field or not all(isinstance(key, str) for key in source_field):
+                    errors.append(
+                        f"{target_field}: nested path must be a non-empty tuple of strings, "
+                        f"or a (field, callable) pair"
+                    )
+                    continue
+                lines.append(f'    {value} = data')
+                for nested_field in source_field:
+                    lines.append(
+                        f'    {value} = {value}.get({nested_field!r}) if isinstance({value}, dict) else None'
+                    )
+                fields.append(f'{target_field!r}: {value}')
+
+            # Case 3: Direct field mapping
+            elif isinstance(source_field, str):
+                fields.append(f'{target_field!r}: data.get({source_field!r})')
+
+            else:
+                errors.append(f"{target_field}: unsupported source {source_field!r}")
+
+        if errors:
+            raise ImproperlyConfigured(
+                f"Invalid mapping for {provider_name}: {'; '.join(errors)}"
+            )
+
+        lines.append('    return {' + ', '.join(fields) + '}')
+        exec(compile('\n'.join(lines), f'<mapping {provider_name}>', 'exec'), namespace)
+        extractor = namespace['extract']
+        extractor.mapping = mapping
+        return extractor
+    
     @staticmethod
     def _apply_post_processing(data):
         """
@@ -109,5 +254,5 @@ class DataProcessor:
             module = importlib.import_module(module_path)
             return getattr(module, class_name)
         except (ImportError, AttributeError) as e:
-            logger.error(f"Error loading service class {service_class_path}: {str(e)}")
+            logger.error("Error loading service class %s: %s", service_class_path, e)
             raise ImportError(f"Could not import {service_class_path}")
\ No newline at end of file
@@ -0,0 +1,69 @@
+import time
+from django.conf import settings
+
+
+class Deadline:
+    """
+    Point in time by which a request has to answer, shared by every provider
+    call made for it.
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+
+    def remaining(self):
+        """
+        Seconds left before the deadline.
+
+        Returns:
+            float: Remaining seconds, 0 once the deadline has passed
+        """
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def expired(self):
+        """Whether the deadline has passed."""
+        return time.monotonic() >= self.expires_at
+
+    def cap(self, timeout):
+        """
+        Cap a timeout so it ends no later than the deadline.
+
+        Args:
+            timeout (float): Timeout in seconds
+
+        Returns:
+            float: The smaller of ``timeout`` and the remaining seconds
+        """
+        return min(timeout, self.remaining())
+
+
+def request_deadline(requested=None, default=None, maximum=None):
+    """
+    Start the deadline of a request.
+
+    Args:
+        requested (str, optional): Budget in seconds asked for by the client,
+            capped at ``maximum``. ``default`` is used when omitted.
+        default (float, optional): Budget of a request that does not ask for
+            one, REQUEST_DEADLINE when omitted
+        maximum (float, optional): Largest budget a request may ask for,
+            REQUEST_DEADLINE_MAX when omitted
+
+    Returns:
+        Deadline: The request deadline
+
+    Raises:
+        ValueError: If the requested budget is not a positive number
+    """
+    if default is None:
+        default = getattr(settings, "REQUEST_DEADLINE", 10)
+    if maximum is None:
+        maximum = getattr(settings, "REQUEST_DEADLINE_MAX", 30)
+    budget = default
+    if requested is not None:
+        budget = float(requested)
+        if not budget > 0 or budget == float("inf"):
+            raise ValueError(f"Invalid deadline {requested!r}")
+        budget = min(budget, maximum)
+    return Deadline(budget)
@@ -0,0 +1,295 @@
+import os
+import threading
+from django.conf import settings
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+except ImportError:  # pragma: no cover - optional dependency
+    prometheus_client = None
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+class PropertyMetrics:
+    """
+    Prometheus metrics of the property lookups.
+
+    Labelled children are looked up once and kept, so an update on the hot
+    path costs a dict lookup and the metric's own increment. Under gunicorn,
+    ``PROMETHEUS_MULTIPROC_DIR`` makes every worker write its values to a
+    shared directory that ``render`` aggregates; gauges then add up the
+    values of the live workers.
+
+    Args:
+        registry (CollectorRegistry, optional): Registry the metrics are
+            registered with, the default one when omitted
+        buckets (tuple, optional): Latency histogram buckets in seconds
+    """
+
+    def __init__(self, registry=None, buckets=DEFAULT_LATENCY_BUCKETS):
+        registry = registry or prometheus_client.REGISTRY
+        self.registry = registry
+        self._children = {}
+        self.provider_duration = prometheus_client.Histogram(
+            "property_provider_call_duration_seconds",
+            "Duration of the HTTP calls to each provider, whatever their outcome",
+            ["provider"],
+            buckets=buckets,
+            registry=registry,
+        )
+        self.provider_calls = prometheus_client.Counter(
+            "property_provider_calls_total",
+            "Provider calls by outcome: ok, error, timeout or rate_limited",
+            ["provider", "outcome"],
+            registry=registry,
+        )
+        self.provider_in_flight = prometheus_client.Gauge(
+            "property_provider_calls_in_flight",
+            "Provider calls waiting for an answer",
+            ["provider"],
+            multiprocess_mode="livesum",
+            registry=registry,
+        )
+        self.cache_lookups = prometheus_client.Counter(
+            "property_cache_lookups_total",
+            "Cache lookups by tier (l1, redis, store), key (provider, combined "
+            "or response) and result (hit or miss)",
+            ["tier", "key", "result"],
+            registry=registry,
+        )
+        self.redis_duration = prometheus_client.Histogram(
+            "property_redis_duration_seconds",
+            "Duration of the Redis round-trips of the cache, by operation",
+            ["operation"],
+            buckets=buckets,
+            registry=registry,
+        )
+        self.validation_failures = prometheus_client.Counter(
+            "property_validation_failures_total",
+            "Standardized provider records failing serializer validation, by field",
+            ["provider", "field"],
+            registry=registry,
+        )
+        self.executor_pending = prometheus_client.Gauge(
+            "property_executor_pending",
+            "Calls running or queued in each thread pool",
+            ["executor"],
+            multiprocess_mode="livesum",
+            registry=registry,
+        )
+        self.executor_queued = prometheus_client.Gauge(
+            "property_executor_queue_depth",
+            "Calls waiting for a thread in each thread pool",
+            ["executor"],
+            multiprocess_mode="livesum",
+            registry=registry,
+        )
+        self.executor_rejections = prometheus_client.Counter(
+            "property_executor_rejections_total",
+            "Submissions rejected because a thread pool was full",
+            ["executor"],
+            registry=registry,
+        )
+        self.request_duration = prometheus_client.Histogram(
+            "property_request_duration_seconds",
+            "Duration of the property requests, by view and cache outcome",
+            ["view", "cache"],
+            buckets=buckets,
+            registry=registry,
+        )
+
+    def child(self, metric, *labels):
+        """Child of a labelled metric, created on first use."""
+        key = (id(metric), labels)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children.setdefault(key, metric.labels(*labels))
+        return child
+
+
+def get_metrics():
+    """
+    Get the process-wide metrics, creating them on first use.
+
+    Returns:
+        PropertyMetrics: Metrics, or None when ``METRICS_ENABLED`` is off or
+            prometheus_client is not installed
+    """
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                if prometheus_client is None or not getattr(settings, "METRICS_ENABLED", True):
+                    _metrics = False
+                else:
+                    _metrics = PropertyMetrics(
+                        buckets=getattr(settings, "METRICS_LATENCY_BUCKETS", DEFAULT_LATENCY_BUCKETS)
+                    )
+    return _metrics or None
+
+
+def provider_call_started(provider_name):
+    metrics = get_metrics()
+    if metrics is not None:
+        metrics.child(metrics.provider_in_flight, provider_name).inc()
+
+
+def provider_call_finished(provider_name, outcome, duration):
+    """
+    Record the end of an HTTP call started with ``provider_call_started``.
+
+    Args:
+        provider_name (str): Provider name
+        outcome (str): ``ok``, ``error``, ``timeout`` or ``rate_limited``
+        duration (float): Seconds since the call started
+    """
+    metrics = get_metrics()
+    if metrics is not None:
+        metrics.child(metrics.provider_in_flight, provider_name).dec()
+        metrics.child(metrics.provider_duration, provider_name).observe(duration)
+        metrics.child(metrics.provider_calls, provider_name, outcome).inc()
+
+
+def record_provider_outcome(provider_name, outcome):
+    """Count a provider call that was not made, e.g. shed by the rate limiter."""
+    metrics = get_metrics()
+    if metrics is not None:
+        metrics.child(metrics.provider_calls, provider_name, outcome).inc()
+
+
+def cache_key_label(cache_key):
+    """
+    Kind of entry a cache key holds: the provider of a provider entry,
+    ``combined`` or ``response``.
+    """
+    if cache_key.startswith("response:"):
+        return "response"
+    parts = cache_key.split(":", 2)
+    return parts[2] if len(parts) == 3 else "combined"
+
+
+def record_cache_lookups(tier, cache_keys, values):
+    """
+    Count the hits and misses of one read of a cache tier.
+
+    Args:
+        tier (str): ``l1``, ``redis`` or ``store``
+        cache_keys (list): Keys read
+        values (list): Values read in key order, None or empty for misses
+    """
+    metrics = get_metrics()
+    if metrics is None:
+        return
+    for cache_key, value in zip(cache_keys, values):
+        result = "hit" if value else "miss"
+        metrics.child(metrics.cache_lookups, tier, cache_key_label(cache_key), result).inc()
+
+
+def record_store_lookups(keys, records):
+    """
+    Count the hits and misses of one read of the property store.
+
+    Args:
+        keys (iterable): ``(address_hash, provider)`` keys read
+        records (dict): Records found, keyed alike
+    """
+    metrics = get_metrics()
+    if metrics is None:
+        return
+    for key in keys:
+        result = "hit" if key in records else "miss"
+        metrics.child(metrics.cache_lookups, "store", key[1], result).inc()
+
+
+def observe_redis(operation, duration):
+    metrics = get_metrics()
+    if metrics is not None:
+        metrics.child(metrics.redis_duration, operation).observe(duration)
+
+
+def record_validation_failure(provider_name, errors):
+    """
+    Count a record failing validation once per invalid field.
+
+    Args:
+        provider_name (str): Provider name
+        errors (dict): Validation errors keyed by field
+    """
+    metrics = get_metrics()
+    if metrics is not None:
+        for field in errors:
+            metrics.child(metrics.validation_failures, provider_name, field).inc()
+
+
+def set_executor_pending(executor, pending, max_workers):
+    """
+    Publish how many calls a thread pool holds and how many of them wait
+    for a thread.
+
+    Args:
+        executor (str): Thread pool name
+        pending (int): Calls running or queued
+        max_workers (int): Threads of the pool
+    """
+    metrics = get_metrics()
+    if metrics is not None:
+        metrics.child(metrics.executor_pending, executor).set(pending)
+        metrics.child(metrics.executor_queued, executor).set(max(pending - max_workers, 0))
+
+
+def record_executor_rejection(executor):
+    metrics = get_metrics()
+    if metrics is not None:
+        metrics.child(metrics.executor_rejections, executor).inc()
+
+
+def observe_request(view, cache, duration):
+    """
+    Record the duration of a property request.
+
+    Args:
+        view (str): View name, as in the request summary
+        cache (str): Cache outcome, None when the request did not get that far
+        duration (float): Seconds the request took
+    """
+    metrics = get_metrics()
+    if metrics is not None:
+        metrics.child(metrics.request_duration, view, cache or "none").observe(duration)
+
+
+def render():
+    """
+    Render every metric in the Prometheus text format, aggregating the
+    values of all workers in multi-process mode.
+
+    Returns:
+        tuple: Body and content type, or None when metrics are disabled
+    """
+    metrics = get_metrics()
+    if metrics is None:
+        return None
+    registry = metrics.registry
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return prometheus_client.generate_latest(registry), prometheus_client.CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid):
+    """
+    Drop the gauge values of a worker that exited, in multi-process mode.
+    Call it from gunicorn's ``child_exit`` hook::
+
+        def child_exit(server, worker):
+            from properties.utils.metrics import mark_process_dead
+            mark_process_dead(worker.pid)
+
+    Args:
+        pid (int): Process id of the worker
+    """
+    if prometheus_client is not None and os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
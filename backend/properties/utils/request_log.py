@@ -0,0 +1,175 @@
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import random
+import time
+from django.conf import settings
+from properties.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+_current = contextvars.ContextVar('property_request_summary', default=None)
+
+
+class RequestSummary:
+    """
+    Fields describing one request, logged as a single record when it ends.
+
+    The message is only rendered if a handler formats the record; the fields
+    are also attached to it as ``record.summary`` for structured handlers.
+    """
+
+    def __init__(self, view):
+        self.fields = {'view': view}
+        self.providers = {}
+        self.started = time.perf_counter()
+        self.sample_payloads = random.random() < getattr(settings, 'LOG_PAYLOAD_SAMPLE_RATE', 0.0)
+
+    def as_dict(self):
+        fields = dict(self.fields)
+        if self.providers:
+            fields['providers'] = dict(self.providers)
+        return fields
+
+    def __str__(self):
+        fields = self.as_dict()
+        if 'providers' in fields:
+            fields['providers'] = ','.join(
+                f'{name}:{outcome}' for name, outcome in fields['providers'].items()
+            )
+        return ' '.join(f'{name}={value}' for name, value in fields.items())
+
+
+class LazyJson:
+    """Payload serialized as indented JSON only when a log record is formatted."""
+
+    __slots__ = ('payload',)
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def __str__(self):
+        return json.dumps(self.payload, indent=2, default=str)
+
+
+def record(**fields):
+    """Add fields to the summary of the current request, if any."""
+    summary = _current.get()
+    if summary is not None:
+        summary.fields.update(fields)
+
+
+def record_provider(provider_name, outcome):
+    """Record the outcome of one provider in the summary of the current request."""
+    summary = _current.get()
+    if summary is not None:
+        summary.providers[provider_name] = outcome
+
+
+def dump_payloads(log=logger):
+    """
+    Whether payloads should be dumped for the current request: DEBUG is
+    enabled on ``log`` and the request was picked by LOG_PAYLOAD_SAMPLE_RATE.
+
+    Returns:
+        bool: True if payload dumps should be logged
+    """
+    if not log.isEnabledFor(logging.DEBUG):
+        return False
+    summary = _current.get()
+    return summary is not None and summary.sample_payloads
+
+
+def payload(value):
+    """Wrap a payload so it is only serialized if its log record is emitted."""
+    return LazyJson(value)
+
+
+def _finish(summary, status_code):
+    duration = time.perf_counter() - summary.started
+    metrics.observe_request(summary.fields['view'], summary.fields.get('cache'), duration)
+    if not getattr(settings, 'LOG_REQUEST_SUMMARY', True) or not logger.isEnabledFor(logging.INFO):
+        return
+    summary.fields['status'] = status_code
+    summary.fields['duration_ms'] = round(duration * 1000, 1)
+    logger.info('%s', summary, extra={'summary': summary.as_dict()})
+
+
+def _stream(summary, content, status_code):
+    """
+    Iterate over the content of a streaming response within its request,
+    logging the summary once the last chunk is sent or the client goes away.
+
+    The summary is made current around each chunk only, since a server may
+    produce every chunk in a different context.
+    """
+    iterator = iter(content)
+    try:
+        while True:
+            token = _current.set(summary)
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                _current.reset(token)
+            yield chunk
+    finally:
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            close()
+        _finish(summary, status_code)
+
+
+def _response(summary, response):
+    """Log the summary now, or once the body is sent for streaming responses."""
+    if getattr(response, 'streaming', False):
+        response.streaming_content = _stream(
+            summary, response.streaming_content, response.status_code
+        )
+    else:
+        _finish(summary, response.status_code)
+    return response
+
+
+def logged_request(view):
+    """
+    Decorate a view method so the request it handles ends with one summary
+    record. Works on both regular and ``async`` methods; the summary of a
+    streaming response is logged when its stream ends.
+
+    Args:
+        view (str): Name of the view in the summary
+    """
+    def decorator(method):
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(*args, **kwargs):
+                summary = RequestSummary(view)
+                token = _current.set(summary)
+                try:
+                    response = await method(*args, **kwargs)
+                except BaseException:
+                    _finish(summary, 500)
+                    raise
+                finally:
+                    _current.reset(token)
+                return _response(summary, response)
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            summary = RequestSummary(view)
+            token = _current.set(summary)
+            try:
+                response = method(*args, **kwargs)
+            except BaseException:
+                _finish(summary, 500)
+                raise
+            finally:
+                _current.reset(token)
+            return _response(summary, response)
+        return wrapper
+    return decorator
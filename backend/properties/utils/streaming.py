@@ -0,0 +1,52 @@
+import abc
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+
+class StreamRenderer(BaseRenderer, metaclass=abc.ABCMeta):
+    """
+    Renderer of a stream of events, each a JSON object.
+
+    Streamed responses write their events with ``frame``. A regular response
+    negotiated with this renderer, such as a validation error, is rendered as
+    a single ``error`` event so clients only ever parse one format.
+    """
+
+    charset = None
+
+    @abc.abstractmethod
+    def frame(self, event, data):
+        """
+        Encode one event of the stream.
+
+        Args:
+            event (str): Event type, e.g. ``result`` or ``summary``
+            data (dict): Event payload
+
+        Returns:
+            bytes: Encoded event
+        """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return self.frame("error", data)
+
+
+class NDJSONRenderer(StreamRenderer):
+    """Newline-delimited JSON, one object per event with its type under ``type``."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def frame(self, event, data):
+        return JSONRenderer().render({"type": event, **data}) + b"\n"
+
+
+class EventStreamRenderer(StreamRenderer):
+    """Server-Sent Events, the payload of each event sent as a JSON data line."""
+
+    media_type = "text/event-stream"
+    format = "sse"
+
+    def frame(self, event, data):
+        return b"event: %s\ndata: %s\n\n" % (event.encode(), JSONRenderer().render(data))
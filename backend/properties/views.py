@@ -1,20 +1,47 @@
+import asyncio
+import collections
 import logging
 import concurrent.futures
-import json
+import time
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views import View
+from rest_framework.renderers import JSONRenderer
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.settings import api_settings
+from properties.utils import metrics, request_log
+from properties.utils.address_normalizer import normalize_address
 from properties.utils.data_procesor import DataProcessor
-from properties.services.cache_service import CacheService
+from properties.utils.deadline import request_deadline
+from properties.utils.request_log import logged_request
+from properties.utils.streaming import EventStreamRenderer, NDJSONRenderer, StreamRenderer
+from properties.services.cache_service import CacheService, aclose_async_pool
+from properties.services import circuit_breaker as circuits
+from properties.services.circuit_breaker import circuit_breaker
+from properties.services.provider_clients import provider_clients
+from properties.services.provider_latency import provider_latency
+from properties.services.rate_limiter import BACKGROUND, BATCH, INTERACTIVE
+from properties.services.single_flight import provider_fetches
+from properties.services.provider_executor import (
+    ExecutorSaturatedError,
+    get_provider_executor,
+    get_refresh_executor,
+)
 from properties.config.providers import PROVIDER_CONFIGS
-from properties.serializers.properties_serializer import PropertyDetailsSerializer
+from properties.serializers.lean_serializer import property_details_serializer
 
 logger = logging.getLogger(__name__)
 
+# Key marking a combined cache entry item that points at a provider entry
+CACHE_REFERENCE_KEY = "$ref"
 
-class PropertyDetailsView(APIView):
+
+class PropertyLookupMixin:
     """
-    API view for retrieving property details from multiple providers.
+    Shared provider fan-out and standardization logic for the property views.
     """
 
     def __init__(self, *args, **kwargs):
@@ -22,64 +49,223 @@ class PropertyDetailsView(APIView):
         self.cache_service = CacheService()
         self.data_processor = DataProcessor()
 
-    def get(self, request):
+    @staticmethod
+    def _cache_lookups(address):
         """
-        GET method to retrieve property details.
+        Cache entries read for a single address: the combined results followed
+        by every provider-specific entry.
 
         Args:
-            request: HTTP request object
+            address (str): Property address
 
         Returns:
-            Response: REST framework response with property data
+            list: ``(address, provider)`` pairs, None for the combined entry
         """
-        # Validate address parameter
-        address = request.query_params.get("address")
-        if not address or len(address.strip()) == 0:
-            return Response(
-                {"error": "Missing or empty address parameter"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+        return [(address, None)] + [
+            (address, provider_name) for provider_name in PROVIDER_CONFIGS
+        ]
 
-        logger.info(f"Processing request for address: {address}")
+    @staticmethod
+    def _address_error(address):
+        """
+        Check that an address can be looked up, i.e. that it has a canonical
+        form of its own.
 
-        # Check cache first (-> Reminder: Only 24h cache)
-        cached_results = self.cache_service.get(address)
-        if cached_results:
-            logger.info(f"Returning cached results for address: {address}")
-            logger.debug(f"Cached data content: {json.dumps(cached_results, indent=2)}")
+        Args:
+            address (str): Property address
 
-            # Mark data as coming from the cache
-            for result in cached_results:
-                if isinstance(result, dict):
-                    result["cached"] = True
-                    # Log provider name for each cached result
-                    provider = result.get("provider", "unknown")
-                    logger.info(f"Cached result from provider: {provider}")
+        Returns:
+            str: Error message, or None if the address is valid
+        """
+        try:
+            normalize_address(address)
+        except ValueError as e:
+            return str(e)
+        return None
 
-            # Serialize cache data
-            serializer = PropertyDetailsSerializer(cached_results, many=True)
-            return Response(serializer.data)
+    @staticmethod
+    def _fresh_provider_entries(cached_entries):
+        """
+        Pick the provider-specific entries that are not past their soft TTL.
 
-        # Fetch data from providers
-        logger.info(f"No cache found for {address}. Fetching from providers...")
-        results = self._fetch_provider_data(address)
+        Args:
+            cached_entries (dict): ``(data, is_stale)`` tuples keyed by
+                ``(address, provider)``
 
-        # Log raw results from each provider
-        for provider_name, result in results.items():
-            logger.debug(
-                f"Raw result from {provider_name}: {json.dumps(result, indent=2)}"
-            )
+        Returns:
+            dict: Fresh cache entries keyed by provider name
+        """
+        return {
+            provider_name: data
+            for (_, provider_name), (data, is_stale) in cached_entries.items()
+            if provider_name is not None and not is_stale
+        }
+
+    @staticmethod
+    def _timeout_result(provider_name):
+        """
+        Result recorded for a provider that did not answer in time.
+
+        Args:
+            provider_name (str): Provider name
+
+        Returns:
+            dict: Error entry marked as a timeout
+        """
+        request_log.record_provider(provider_name, "timeout")
+        return {"error": f"Timeout fetching data from {provider_name}", "timeout": True}
+
+    @staticmethod
+    def _circuit_open_result(provider_name):
+        """
+        Result recorded for a provider that is not called because its circuit
+        breaker is open.
+
+        Args:
+            provider_name (str): Provider name
+
+        Returns:
+            dict: Error entry marked as unavailable
+        """
+        request_log.record_provider(provider_name, "circuit_open")
+        return {
+            "error": f"{provider_name} is unavailable, skipped while its circuit breaker is open",
+            "circuit_open": True,
+        }
+
+    @staticmethod
+    def _deadline_or_error(params, default=None, maximum=None):
+        """
+        Start the request deadline from the optional ``deadline`` parameter.
+
+        Args:
+            params: Query parameters of the request
+            default (float, optional): Budget when the parameter is omitted,
+                REQUEST_DEADLINE when omitted
+            maximum (float, optional): Largest budget the parameter may ask
+                for, REQUEST_DEADLINE_MAX when omitted
+
+        Returns:
+            tuple: (Deadline, None), or (None, error message) if the parameter
+                is invalid
+        """
+        try:
+            return request_deadline(params.get("deadline"), default, maximum), None
+        except ValueError:
+            return None, "Invalid deadline parameter, expected a positive number of seconds"
+
+    @staticmethod
+    def _cache_writes(address, results, standardized_data, validated):
+        """
+        Cache entries written after a provider fetch for a single address.
+
+        Args:
+            address (str): Property address
+            results (dict): Raw results keyed by provider name
+            standardized_data (list): Combined standardized results
+            validated (dict): Freshly validated data keyed by provider name
+
+        Returns:
+            dict: Data keyed by ``(address, provider)``, None for the combined entry
+        """
+        writes = {
+            (address, provider_name): validated_data
+            for provider_name, validated_data in validated.items()
+        }
+        # The combined entry references the provider entries, written alongside
+        # it or served from the cache, instead of storing a second copy of
+        # their data
+        references = {
+            id(result): provider_name
+            for provider_name, result in results.items()
+            if result.get("cached") and "data" not in result and "error" not in result
+        }
+        references.update(
+            (id(validated_data), provider_name)
+            for provider_name, validated_data in validated.items()
+        )
+        writes[(address, None)] = [
+            {CACHE_REFERENCE_KEY: references[id(item)]}
+            if id(item) in references
+            else item
+            for item in standardized_data
+        ]
+        return writes
+
+    @staticmethod
+    def _render_cached_response(standardized_data):
+        """
+        Render the response body served as-is for later cache hits.
+
+        Args:
+            standardized_data (list): Combined standardized results
+
+        Returns:
+            bytes: JSON body with every record marked as cached
+        """
+        cached_results = [
+            dict(item, cached=True, stale=False) for item in standardized_data
+        ]
+        return JSONRenderer().render(
+            property_details_serializer.to_representation_many(cached_results)
+        )
+
+    @staticmethod
+    def _resolve_cached_results(address, cached_entries):
+        """
+        Rebuild the combined results of an address from the cache entries read
+        by ``_cache_lookups``, replacing references with the provider entries.
+
+        Args:
+            address (str): Property address
+            cached_entries (dict): ``(data, is_stale)`` tuples keyed by
+                ``(address, provider)``
+
+        Returns:
+            tuple: Combined results, or None when they are not cached or a
+                referenced provider entry has expired, and whether they are stale
+        """
+        combined, stale = cached_entries.get((address, None), (None, False))
+        if not combined:
+            return None, False
+
+        results = []
+        for item in combined:
+            if isinstance(item, dict) and CACHE_REFERENCE_KEY in item:
+                referenced = cached_entries.get((address, item[CACHE_REFERENCE_KEY]))
+                if referenced is None:
+                    return None, False
+                data, referenced_stale = referenced
+                results.append(dict(data))
+                stale = stale or referenced_stale
+            else:
+                results.append(item)
+        return results, stale
+
+    def _standardize_provider_results(self, results):
+        """
+        Standardize and validate the raw results of every provider.
+
+        Args:
+            results (dict): Raw results keyed by provider name
+
+        Returns:
+            tuple: Standardized property data, one entry per provider, and the
+                freshly validated data keyed by provider name
+        """
+        # Log raw results from each provider (sampled)
+        if request_log.dump_payloads(logger):
+            for provider_name, result in results.items():
+                logger.debug(
+                    "Raw result from %s: %s", provider_name, request_log.payload(result)
+                )
 
-        # Process results
         standardized_data = []
+        validated = {}
         for provider_name, result in results.items():
-            logger.info(f"Processing data from provider: {provider_name}")
-
             # Skip processing if there was an error
             if "error" in result:
-                logger.warning(
-                    f"Error from provider {provider_name}: {result['error']}"
-                )
+                logger.warning("Error from provider %s: %s", provider_name, result["error"])
                 standardized_data.append(
                     {
                         "provider": provider_name,
@@ -89,132 +275,1429 @@ class PropertyDetailsView(APIView):
                 )
                 continue
 
+            # Provider-level cache entries are already standardized
+            if "data" not in result and result.get("cached"):
+                standardized_data.append(result)
+                continue
+
             if provider_name in PROVIDER_CONFIGS:
                 mapping = PROVIDER_CONFIGS[provider_name]["mapping"]
-                logger.debug(f"Using mapping for {provider_name}: {mapping}")
-
                 standardized = DataProcessor.standardize_data(
                     result, mapping, provider_name
                 )
-                logger.debug(
-                    f"Standardized data for {provider_name}: {json.dumps(standardized, indent=2)}"
-                )
 
                 # Mark as not coming from the cache
                 standardized["cached"] = False
 
-                # Validate data using the serializer
-                serializer = PropertyDetailsSerializer(data=standardized)
-                if serializer.is_valid():
+                # Validate data with the same rules as PropertyDetailsSerializer
+                validated_data, errors = property_details_serializer.validate(
+                    standardized
+                )
+                if errors is None:
                     # Use validated data
-                    validated_data = serializer.validated_data
-                    logger.info(f"Data from {provider_name} successfully validated")
                     standardized_data.append(validated_data)
-
-                    # Cache individual provider results
-                    self.cache_service.set(address, validated_data, provider_name)
+                    validated[provider_name] = validated_data
                 else:
                     logger.warning(
-                        f"Validation failed for data from {provider_name}: {serializer.errors}"
+                        "Validation failed for data from %s: %s", provider_name, errors
                     )
+                    request_log.record_provider(provider_name, "invalid")
+                    metrics.record_validation_failure(provider_name, errors)
                     # Include data with errors to avoid losing information
-                    standardized["validation_errors"] = serializer.errors
+                    standardized["validation_errors"] = errors
                     standardized_data.append(standardized)
 
-        # Log final standardized data
-        logger.info(f"Total providers processed: {len(standardized_data)}")
-        for item in standardized_data:
-            provider = item.get("provider", "unknown")
-            logger.info(
-                f"Final data from provider {provider}: {json.dumps(item, indent=2)}"
+        # Log final standardized data (sampled)
+        if request_log.dump_payloads(logger):
+            for item in standardized_data:
+                logger.debug(
+                    "Final data from provider %s: %s",
+                    item.get("provider", "unknown"),
+                    request_log.payload(item),
+                )
+
+        return standardized_data, validated
+
+    @staticmethod
+    def _saturated_response(error):
+        """
+        Build the fast-fail response used when the provider executor is full.
+
+        Args:
+            error (ExecutorSaturatedError): Rejection raised by the executor
+
+        Returns:
+            Response: 503 response with a Retry-After header
+        """
+        logger.warning("Rejecting request: %s", error)
+        return Response(
+            {"error": "Service is busy, please retry later"},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(error.retry_after)},
+        )
+
+    @staticmethod
+    def _mark_cached(cached_results, stale=False):
+        """
+        Mark cached results as coming from the cache.
+
+        Args:
+            cached_results (list): Cached standardized property data
+            stale (bool): Whether the results are past their soft TTL
+        """
+        for result in cached_results:
+            if isinstance(result, dict):
+                result["cached"] = True
+                result["stale"] = stale
+
+    @staticmethod
+    def _is_partial(results):
+        """
+        Whether results miss a provider that may answer if asked again: it
+        timed out, was skipped by its circuit breaker or was rate limited.
+
+        Args:
+            results (dict): Raw results keyed by provider name
+
+        Returns:
+            bool: True if the results are partial
+        """
+        return any(
+            result.get("timeout") or result.get("circuit_open") or result.get("rate_limited")
+            for result in results.values()
+        )
+
+    def _result_writes(self, address, results, standardized_data, validated):
+        """
+        Cache entries and response body written for the results of an address.
+
+        Results missing a provider that timed out or was skipped by its
+        circuit breaker are partial, so only their provider entries are
+        cached; the next lookup reuses them and asks the missing providers
+        again.
+
+        Args:
+            address (str): Property address
+            results (dict): Raw results keyed by provider name
+            standardized_data (list): Combined standardized results
+            validated (dict): Freshly validated data keyed by provider name
+
+        Returns:
+            tuple: Cache writes for ``set_many`` and the response bodies keyed
+                by address
+        """
+        writes = self._cache_writes(address, results, standardized_data, validated)
+        if self._is_partial(results):
+            del writes[(address, None)]
+            return writes, {}
+        return writes, {address: self._render_cached_response(standardized_data)}
+
+    def _fetch_and_cache(self, address, cached_entries, deadline=None, priority=INTERACTIVE):
+        """
+        Fetch, standardize and cache the results of every provider.
+
+        Args:
+            address (str): Property address
+            cached_entries (dict): Provider-specific cache entries keyed by
+                provider name
+            deadline (Deadline, optional): Request deadline, a default one is
+                started when omitted
+            priority (str): Rate limiting priority of the provider calls
+
+        Returns:
+            list: Standardized property data, one entry per provider
+        """
+        results = self._fetch_provider_data(address, cached_entries, deadline, priority)
+
+        # Process results
+        standardized_data, validated = self._standardize_provider_results(results)
+
+        # Cache individual provider results and the combined results together
+        writes, responses = self._result_writes(
+            address, results, standardized_data, validated
+        )
+        self.cache_service.set_many(writes, responses=responses)
+        return standardized_data
+
+    def _timeout_results(self, cached_entries):
+        """
+        Results of a follower whose leader did not answer in time: the
+        cached provider entries, and timeouts for the other providers.
+
+        Args:
+            cached_entries (dict): Provider-specific cache entries keyed by
+                provider name
+
+        Returns:
+            list: Standardized property data, one entry per provider
+        """
+        results = {}
+        for provider_name in PROVIDER_CONFIGS:
+            cached_data = cached_entries.get(provider_name)
+            if cached_data:
+                results[provider_name] = dict(cached_data, cached=True)
+            else:
+                results[provider_name] = self._timeout_result(provider_name)
+        standardized_data, _ = self._standardize_provider_results(results)
+        return standardized_data
+
+    def _schedule_refresh(self, address):
+        """
+        Refresh the cached results of an address in the background.
+
+        At most one refresh per address runs in this process, and the fetch
+        lock keeps other workers from refreshing the same address at once.
+
+        Args:
+            address (str): Property address
+        """
+        try:
+            provider_fetches.submit(
+                f"refresh:{self.cache_service.get_cache_key(address)}",
+                lambda: self._refresh(address),
+                lambda task: get_refresh_executor().submit(None, task),
             )
+        except ExecutorSaturatedError:
+            logger.warning("Refresh queue is full, skipping refresh of %s", address)
 
-        # Cache combined results
-        self.cache_service.set(address, standardized_data)
+    def _refresh(self, address):
+        """
+        Fetch and cache fresh results for an address unless another worker
+        is already doing it.
 
-        # Serialize the final response
-        response_serializer = PropertyDetailsSerializer(standardized_data, many=True)
-        return Response(response_serializer.data)
+        Args:
+            address (str): Property address
 
-    def _fetch_provider_data(self, address):
+        Returns:
+            list: Standardized property data, or None if skipped
+        """
+        lock_token = self.cache_service.acquire_lock(
+            address, getattr(settings, "SINGLE_FLIGHT_LOCK_TTL", 35)
+        )
+        if lock_token is None:
+            logger.info("Another worker is refreshing %s", address)
+            return None
+
+        try:
+            logger.info("Refreshing stale results for %s", address)
+            return self._fetch_and_cache(address, {}, priority=BACKGROUND)
+        except Exception as e:
+            logger.error("Error refreshing %s: %s", address, e)
+            return None
+        finally:
+            self.cache_service.release_lock(address, lock_token)
+
+    def _fetch_provider_data(
+        self, address, cached_entries=None, deadline=None, priority=INTERACTIVE
+    ):
         """
         Fetch property data from all providers concurrently.
 
+        Results are collected as they complete. Providers that have not
+        answered by the request deadline, or by their own timeout, are
+        reported as timeouts.
+
         Args:
             address (str): Property address
+            cached_entries (dict, optional): Provider-specific cache entries
+                already read by the caller, keyed by provider name. They are
+                read in one round-trip when omitted.
+            deadline (Deadline, optional): Request deadline, a default one is
+                started when omitted
+            priority (str): Rate limiting priority of the provider calls,
+                interactive by default
 
         Returns:
             dict: Results from all providers
         """
+        results = dict(
+            self._iter_provider_data(address, cached_entries, deadline, priority)
+        )
+
+        # Keep provider results in configuration order
+        return {
+            provider_name: results[provider_name]
+            for provider_name in PROVIDER_CONFIGS
+            if provider_name in results
+        }
+
+    def _iter_provider_data(
+        self, address, cached_entries=None, deadline=None, priority=INTERACTIVE
+    ):
+        """
+        Call every provider concurrently and iterate over their results as
+        they arrive, see ``_fetch_provider_data``.
+
+        Calls are submitted before this returns, so ``ExecutorSaturatedError``
+        is raised here rather than while iterating.
+
+        Args:
+            address (str): Property address
+            cached_entries (dict, optional): Provider-specific cache entries
+                keyed by provider name, read when omitted
+            deadline (Deadline, optional): Request deadline, a default one is
+                started when omitted
+            priority (str): Rate limiting priority of the provider calls
+
+        Returns:
+            iterator: ``(provider_name, result)`` pairs, results known without
+                calling the provider first, then the others in completion order
+        """
+        if deadline is None:
+            deadline = request_deadline()
         results = {}
-        logger.info(
-            f"Starting data fetch from {len(PROVIDER_CONFIGS)} providers for address: {address}"
+        if cached_entries is None:
+            cached_entries = self._fresh_provider_entries(
+                self.cache_service.get_many_with_staleness(
+                    self._cache_lookups(address)[1:]
+                )
+            )
+        executor = get_provider_executor()
+        futures = {}
+        services = {}
+
+        # Providers with an open circuit fail fast instead of holding a thread
+        circuit_states, probes = circuit_breaker.admit_many(
+            provider_name
+            for provider_name in PROVIDER_CONFIGS
+            if not cached_entries.get(provider_name)
         )
 
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=len(PROVIDER_CONFIGS)
-        ) as executor:
-            futures = {}
+        # Submit requests to all providers
+        for provider_name, config in PROVIDER_CONFIGS.items():
+            # Check provider-specific cache
+            cached_data = cached_entries.get(provider_name)
+            if cached_data:
+                cached_data["cached"] = True  # Mark as coming from the cache
+                results[provider_name] = cached_data
+                request_log.record_provider(provider_name, "cached")
+                continue
 
-            # Submit requests to all providers
-            for provider_name, config in PROVIDER_CONFIGS.items():
-                logger.info(f"Processing provider: {provider_name}")
+            if circuit_states[provider_name] == circuits.OPEN:
+                results[provider_name] = self._circuit_open_result(provider_name)
+                continue
 
-                # Check provider-specific cache
-                cached_data = self.cache_service.get(address, provider_name)
-                if cached_data:
-                    logger.info(f"Using cached data for provider: {provider_name}")
-                    cached_data["cached"] = True  # Mark as coming from the cache
-                    results[provider_name] = cached_data
-                    continue
+            # Load service class dynamically
+            try:
+                logger.debug(
+                    "Getting service for %s: %s", provider_name, config['service_class']
+                )
+                service = provider_clients.get_service(provider_name)
+            except Exception as e:
+                logger.error(
+                    "Error initializing service for %s: %s", provider_name, e
+                )
+                results[provider_name] = {
+                    "error": f"Service initialization error: {str(e)}"
+                }
+                request_log.record_provider(provider_name, "error")
+                continue
 
-                # Load service class dynamically
-                try:
-                    logger.debug(
-                        f"Initializing service class for {provider_name}: {config['service_class']}"
-                    )
-                    service_class = DataProcessor.load_service_class(
-                        config["service_class"]
-                    )
-                    service = service_class()
+            # Submit to the shared provider executor, handing a half-open
+            # circuit's probe token to its probe call
+            kwargs = {"priority": priority}
+            if provider_name in probes:
+                kwargs["probe"] = probes[provider_name]
+            try:
+                futures[provider_name] = executor.submit(
+                    provider_name, service.get_property_details, address, **kwargs
+                )
+            except ExecutorSaturatedError:
+                logger.warning("Provider executor saturated, rejecting %s", address)
+                for future in futures.values():
+                    future.cancel()
+                # Probe calls that will not run give their probe back
+                for probe_provider, probe in probes.items():
+                    future = futures.get(probe_provider)
+                    if future is None or future.cancelled():
+                        circuit_breaker.release_probe(probe_provider, probe)
+                raise
+            services[provider_name] = service
+            provider_latency.record_call(provider_name)
 
-                    # Submit to thread pool
-                    logger.info(f"Submitting request to {provider_name}")
-                    futures[provider_name] = executor.submit(
-                        service.get_property_details, address
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Error initializing service for {provider_name}: {str(e)}"
-                    )
-                    results[provider_name] = {
+        return self._collect_provider_data(
+            address, results, futures, services, executor, deadline, priority, probes
+        )
+
+    def _collect_provider_data(
+        self,
+        address,
+        results,
+        futures,
+        services,
+        executor,
+        deadline,
+        priority=INTERACTIVE,
+        probes=(),
+    ):
+        """
+        Yield provider results as their calls complete, each provider bounded
+        by its own timeout and all of them by the request deadline. Interactive
+        calls slower than usual are hedged; hedges spend quota, so other calls
+        are not, and neither are the probes of half-open circuits, which must
+        be the only call to their provider.
+
+        Args:
+            address (str): Property address
+            results (dict): Results already known, keyed by provider name
+            futures (dict): Futures of the submitted calls keyed by provider name
+            services (dict): Services the calls were made with
+            executor (ProviderExecutor): Executor the calls were submitted to
+            deadline (Deadline): Request deadline
+            priority (str): Rate limiting priority of the calls
+            probes (iterable): Providers whose call is a circuit probe
+
+        Yields:
+            tuple: ``(provider_name, result)``
+        """
+        yield from results.items()
+
+        started = time.monotonic()
+        expires_at = {}
+        hedge_at = {}
+        for provider_name in futures:
+            expires_at[provider_name] = min(
+                started + provider_latency.timeout(provider_name), deadline.expires_at
+            )
+            hedge_delay = (
+                provider_latency.hedge_delay(provider_name)
+                if priority == INTERACTIVE and provider_name not in probes
+                else None
+            )
+            if hedge_delay is not None and started + hedge_delay < expires_at[provider_name]:
+                hedge_at[provider_name] = started + hedge_delay
+        providers = {future: provider_name for provider_name, future in futures.items()}
+        calls = {provider_name: [future] for provider_name, future in futures.items()}
+        pending = set(futures.values())
+        finished = set()
+        try:
+            while pending:
+                waiting = {providers[future] for future in pending}
+                next_event = min(
+                    [expires_at[provider_name] for provider_name in waiting]
+                    + [hedge_at[provider_name] for provider_name in waiting & hedge_at.keys()]
+                )
+                done, pending = concurrent.futures.wait(
+                    pending,
+                    timeout=max(next_event - time.monotonic(), 0),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                for future in done:
+                    provider_name = providers[future]
+                    if provider_name in finished:
+                        continue  # The other call of a hedged pair answered first
+                    finished.add(provider_name)
+                    for sibling in calls[provider_name]:
+                        if sibling is not future:
+                            sibling.cancel()
+                            pending.discard(sibling)
+                    try:
+                        result = future.result()
+                        request_log.record_provider(
+                            provider_name, "hedged" if future is not futures[provider_name] else "ok"
+                        )
+                    except Exception as e:
+                        logger.error("Error fetching data from %s: %s", provider_name, e)
+                        result = {
+                            "error": f"Error fetching data from {provider_name}: {str(e)}"
+                        }
+                        request_log.record_provider(provider_name, "error")
+                    yield provider_name, result
+
+                now = time.monotonic()
+                for provider_name in {providers[future] for future in pending}:
+                    if expires_at[provider_name] <= now:
+                        logger.warning("Timeout while fetching data from %s", provider_name)
+                        for call in calls[provider_name]:
+                            call.cancel()
+                            pending.discard(call)
+                        finished.add(provider_name)
+                        yield provider_name, self._timeout_result(provider_name)
+                    elif provider_name in hedge_at and hedge_at[provider_name] <= now:
+                        # Past its usual latency, race a second call against it
+                        del hedge_at[provider_name]
+                        hedge = self._submit_hedge(
+                            executor, provider_name, services[provider_name], address
+                        )
+                        if hedge is not None:
+                            providers[hedge] = provider_name
+                            calls[provider_name].append(hedge)
+                            pending.add(hedge)
+        finally:
+            # The caller may stop early, e.g. when a streaming client goes away
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _submit_hedge(executor, provider_name, service, address):
+        """
+        Send a duplicate of a slow provider call, if the provider's hedge
+        budget and the executor allow it.
+
+        Args:
+            executor (ProviderExecutor): Shared provider executor
+            provider_name (str): Provider name
+            service: Provider service instance
+            address (str): Property address
+
+        Returns:
+            concurrent.futures.Future: Future of the hedged call, or None
+        """
+        if not provider_latency.try_hedge(provider_name):
+            return None
+        try:
+            return executor.submit(
+                provider_name, service.get_property_details, address, priority=INTERACTIVE
+            )
+        except ExecutorSaturatedError:
+            logger.debug("No capacity to hedge %s for %s", provider_name, address)
+            return None
+
+    def _fetch_and_cache_many(
+        self, addresses, cached_entries, deadline, priority=BATCH, max_concurrency=None
+    ):
+        """
+        Fetch, standardize and cache the results of many addresses, writing
+        every cache entry in a single pipelined round-trip.
+
+        Args:
+            addresses (list): Property addresses, each with a distinct cache key
+            cached_entries (dict): ``(data, is_stale)`` tuples keyed by
+                ``(address, provider)`` already read from the cache
+            deadline (Deadline): Deadline of the whole batch
+            priority (str): Rate limiting priority of the provider calls
+            max_concurrency (int, optional): Provider calls in flight at once,
+                BATCH_MAX_CONCURRENCY when omitted
+
+        Returns:
+            tuple: Standardized property data and raw provider results, both
+                keyed by address
+        """
+        fetched = self._fetch_provider_data_many(
+            addresses, cached_entries, deadline, priority, max_concurrency
+        )
+        standardized = {}
+        cache_writes = {}
+        responses = {}
+        for address in addresses:
+            standardized_data, validated = self._standardize_provider_results(
+                fetched[address]
+            )
+            writes, bodies = self._result_writes(
+                address, fetched[address], standardized_data, validated
+            )
+            cache_writes.update(writes)
+            responses.update(bodies)
+            standardized[address] = standardized_data
+
+        self.cache_service.set_many(cache_writes, responses=responses)
+        return standardized, fetched
+
+    def _fetch_provider_data_many(
+        self, addresses, cached_entries=None, deadline=None, priority=BATCH, max_concurrency=None
+    ):
+        """
+        Fetch property data for many addresses from all providers, sharing a
+        single bounded pool of worker threads across the whole batch.
+
+        Calls that have not completed, or not even started, by the request
+        deadline are reported as timeouts.
+
+        Args:
+            addresses (list): Property addresses
+            cached_entries (dict, optional): ``(data, is_stale)`` tuples keyed
+                by ``(address, provider)`` already read from the cache
+            deadline (Deadline, optional): Request deadline, a default one is
+                started when omitted
+            priority (str): Rate limiting priority of the provider calls
+            max_concurrency (int, optional): Calls of this batch in flight at
+                once, BATCH_MAX_CONCURRENCY when omitted
+
+        Returns:
+            dict: Results from all providers keyed by address
+        """
+        results = {address: {} for address in addresses}
+        if not addresses:
+            return results
+        if deadline is None:
+            deadline = request_deadline()
+        if max_concurrency is None:
+            max_concurrency = getattr(settings, "BATCH_MAX_CONCURRENCY", 32)
+
+        # Check provider-specific cache for the whole batch at once
+        if cached_entries is None:
+            cached_entries = self.cache_service.get_many_with_staleness(
+                (address, provider_name)
+                for provider_name in PROVIDER_CONFIGS
+                for address in addresses
+            )
+        cached_data = {
+            (address, provider_name): data
+            for (address, provider_name), (data, is_stale) in cached_entries.items()
+            if provider_name is not None and address in results and not is_stale
+        }
+        for (address, provider_name), data in cached_data.items():
+            data["cached"] = True  # Mark as coming from the cache
+            results[address][provider_name] = data
+
+        pending_by_provider = {
+            provider_name: [
+                address
+                for address in addresses
+                if (address, provider_name) not in cached_data
+            ]
+            for provider_name in PROVIDER_CONFIGS
+        }
+        circuit_states, probes = circuit_breaker.admit_many(
+            provider_name
+            for provider_name, pending in pending_by_provider.items()
+            if pending
+        )
+
+        queues = {}
+        for provider_name, pending in pending_by_provider.items():
+            if not pending:
+                continue
+
+            # Open circuits fail fast, a half-open one gets a single probe call
+            state = circuit_states[provider_name]
+            if state == circuits.OPEN:
+                admitted = []
+            elif state == circuits.HALF_OPEN:
+                admitted = pending[:1]
+            else:
+                admitted = pending
+            for address in pending[len(admitted):]:
+                results[address][provider_name] = self._circuit_open_result(
+                    provider_name
+                )
+            pending = admitted
+            if not pending:
+                continue
+
+            try:
+                service = provider_clients.get_service(provider_name)
+            except Exception as e:
+                logger.error(
+                    "Error initializing service for %s: %s", provider_name, e
+                )
+                for address in pending:
+                    results[address][provider_name] = {
                         "error": f"Service initialization error: {str(e)}"
                     }
+                continue
 
-            # Collect results with timeout
-            for provider_name, future in futures.items():
-                timeout = PROVIDER_CONFIGS[provider_name].get("timeout", 30)
-                logger.info(
-                    f"Waiting for response from {provider_name} (timeout: {timeout}s)"
-                )
+            queues[provider_name] = collections.deque(
+                (address, service) for address in pending
+            )
+
+        # Keep at most max_concurrency calls of this batch in the shared executor,
+        # within the batch share of each provider's cap, and collect results as
+        # they complete, until the request deadline.
+        executor = get_provider_executor()
+        in_flight = {}
+        expired = []
 
+        def collect(done):
+            for future in done:
+                address, provider_name = in_flight.pop(future)
                 try:
-                    provider_result = future.result(timeout=timeout)
-                    logger.info(f"Received response from {provider_name}")
-                    logger.debug(
-                        f"Raw response from {provider_name}: {json.dumps(provider_result, indent=2)}"
-                    )
-                    results[provider_name] = provider_result
-                except concurrent.futures.TimeoutError:
-                    logger.warning(f"Timeout while fetching data from {provider_name}")
-                    results[provider_name] = {
-                        "error": f"Timeout fetching data from {provider_name}"
-                    }
+                    results[address][provider_name] = future.result()
                 except Exception as e:
-                    logger.error(f"Error fetching data from {provider_name}: {str(e)}")
-                    results[provider_name] = {
+                    logger.error("Error fetching data from %s: %s", provider_name, e)
+                    results[address][provider_name] = {
                         "error": f"Error fetching data from {provider_name}: {str(e)}"
                     }
 
-        logger.info(f"Completed data fetch from all providers for address: {address}")
+        try:
+            while queues and not deadline.expired():
+                # One call per provider at a time, so a provider at its limit does
+                # not hold back the others
+                submitted = False
+                saturated = None
+                for provider_name, queue in list(queues.items()):
+                    if len(in_flight) >= max_concurrency:
+                        break
+                    address, service = queue[0]
+                    # A half-open circuit's single call carries its probe token
+                    kwargs = {"priority": priority}
+                    if provider_name in probes:
+                        kwargs["probe"] = probes[provider_name]
+                    try:
+                        future = executor.submit_batch(
+                            provider_name, service.get_property_details, address, **kwargs
+                        )
+                    except ExecutorSaturatedError as e:
+                        saturated = e
+                        continue
+                    queue.popleft()
+                    if not queue:
+                        del queues[provider_name]
+                    in_flight[future] = (address, provider_name)
+                    submitted = True
+                if submitted:
+                    continue
+                # Other requests hold every slot, give up instead of waiting
+                if not in_flight:
+                    raise saturated
+                done, _ = concurrent.futures.wait(
+                    in_flight,
+                    timeout=deadline.remaining(),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                collect(done)
+        finally:
+            # Probe calls that were never sent give their probe back
+            for provider_name in queues.keys() & probes.keys():
+                circuit_breaker.release_probe(provider_name, probes[provider_name])
+
+        for provider_name, queue in queues.items():
+            expired.extend((address, provider_name, None) for address, _ in queue)
+
+        done, _ = concurrent.futures.wait(in_flight, timeout=deadline.remaining())
+        collect(done)
+
+        # Whatever is still running or was never started missed the deadline
+        for future, (address, provider_name) in in_flight.items():
+            future.cancel()
+            expired.append((address, provider_name, None))
+        for address, provider_name, _ in expired:
+            results[address][provider_name] = self._timeout_result(provider_name)
+        if expired:
+            logger.warning(
+                "Batch deadline reached with %s provider calls outstanding", len(expired)
+            )
+
+        # Keep provider results in configuration order, as the single lookup does
+        for address, provider_results in results.items():
+            results[address] = {
+                provider_name: provider_results[provider_name]
+                for provider_name in PROVIDER_CONFIGS
+                if provider_name in provider_results
+            }
+
         return results
+
+
+class PropertyDetailsView(PropertyLookupMixin, APIView):
+    """
+    API view for retrieving property details from multiple providers.
+
+    Clients asking for ``application/x-ndjson`` or ``text/event-stream``
+    (or ``?format=ndjson`` / ``?format=sse``) get each provider's record as
+    soon as it is ready, followed by a summary event.
+    """
+
+    renderer_classes = [
+        *api_settings.DEFAULT_RENDERER_CLASSES,
+        NDJSONRenderer,
+        EventStreamRenderer,
+    ]
+
+    @logged_request("property_details")
+    def get(self, request):
+        """
+        GET method to retrieve property details.
+
+        Args:
+            request: HTTP request object
+
+        Returns:
+            Response: REST framework response with property data
+        """
+        # Validate address parameter
+        address = request.query_params.get("address")
+        if not address or len(address.strip()) == 0:
+            return Response(
+                {"error": "Missing or empty address parameter"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        error = self._address_error(address)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        deadline, error = self._deadline_or_error(request.query_params)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        request_log.record(address=address)
+
+        renderer = getattr(request, "accepted_renderer", None)
+        if isinstance(renderer, StreamRenderer):
+            return self._stream_response(address, deadline, renderer)
+
+        # Fresh hits are served as the response body stored by the fetch.
+        # Check cache first (-> Reminder: Only 24h cache). The response body,
+        # the combined entry and every provider entry are read in a single
+        # round-trip.
+        body, cached_entries = self.cache_service.get_response_with_staleness(
+            address, self._cache_lookups(address)
+        )
+        if body is not None:
+            request_log.record(cache="response")
+            return HttpResponse(body, content_type="application/json")
+
+        cached_results, stale = self._resolve_cached_results(address, cached_entries)
+        if cached_results:
+            request_log.record(cache="stale" if stale else "hit")
+            if request_log.dump_payloads(logger):
+                logger.debug("Cached data content: %s", request_log.payload(cached_results))
+
+            # Mark data as coming from the cache
+            self._mark_cached(cached_results, stale)
+
+            # Serve stale data right away and refresh it in the background
+            if stale:
+                self._schedule_refresh(address)
+
+            # Serialize cache data
+            return Response(
+                property_details_serializer.to_representation_many(cached_results)
+            )
+
+        # Fetch data from providers
+        request_log.record(cache="miss")
+        try:
+            standardized_data = self._fetch_coalesced(
+                address, self._fresh_provider_entries(cached_entries), deadline
+            )
+        except ExecutorSaturatedError as e:
+            return self._saturated_response(e)
+
+        # Serialize the final response
+        return Response(
+            property_details_serializer.to_representation_many(standardized_data)
+        )
+
+    def _stream_response(self, address, deadline, renderer):
+        """
+        Stream the records of an address as they become available.
+
+        Cached records are sent at once. On a miss each provider's record is
+        sent as soon as its call completes, so the fetch is not coalesced with
+        concurrent lookups of the address; its results are cached once every
+        provider has answered.
+
+        Args:
+            address (str): Property address
+            deadline (Deadline): Request deadline
+            renderer (StreamRenderer): Negotiated stream format
+
+        Returns:
+            HttpResponse: Streaming response, or 503 when the provider
+                executor is full
+        """
+        started = time.perf_counter()
+        cached_entries = self.cache_service.get_many_with_staleness(
+            self._cache_lookups(address)
+        )
+        cached_results, stale = self._resolve_cached_results(address, cached_entries)
+        if cached_results:
+            cache = "stale" if stale else "hit"
+            self._mark_cached(cached_results, stale)
+            if stale:
+                self._schedule_refresh(address)
+            events = self._cached_events(address, cached_results, cache, started)
+        else:
+            cache = "miss"
+            try:
+                provider_data = self._iter_provider_data(
+                    address, self._fresh_provider_entries(cached_entries), deadline
+                )
+            except ExecutorSaturatedError as e:
+                return self._saturated_response(e)
+            events = self._fetched_events(address, provider_data, started)
+        request_log.record(cache=cache, stream=renderer.format)
+
+        response = StreamingHttpResponse(
+            (renderer.frame(event, data) for event, data in events),
+            content_type=renderer.media_type,
+        )
+        response["Cache-Control"] = "no-cache"
+        # Keep reverse proxies from buffering the stream
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    @staticmethod
+    def _result_event(record):
+        return "result", {
+            "provider": record.get("provider"),
+            "data": property_details_serializer.to_representation(record),
+        }
+
+    @staticmethod
+    def _summary_event(address, records, cache, started, complete=True):
+        return "summary", {
+            "address": address,
+            "cache": cache,
+            "providers": [record.get("provider") for record in records],
+            "errors": [record.get("provider") for record in records if "error" in record],
+            "complete": complete,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    def _cached_events(self, address, cached_results, cache, started):
+        """
+        Events of a cache hit: every cached record, then the summary.
+
+        Yields:
+            tuple: Event type and payload
+        """
+        for record in cached_results:
+            yield self._result_event(record)
+        yield self._summary_event(address, cached_results, cache, started)
+
+    def _fetched_events(self, address, provider_data, started):
+        """
+        Events of a miss: each provider's standardized and validated record
+        as it arrives, then the summary once the results are cached.
+
+        Args:
+            address (str): Property address
+            provider_data (iterator): ``(provider_name, result)`` pairs from
+                ``_iter_provider_data``
+            started (float): ``time.perf_counter()`` at the start of the request
+
+        Yields:
+            tuple: Event type and payload
+        """
+        results = {}
+        records = {}
+        validated = {}
+        for provider_name, result in provider_data:
+            results[provider_name] = result
+            standardized, provider_validated = self._standardize_provider_results(
+                {provider_name: result}
+            )
+            validated.update(provider_validated)
+            for record in standardized:
+                records[provider_name] = record
+                yield self._result_event(record)
+
+        # Cache the results in configuration order, as a regular fetch would
+        standardized_data = [
+            records[provider_name]
+            for provider_name in PROVIDER_CONFIGS
+            if provider_name in records
+        ]
+        writes, responses = self._result_writes(
+            address, results, standardized_data, validated
+        )
+        self.cache_service.set_many(writes, responses=responses)
+        yield self._summary_event(
+            address, standardized_data, "miss", started, complete=bool(responses)
+        )
+
+    def _fetch_coalesced(self, address, cached_entries, deadline):
+        """
+        Fetch an address from the providers once for all concurrent lookups.
+
+        Inside the process, followers wait for the leader's result. Across
+        workers, a short-lived Redis lock lets followers wait for the leader's
+        cache write instead of calling the providers again. Followers never
+        wait past their own deadline, and report the providers the leader
+        has not answered for by then as timeouts.
+
+        Args:
+            address (str): Property address
+            cached_entries (dict): Provider-specific cache entries keyed by
+                provider name
+            deadline (Deadline): Request deadline
+
+        Returns:
+            list: Standardized property data, one entry per provider
+        """
+        if not getattr(settings, "SINGLE_FLIGHT_ENABLED", True):
+            return self._fetch_and_cache(address, cached_entries, deadline)
+
+        return provider_fetches.do(
+            self.cache_service.get_cache_key(address),
+            lambda: self._fetch_with_lock(address, cached_entries, deadline),
+            timeout=deadline.cap(getattr(settings, "SINGLE_FLIGHT_WAIT_TIMEOUT", 35)),
+            on_timeout=lambda: self._timeout_results(cached_entries),
+        )
+
+    def _fetch_with_lock(self, address, cached_entries, deadline):
+        """
+        Fetch an address unless another worker already is, in which case wait
+        for its results to be cached.
+
+        Args:
+            address (str): Property address
+            cached_entries (dict): Provider-specific cache entries keyed by
+                provider name
+            deadline (Deadline): Request deadline
+
+        Returns:
+            list: Standardized property data, one entry per provider
+        """
+        lock_token = self.cache_service.acquire_lock(
+            address, getattr(settings, "SINGLE_FLIGHT_LOCK_TTL", 35)
+        )
+        if lock_token is None:
+            logger.debug("Another worker is fetching %s, waiting for it", address)
+            cached_results = None
+            if self.cache_service.wait_for(
+                address,
+                timeout=deadline.cap(getattr(settings, "SINGLE_FLIGHT_WAIT_TIMEOUT", 35)),
+                poll_interval=getattr(settings, "SINGLE_FLIGHT_POLL_INTERVAL", 0.05),
+            ):
+                cached_results, _ = self._resolve_cached_results(
+                    address,
+                    self.cache_service.get_many_with_staleness(
+                        self._cache_lookups(address)
+                    ),
+                )
+            if cached_results:
+                self._mark_cached(cached_results)
+                return cached_results
+            logger.warning("No results cached by the other worker for %s", address)
+            if deadline.expired():
+                return self._timeout_results(cached_entries)
+
+        try:
+            return self._fetch_and_cache(address, cached_entries, deadline)
+        finally:
+            if lock_token is not None:
+                self.cache_service.release_lock(address, lock_token)
+
+
+class PropertyBatchView(PropertyLookupMixin, APIView):
+    """
+    API view for retrieving property details for many addresses in one call.
+    """
+
+    @logged_request("property_batch")
+    def post(self, request):
+        """
+        POST method to retrieve property details for a list of addresses.
+
+        Expects a JSON body of the form ``{"addresses": ["...", "..."]}``.
+
+        Args:
+            request: HTTP request object
+
+        Returns:
+            Response: REST framework response with one entry per address
+        """
+        if not isinstance(request.data, dict):
+            return Response(
+                {"error": "Request body must be a JSON object"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        addresses = request.data.get("addresses")
+        max_addresses = getattr(settings, "BATCH_MAX_ADDRESSES", 1000)
+
+        if not isinstance(addresses, list) or len(addresses) == 0:
+            return Response(
+                {"error": "Missing or empty addresses parameter"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(addresses) > max_addresses:
+            return Response(
+                {"error": f"Too many addresses, maximum is {max_addresses}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if any(
+            not isinstance(address, str) or len(address.strip()) == 0
+            for address in addresses
+        ):
+            return Response(
+                {"error": "Addresses must be non-empty strings"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        for address in addresses:
+            error = self._address_error(address)
+            if error:
+                return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Batches make many provider calls under the providers' rate limits
+        deadline, error = self._deadline_or_error(
+            request.query_params,
+            getattr(settings, "BATCH_DEADLINE", 120),
+            getattr(settings, "BATCH_DEADLINE_MAX", 600),
+        )
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        request_log.record(addresses=len(addresses))
+
+        # Addresses sharing a cache key are only looked up once
+        unique_addresses = {}
+        for address in addresses:
+            unique_addresses.setdefault(
+                self.cache_service.get_cache_key(address), address
+            )
+        lookups = list(unique_addresses.values())
+
+        # Check cache for the whole batch in a single round-trip
+        cached_entries = self.cache_service.get_many_with_staleness(
+            entry for address in lookups for entry in self._cache_lookups(address)
+        )
+        resolved = {}
+        for address in lookups:
+            data, stale = self._resolve_cached_results(address, cached_entries)
+            if data is None:
+                continue
+            self._mark_cached(data, stale)
+            if stale:
+                self._schedule_refresh(address)
+            resolved[address] = data
+
+        misses = [address for address in lookups if address not in resolved]
+        request_log.record(hits=len(resolved), misses=len(misses))
+
+        # Fetch only the misses from providers
+        try:
+            fetched, _ = self._fetch_and_cache_many(misses, cached_entries, deadline)
+        except ExecutorSaturatedError as e:
+            return self._saturated_response(e)
+        resolved.update(fetched)
+
+        response_data = []
+        for address in addresses:
+            lookup = unique_addresses[self.cache_service.get_cache_key(address)]
+            response_data.append(
+                {
+                    "address": address,
+                    "results": property_details_serializer.to_representation_many(
+                        resolved[lookup]
+                    ),
+                }
+            )
+
+        return Response({"results": response_data})
+
+
+class AsyncPropertyDetailsView(PropertyLookupMixin, View):
+    """
+    Asynchronous API view for retrieving property details from multiple providers.
+
+    Provider calls and cache access run as coroutines, so a single ASGI worker
+    can keep many lookups in flight. Under WSGI Django still serves it, running
+    each request in its own event loop: the loop's HTTP clients and Redis pool
+    are then closed with the request, so connections are only kept alive
+    across requests under ASGI.
+    """
+
+    @logged_request("async_property_details")
+    async def get(self, request):
+        """
+        GET method to retrieve property details.
+
+        Args:
+            request: HTTP request object
+
+        Returns:
+            JsonResponse: JSON response with property data
+        """
+        # Validate address parameter
+        address = request.GET.get("address")
+        if not address or len(address.strip()) == 0:
+            return JsonResponse(
+                {"error": "Missing or empty address parameter"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        error = self._address_error(address)
+        if error:
+            return JsonResponse({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        deadline, error = self._deadline_or_error(request.GET)
+        if error:
+            return JsonResponse({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        request_log.record(address=address)
+
+        try:
+            # Fresh hits are served as the response body stored by the fetch.
+            # Check cache first (-> Reminder: Only 24h cache). The response
+            # body, the combined entry and every provider entry are read in a
+            # single round-trip.
+            body, cached_entries = (
+                await self.cache_service.aget_response_with_staleness(
+                    address, self._cache_lookups(address)
+                )
+            )
+            if body is not None:
+                request_log.record(cache="response")
+                return HttpResponse(body, content_type="application/json")
+
+            cached_results, stale = self._resolve_cached_results(
+                address, cached_entries
+            )
+            if cached_results:
+                request_log.record(cache="stale" if stale else "hit")
+
+                # Mark data as coming from the cache
+                self._mark_cached(cached_results, stale)
+
+                # Serve stale data right away and refresh it in the background
+                if stale:
+                    self._schedule_refresh(address)
+
+                # Serialize cache data
+                return JsonResponse(
+                    property_details_serializer.to_representation_many(
+                        cached_results
+                    ),
+                    safe=False,
+                )
+
+            # Fetch data from providers, once for concurrent lookups of the address
+            request_log.record(cache="miss")
+            standardized_data = await self._afetch_coalesced(
+                address, self._fresh_provider_entries(cached_entries), deadline
+            )
+
+            # Serialize the final response
+            return JsonResponse(
+                property_details_serializer.to_representation_many(
+                    standardized_data
+                ),
+                safe=False,
+            )
+        finally:
+            await self.cache_service.aclose()
+            if not isinstance(request, ASGIRequest):
+                await provider_clients.aclose_loop_clients()
+                await aclose_async_pool()
+
+    async def _afetch_coalesced(self, address, cached_entries, deadline):
+        """
+        Asynchronous version of ``PropertyDetailsView._fetch_coalesced``,
+        coalescing with the sync lookups of the same address.
+
+        Args:
+            address (str): Property address
+            cached_entries (dict): Provider-specific cache entries keyed by
+                provider name
+            deadline (Deadline): Request deadline
+
+        Returns:
+            list: Standardized property data, one entry per provider
+        """
+        if not getattr(settings, "SINGLE_FLIGHT_ENABLED", True):
+            return await self._afetch_and_cache(address, cached_entries, deadline)
+
+        return await provider_fetches.ado(
+            self.cache_service.get_cache_key(address),
+            lambda: self._afetch_with_lock(address, cached_entries, deadline),
+            timeout=deadline.cap(getattr(settings, "SINGLE_FLIGHT_WAIT_TIMEOUT", 35)),
+            on_timeout=lambda: self._timeout_results(cached_entries),
+        )
+
+    async def _afetch_with_lock(self, address, cached_entries, deadline):
+        """
+        Asynchronous version of ``PropertyDetailsView._fetch_with_lock``.
+
+        Args:
+            address (str): Property address
+            cached_entries (dict): Provider-specific cache entries keyed by
+                provider name
+            deadline (Deadline): Request deadline
+
+        Returns:
+            list: Standardized property data, one entry per provider
+        """
+        lock_token = await self.cache_service.aacquire_lock(
+            address, getattr(settings, "SINGLE_FLIGHT_LOCK_TTL", 35)
+        )
+        if lock_token is None:
+            logger.debug("Another worker is fetching %s, waiting for it", address)
+            cached_results = None
+            if await self.cache_service.await_for(
+                address,
+                timeout=deadline.cap(getattr(settings, "SINGLE_FLIGHT_WAIT_TIMEOUT", 35)),
+                poll_interval=getattr(settings, "SINGLE_FLIGHT_POLL_INTERVAL", 0.05),
+            ):
+                cached_results, _ = self._resolve_cached_results(
+                    address,
+                    await self.cache_service.aget_many_with_staleness(
+                        self._cache_lookups(address)
+                    ),
+                )
+            if cached_results:
+                self._mark_cached(cached_results)
+                return cached_results
+            logger.warning("No results cached by the other worker for %s", address)
+            if deadline.expired():
+                return self._timeout_results(cached_entries)
+
+        try:
+            return await self._afetch_and_cache(address, cached_entries, deadline)
+        finally:
+            if lock_token is not None:
+                await self.cache_service.arelease_lock(address, lock_token)
+
+    async def _afetch_and_cache(self, address, cached_entries, deadline=None):
+        """
+        Asynchronous version of ``_fetch_and_cache``.
+
+        Args:
+            address (str): Property address
+            cached_entries (dict): Provider-specific cache entries keyed by
+                provider name
+            deadline (Deadline, optional): Request deadline
+
+        Returns:
+            list: Standardized property data, one entry per provider
+        """
+        results = await self._afetch_provider_data(address, cached_entries, deadline)
+
+        # Process results
+        standardized_data, validated = self._standardize_provider_results(results)
+
+        # Cache individual provider results and the combined results together
+        writes, responses = self._result_writes(
+            address, results, standardized_data, validated
+        )
+        await self.cache_service.aset_many(writes, responses=responses)
+        return standardized_data
+
+    async def _afetch_provider_data(self, address, cached_entries, deadline=None):
+        """
+        Fetch property data from all providers concurrently as coroutines.
+
+        Args:
+            address (str): Property address
+            cached_entries (dict): Provider-specific cache entries keyed by
+                provider name
+            deadline (Deadline, optional): Request deadline, a default one is
+                started when omitted
+
+        Returns:
+            dict: Results from all providers
+        """
+        if deadline is None:
+            deadline = request_deadline()
+        provider_names = list(PROVIDER_CONFIGS)
+        circuit_states, probes = await circuit_breaker.aadmit_many(
+            provider_name
+            for provider_name in provider_names
+            if not cached_entries.get(provider_name)
+        )
+        called = [
+            provider_name
+            for provider_name in provider_names
+            if circuit_states.get(provider_name) != circuits.OPEN
+        ]
+        results = await asyncio.gather(
+            *(
+                self._afetch_single_provider(
+                    address,
+                    provider_name,
+                    cached_entries.get(provider_name),
+                    deadline,
+                    probes.get(provider_name),
+                )
+                for provider_name in called
+            )
+        )
+
+        results = dict(zip(called, results))
+        return {
+            provider_name: results[provider_name]
+            if provider_name in results
+            else self._circuit_open_result(provider_name)
+            for provider_name in provider_names
+        }
+
+    async def _afetch_single_provider(
+        self, address, provider_name, cached_data=None, deadline=None, probe=None
+    ):
+        """
+        Fetch property data from a single provider, honouring its cache, its
+        timeout and the request deadline.
+
+        Args:
+            address (str): Property address
+            provider_name (str): Provider name
+            cached_data (dict, optional): Provider-specific cache entry
+            deadline (Deadline, optional): Request deadline
+            probe (str, optional): Probe token of the provider's half-open circuit
+
+        Returns:
+            dict: Provider result, cached entry or error entry
+        """
+        # Use provider-specific cache
+        if cached_data:
+            cached_data["cached"] = True  # Mark as coming from the cache
+            request_log.record_provider(provider_name, "cached")
+            return cached_data
+
+        try:
+            service = provider_clients.get_service(provider_name)
+        except Exception as e:
+            logger.error("Error initializing service for %s: %s", provider_name, e)
+            request_log.record_provider(provider_name, "error")
+            return {"error": f"Service initialization error: {str(e)}"}
+
+        timeout = provider_latency.timeout(provider_name)
+        if deadline is not None:
+            timeout = deadline.cap(timeout)
+        try:
+            provider_result, hedged = await asyncio.wait_for(
+                self._ahedged_call(provider_name, service, address, probe), timeout=timeout
+            )
+            request_log.record_provider(provider_name, "hedged" if hedged else "ok")
+            return provider_result
+        except asyncio.TimeoutError:
+            logger.warning("Timeout while fetching data from %s", provider_name)
+            return self._timeout_result(provider_name)
+        except Exception as e:
+            logger.error("Error fetching data from %s: %s", provider_name, e)
+            request_log.record_provider(provider_name, "error")
+            return {"error": f"Error fetching data from {provider_name}: {str(e)}"}
+
+    @staticmethod
+    async def _ahedged_call(provider_name, service, address, probe=None):
+        """
+        Call a provider, racing a second call against the first one once it
+        is slower than the provider's usual latency and the hedge budget
+        allows it. The probe of a half-open circuit is never hedged.
+
+        Args:
+            provider_name (str): Provider name
+            service: Provider service instance
+            address (str): Property address
+            probe (str, optional): Probe token of the provider's half-open circuit
+
+        Returns:
+            tuple: Result of the first call to answer, and whether it was the hedge
+        """
+        if probe is not None:
+            primary = asyncio.ensure_future(
+                service.aget_property_details(address, probe=probe)
+            )
+        else:
+            primary = asyncio.ensure_future(service.aget_property_details(address))
+        provider_latency.record_call(provider_name)
+        calls = {primary}
+        try:
+            hedge_delay = provider_latency.hedge_delay(provider_name)
+            if hedge_delay is not None and probe is None:
+                done, _ = await asyncio.wait(calls, timeout=hedge_delay)
+                if not done and provider_latency.try_hedge(provider_name):
+                    calls.add(
+                        asyncio.ensure_future(service.aget_property_details(address))
+                    )
+            done, _ = await asyncio.wait(calls, return_when=asyncio.FIRST_COMPLETED)
+            winner = primary if primary in done else done.pop()
+            return winner.result(), winner is not primary
+        finally:
+            for call in calls:
+                call.cancel()
+
+
+class MetricsView(View):
+    """
+    Prometheus metrics of the property lookups, aggregated over every worker
+    in multi-process mode. Not found when metrics are disabled.
+    """
+
+    def get(self, request):
+        rendered = metrics.render()
+        if rendered is None:
+            return HttpResponse("Metrics are disabled", status=404, content_type="text/plain")
+        body, content_type = rendered
+        return HttpResponse(body, content_type=content_type)